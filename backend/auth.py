@@ -1,32 +1,41 @@
 # backend/auth.py
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import Depends, HTTPException, status, Request
+from typing import Optional, Tuple
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from database import get_db, User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal, User
+from passwords import password_hasher
+import hmac
 import os
+import time
+import uuid
 
 # Security Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-super-secure-jwt-secret-key-change-this-in-production-2024")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Doğrulanmış principal'lar bu süre boyunca users tablosuna gitmeden kabul edilir;
+# token_version artışı diğer worker'lara en geç bu süre sonunda yansır (0 = her istekte DB)
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+# Prometheus scraper'ı için sabit bearer token; boşsa /metrics yalnızca admin token'ı ile okunur
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 
 # JWT Bearer scheme
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# bcrypt event loop'u bloklamasın diye password_hasher'ın thread pool'unda çalışır
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    valid, _ = await password_hasher.verify(plain_password, hashed_password)
+    return valid
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -37,39 +46,121 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
+    # jose / cryptography ilk token işleminde yüklenir (cold start)
+    from jose import jwt
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token and return payload"""
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         return None
 
-def get_user_by_username(db: Session, username: str) -> Optional[User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
     """Get user by username"""
-    return db.query(User).filter(User.username == username).first()
+    return await db.scalar(select(User).where(User.username == username))
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Get user by email"""
-    return db.query(User).filter(User.email == email).first()
+    return await db.scalar(select(User).where(User.email == email))
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """Authenticate user with username/password"""
-    user = get_user_by_username(db, username)
+    user = await get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = await password_hasher.verify(password, user.hashed_password)
+    if not valid:
         return None
+    if new_hash:
+        # BCRYPT_ROUNDS değiştiyse hash başarılı girişte yeni maliyetle yenilenir
+        user.hashed_password = new_hash
+        await db.commit()
     return user
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user as carried by the token claims"""
+    id: int
+    username: str
+    email: str
+    is_admin: bool
+    token_version: int
+
+def create_user_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
+    """Access token with the claims needed to authorize without a users lookup"""
+    return create_access_token(
+        data={
+            "sub": user.username,
+            "uid": user.id,
+            "email": user.email,
+            "adm": bool(user.is_admin),
+            "ver": user.token_version or 0,
+            "jti": uuid.uuid4().hex,
+        },
+        expires_delta=expires_delta
+    )
+
+class PrincipalCache:
+    """Bounded TTL cache of verified principals keyed by token id (jti)"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Principal, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, jti: str) -> Optional[Principal]:
+        entry = self._entries.get(jti)
+        if entry is None or entry[1] <= time.monotonic():
+            self._entries.pop(jti, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, jti: str, principal: Principal):
+        if self.ttl_seconds <= 0:
+            return
+        self._entries.pop(jti, None)
+        self._entries[jti] = (principal, time.monotonic() + self.ttl_seconds)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def forget_user(self, user_id: int):
+        for jti in [jti for jti, (principal, _) in self._entries.items() if principal.id == user_id]:
+            del self._entries[jti]
+
+    def render_metrics(self) -> str:
+        return "\n".join([
+            "# TYPE portfolio_auth_principal_cache_hits_total counter",
+            f"portfolio_auth_principal_cache_hits_total {self.hits}",
+            "# TYPE portfolio_auth_principal_cache_misses_total counter",
+            f"portfolio_auth_principal_cache_misses_total {self.misses}",
+        ]) + "\n"
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL_SECONDS)
+
+async def revoke_user_tokens(db: AsyncSession, user_id: int):
+    """Invalidate every token issued to the user so far (token_version bump)"""
+    user = await db.get(User, user_id)
+    user.token_version = (user.token_version or 0) + 1
+    await db.commit()
+    principal_cache.forget_user(user_id)
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """Get current authenticated user from the token claims
+
+    users tablosuna yalnızca principal cache'te olmayan token için gidilir
+    (token_version ve is_active kontrolü).
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -83,17 +174,31 @@ def get_current_user(
     if payload is None:
         raise credentials_exception
     
-    username: str = payload.get("sub")
-    if username is None:
+    # Claim'siz (eski formatlı) token'lar kabul edilmez; yeniden giriş gerekir
+    jti, user_id, version = payload.get("jti"), payload.get("uid"), payload.get("ver")
+    if jti is None or user_id is None or version is None:
         raise credentials_exception
     
-    user = get_user_by_username(db, username=username)
-    if user is None:
+    principal = principal_cache.get(jti)
+    if principal is not None:
+        return principal
+    
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, user_id)
+    if user is None or not user.is_active or (user.token_version or 0) != version:
         raise credentials_exception
     
-    return user
+    principal = Principal(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_admin=bool(user.is_admin),
+        token_version=version
+    )
+    principal_cache.set(jti, principal)
+    return principal
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_admin_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """Get current admin user (requires admin privileges)"""
     if not current_user.is_admin:
         raise HTTPException(
@@ -102,32 +207,10 @@ def get_current_admin_user(current_user: User = Depends(get_current_user)) -> Us
         )
     return current_user
 
-# Rate limiting helper (basit implementasyon)
-request_counts = {}
-
-def rate_limit_check(request: Request, max_requests: int = 100, window_minutes: int = 15):
-    """Simple rate limiting check"""
-    client_ip = request.client.host
-    current_time = datetime.utcnow()
-    
-    # Clean old entries
-    cutoff_time = current_time - timedelta(minutes=window_minutes)
-    for ip in list(request_counts.keys()):
-        request_counts[ip] = [
-            timestamp for timestamp in request_counts[ip] 
-            if timestamp > cutoff_time
-        ]
-        if not request_counts[ip]:
-            del request_counts[ip]
-    
-    # Check current IP
-    if client_ip not in request_counts:
-        request_counts[client_ip] = []
-    
-    if len(request_counts[client_ip]) >= max_requests:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many requests"
-        )
-    
-    request_counts[client_ip].append(current_time)
+async def get_metrics_reader(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Optional[Principal]:
+    """Allow the METRICS_TOKEN bearer (scrapers) or an admin access token"""
+    if METRICS_TOKEN and hmac.compare_digest(credentials.credentials.encode(), METRICS_TOKEN.encode()):
+        return None
+    return get_current_admin_user(await get_current_user(credentials))
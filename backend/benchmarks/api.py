@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tekrarlanabilir API yük testi: seed'lenmiş veritabanında tüm public ve admin endpoint'leri
+
+Veritabanı benchmarks.seed ile (sabit seed) doldurulur, uygulama hem in-process
+(httpx.ASGITransport, ağ ve uvicorn maliyeti yok) hem de uvicorn üzerinden sabit
+concurrency ile sürülür. Her senaryo için throughput ve p50/p95/p99 gecikme JSON
+olarak yazdırılır. Public GET'ler response_cache'ten döner; ölçülen şey ısınmış
+cache'tir, id / slug senaryoları ise kayıtlar arasında dolaşarak miss'leri de içerir.
+Yazma senaryoları (PUT yazı, iletişim formu) cache'i invalidate ettiği için en son çalışır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.api --posts 10000 --messages 100000 --requests 1000 --concurrency 10
+    python -m benchmarks.api --mode inprocess --output bench.json
+    python -m benchmarks.api --baseline bench.json --tolerance 0.2   # gerilemede çıkış kodu 1
+
+`--database-url` verilmezse geçici bir SQLite dosyası kullanılır; PostgreSQL için
+boş / atılabilir bir veritabanı verin (`--skip-seed` ile mevcut veri kullanılır).
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+def scenarios(posts, projects, requests: int):
+    """(name, method, path_for, json_for, requests) tuples; `posts` (id, slug) ve `projects` id listesi"""
+    post_id = lambda i: posts[i % len(posts)][0]
+    return [
+        ("health", "GET", lambda i: "/health", None, requests),
+        ("posts", "GET", lambda i: "/api/posts", None, requests),
+        ("posts_summary_page", "GET", lambda i: "/api/posts?fields=summary&limit=20", None, requests),
+        ("post_by_id", "GET", lambda i: f"/api/posts/{post_id(i)}", None, requests),
+        ("post_by_slug", "GET", lambda i: f"/api/posts/slug/{posts[i % len(posts)][1]}", None, requests),
+        ("projects", "GET", lambda i: "/api/projects", None, requests),
+        ("project_by_id", "GET", lambda i: f"/api/projects/{projects[i % len(projects)]}", None, requests),
+        ("tags", "GET", lambda i: "/api/tags", None, requests),
+        ("technologies", "GET", lambda i: "/api/technologies", None, requests),
+        ("search", "GET", lambda i: f"/api/search?q=python{i % 1000}", None, requests),
+        # Tüm tablo stream edilir; istek sayısı azaltılır
+        ("export_posts", "GET", lambda i: "/api/export/posts", None, max(1, requests // 50)),
+        ("admin_messages", "GET", lambda i: "/api/admin/messages?limit=50", None, requests),
+        ("admin_messages_unread", "GET", lambda i: "/api/admin/messages?is_read=false&limit=50", None, requests),
+        ("admin_messages_count", "GET", lambda i: "/api/admin/messages/count", None, requests),
+        ("admin_stats", "GET", lambda i: "/api/admin/stats", None, requests),
+        ("admin_me", "GET", lambda i: "/api/auth/me", None, requests),
+        ("admin_update_post", "PUT", lambda i: f"/api/admin/posts/{post_id(i)}", lambda i: {
+            "title": f"Post {post_id(i)} güncellendi",
+            "excerpt": "Benchmark güncellemesi",
+            "content": f"Benchmark içeriği {i}",
+            "category": "Backend",
+            "tags": ["python", "performans"],
+            "read_time": "5 dk",
+        }, requests),
+        # İçerik her istekte farklı: tekrar filtresine takılmaz
+        ("contact", "POST", lambda i: "/api/contact", lambda i: {
+            "name": "Benchmark",
+            "email": f"bench{i}@example.com",
+            "subject": f"Benchmark mesajı {i}",
+            "message": f"Yük testi mesajı numara {i}, lütfen yok sayın.",
+        }, requests),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="Default: temporary SQLite file")
+    parser.add_argument("--skip-seed", action="store_true", help="Use the data already in --database-url")
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--content-bytes", type=int, default=4000)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn", "both"), default="both")
+    parser.add_argument("--scenario", action="append", help="Run only the named scenario(s)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--baseline", help="Previous --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 / throughput regression ratio")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="portfolio-bench-")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+    # Limitler ölçümü bozmasın; spool ve rate limit durumu gerçek kurulumla karışmasın
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["CONTACT_SPOOL_DIR"] = os.path.join(work_dir, "contact-spool")
+    os.environ.setdefault("CONTACT_QUEUE_MAX", str(max(1000, args.requests * 2)))
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from sqlalchemy import select
+    from auth import create_user_token
+    from benchmarks.async_db import drive, serve_in_thread
+    from benchmarks.report import find_regressions, finish, load_baseline
+    from benchmarks.seed import seed
+    from database import SessionLocal, BlogPost, Project, User, async_engine, create_tables
+
+    create_tables()
+    seeded = None
+    if not args.skip_seed:
+        async def run_seed():
+            try:
+                return await seed(args.posts, args.projects, args.messages, args.content_bytes)
+            finally:
+                await async_engine.dispose()
+        seeded = asyncio.run(run_seed())
+    def dataset():
+        # PUT senaryosu slug'ları değiştirir; her mod güncel listeyle başlar
+        with SessionLocal() as db:
+            posts = db.execute(select(BlogPost.id, BlogPost.slug).order_by(BlogPost.id)).all()
+            projects = db.scalars(select(Project.id).order_by(Project.id)).all()
+        assert posts and projects, "Veritabanında yazı / proje yok (--skip-seed?)"
+        return posts, projects
+
+    import main as app_module
+    app = app_module.app
+
+    def admin_headers():
+        # Admin lifespan içinde oluşturulur
+        with SessionLocal() as db:
+            admin = db.scalar(select(User).where(User.username == "admin"))
+        return {"Authorization": f"Bearer {create_user_token(admin)}"}
+
+    async def run(base_url, transport=None):
+        results = {}
+        headers = admin_headers()
+        for name, method, path_for, json_for, total in scenarios(*dataset(), args.requests):
+            if args.scenario and name not in args.scenario:
+                continue
+            # Isınma: cache, bağlantı havuzu ve bytecode
+            await drive(base_url, path_for, min(50, total), args.concurrency, headers, method, json_for, transport)
+            # Isınmada kullanılan id'ler / içerikler tekrar edilmesin
+            shifted_path = lambda i, path_for=path_for: path_for(i + 50)
+            shifted_json = (lambda i, json_for=json_for: json_for(i + 50)) if json_for else None
+            results[name] = await drive(
+                base_url, shifted_path, total, args.concurrency, headers, method, shifted_json, transport
+            )
+        return results
+
+    async def run_inprocess():
+        import httpx
+        async with app.router.lifespan_context(app):
+            return await run("http://bench", httpx.ASGITransport(app=app))
+
+    results = {}
+    if args.mode in ("inprocess", "both"):
+        results["inprocess"] = asyncio.run(run_inprocess())
+    if args.mode in ("uvicorn", "both"):
+        server, thread, base_url = serve_in_thread(app)
+        try:
+            results["uvicorn"] = asyncio.run(run(base_url))
+        finally:
+            server.should_exit = True
+            thread.join()
+
+    report = {
+        "benchmark": "api",
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "dataset": {"posts": len(dataset()[0]), "projects": len(dataset()[1])},
+        "seed": seeded,
+        "results": results,
+    }
+    regressions = None
+    baseline = load_baseline(args.baseline)
+    if baseline is not None:
+        regressions = []
+        for mode, scenario_results in results.items():
+            regressions += [
+                f"{mode} {line}" for line in find_regressions(
+                    scenario_results, baseline["results"].get(mode, {}),
+                    {"p95_ms": "lower", "throughput_rps": "higher"}, args.tolerance
+                )
+            ]
+    finish(report, args.output, regressions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Sync Session vs AsyncSession yük testi (uvicorn üzerinden)
+
+Eski yol (async def handler içinde senkron Session) ile yeni AsyncSession yolunu
+aynı seed'lenmiş SQLite veritabanında, sabit concurrency altında karşılaştırır.
+PostgreSQL ağ gecikmesi, sorgunun içinde çağrılan `bench_sleep(ms)` SQLite
+fonksiyonu ile simüle edilir; fonksiyon driver'ın thread'inde çalıştığı için
+senkron yolda event loop'u bloklar, aiosqlite yolunda bloklamaz.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.async_db --requests 400 --concurrency 10 --latency-ms 20
+
+Concurrency varsayılan pool kapasitesini (pool_size 5 + max_overflow 10) aşarsa
+ölçülen şey sorgu değil pool kuyruğu olur.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(latencies, elapsed):
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+    }
+
+async def drive(
+    base_url, path_for, total, concurrency, headers=None,
+    method="GET", json_for=None, transport=None, expected=(200,)
+):
+    """Send `total` requests from `concurrency` workers; `transport` (httpx.ASGITransport) drives the app in-process"""
+    import httpx
+    latencies = []
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60, headers=headers, transport=transport
+    ) as client:
+        async def worker():
+            for i in counter:
+                started = time.perf_counter()
+                response = await client.request(method, path_for(i), json=json_for(i) if json_for else None)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code in expected, f"{method} {path_for(i)}: {response.status_code} {response.text[:200]}"
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return summarize(latencies, time.perf_counter() - started)
+
+def serve_in_thread(app):
+    """Run the app under uvicorn in its own thread/event loop
+
+    İstemci sunucunun event loop'unu paylaşmamalı; aksi halde bloklanan loop
+    istemcinin zamanlayıcısını da durdurur ve gecikme ölçülemez.
+    """
+    import socket
+    import threading
+    import uvicorn
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated DB round-trip per query")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from fastapi import FastAPI
+    from sqlalchemy import event, func, select
+    from database import Base, engine, async_engine, SessionLocal, AsyncSessionLocal, BlogPost
+
+    def bench_sleep(ms):
+        time.sleep(ms / 1000)
+        return 1
+
+    @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def register_sleep(dbapi_connection, _):
+        dbapi_connection.create_function("bench_sleep", 1, bench_sleep)
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add_all([
+            BlogPost(
+                title=f"Post {i}", excerpt="excerpt", content="content " * 200,
+                slug=f"post-{i}", category="bench", tags=["bench"], read_time="3 dk"
+            ) for i in range(args.posts)
+        ])
+        db.commit()
+
+    def post_query(post_id):
+        return select(BlogPost.id, BlogPost.title, func.bench_sleep(args.latency_ms)).where(BlogPost.id == post_id)
+
+    app = FastAPI()
+
+    @app.get("/sync/{post_id}")
+    async def sync_handler(post_id: int):
+        # user-004 öncesi desen: async handler içinde bloklayan Session
+        with SessionLocal() as db:
+            row = db.execute(post_query(post_id)).one()
+        return {"id": row.id, "title": row.title}
+
+    @app.get("/async/{post_id}")
+    async def async_handler(post_id: int):
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(post_query(post_id))).one()
+        return {"id": row.id, "title": row.title}
+
+    def path(prefix):
+        return lambda i: f"/{prefix}/{i % args.posts + 1}"
+
+    async def run(base_url):
+        results = {}
+        for mode in ("sync", "async"):
+            await drive(base_url, path(mode), min(50, args.requests), args.concurrency)  # warm-up
+            results[mode] = await drive(base_url, path(mode), args.requests, args.concurrency)
+        return results
+
+    server, thread, base_url = serve_in_thread(app)
+    try:
+        results = asyncio.run(run(base_url))
+    finally:
+        server.should_exit = True
+        thread.join()
+    print(json.dumps({
+        "benchmark": "async_db",
+        "config": vars(args),
+        "results": results,
+        "p99_speedup": round(results["sync"]["p99_ms"] / results["async"]["p99_ms"], 2),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark'ı (CI için)
+
+Her çalıştırma yeni bir Python süreci başlatır: main import edilir, lifespan
+açılışı tamamlanır ve kapanır. startup_timer'ın STARTUP_REPORT_PATH'e yazdığı
+faz süreleri (import, schema, admin, workers, snapshots) ve sürecin başlatılmasından
+hazır olmasına kadarki duvar saati süresi toplanır; medyanlar JSON olarak yazdırılır.
+İlk çalıştırma (şema + admin oluşturma) ısınma sayılır ve sonuçlara katılmaz.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.cold_start --runs 5 --mode full
+    python -m benchmarks.cold_start --mode fast --output cold.json
+    python -m benchmarks.cold_start --baseline cold.json --tolerance 0.3   # gerilemede çıkış kodu 1
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CHILD = """
+import asyncio
+import main
+
+async def run():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(run())
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=("full", "fast"), default="full", help="STARTUP_MODE of the measured runs")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--baseline", help="Previous --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed regression ratio")
+    args = parser.parse_args()
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, backend_dir)
+    from benchmarks.report import find_regressions, finish, load_baseline
+
+    work_dir = tempfile.mkdtemp(prefix="portfolio-cold-start-")
+    report_path = os.path.join(work_dir, "startup.json")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(work_dir, 'bench.db')}",
+        CONTACT_SPOOL_DIR=os.path.join(work_dir, "contact-spool"),
+        STARTUP_REPORT_PATH=report_path,
+    )
+    # fast modu migrate edilmiş bir veritabanı bekler
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], cwd=backend_dir, env=env,
+                   check=True, capture_output=True)
+
+    runs = []
+    for index in range(args.runs + 1):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", CHILD], cwd=backend_dir, env=dict(env, STARTUP_MODE=args.mode),
+                       check=True, capture_output=True)
+        wall_ms = (time.perf_counter() - started) * 1000
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        if index:
+            runs.append({**report["phases_ms"], "total": report["total_ms"], "process_wall": wall_ms})
+
+    results = {
+        name: {"median_ms": round(statistics.median(run[name] for run in runs), 2),
+               "max_ms": round(max(run[name] for run in runs), 2)}
+        for name in runs[0]
+    }
+    regressions = None
+    baseline = load_baseline(args.baseline)
+    if baseline is not None:
+        regressions = find_regressions(results, baseline["results"], {"median_ms": "lower"}, args.tolerance)
+    finish({
+        "benchmark": "cold_start",
+        "config": {"runs": args.runs, "mode": args.mode, "python": sys.version.split()[0]},
+        "results": results,
+    }, args.output, regressions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Sıcak yardımcı fonksiyonların mikro benchmark'ı (timeit)
+
+Her istekte / her satırda çalışan yardımcılar: slugify, tag dönüşümleri, response
+modeli kurulumu ve JSON serialize. Her ölçüm `--repeat` kez tekrarlanır; en iyi ve
+medyan süre ns/op olarak JSON yazdırılır (karşılaştırmada en iyi değer kullanılır).
+
+Kullanım (backend dizininden):
+    python -m benchmarks.micro --number 20000 --output micro.json
+    python -m benchmarks.micro --baseline micro.json --tolerance 0.2   # gerilemede çıkış kodu 1
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="Calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", action="append", help="Run only the named case(s)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--baseline", help="Previous --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed ns/op regression ratio")
+    args = parser.parse_args()
+
+    # main import'u için; veritabanına bağlanılmaz
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from benchmarks.report import find_regressions, finish, load_baseline
+    from cache import serialize_json
+    from main import BlogPostResponse, blog_post_to_response
+    from slugs import slugify
+    from snapshots import post_payload
+    from tags import convert_tags_to_list, normalize_tags
+
+    tags = ["python", "fastapi", "performans", "güvenlik"]
+    row = SimpleNamespace(
+        id=42, title="Çok Güzel Bir Başlık: Şimdi Öğren!", excerpt="Kısa özet " * 10,
+        content="İçerik kelimesi " * 300, created_at=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        read_time="7 dk", category="Backend", tags=tags, slug="cok-guzel-bir-baslik-simdi-ogren"
+    )
+    payload = post_payload(row)
+    page = [post_payload(row, include_content=False) for _ in range(20)]
+
+    cases = {
+        "slugify": lambda: slugify(row.title),
+        "convert_tags_to_list_list": lambda: convert_tags_to_list(tags),
+        "convert_tags_to_list_json": lambda: convert_tags_to_list('["python", "fastapi", "performans", "güvenlik"]'),
+        "normalize_tags": lambda: normalize_tags([" python", "fastapi", "python ", "", "güvenlik"]),
+        "blog_post_response_model": lambda: BlogPostResponse(**payload),
+        "blog_post_to_response": lambda: blog_post_to_response(row),
+        "post_payload": lambda: post_payload(row),
+        "serialize_json_summary_page": lambda: serialize_json(page),
+    }
+
+    results = {}
+    for name, func in cases.items():
+        if args.case and name not in args.case:
+            continue
+        func()
+        runs = [seconds / args.number * 1e9 for seconds in timeit.repeat(func, number=args.number, repeat=args.repeat)]
+        results[name] = {"best_ns": round(min(runs), 1), "median_ns": round(statistics.median(runs), 1)}
+
+    report = {
+        "benchmark": "micro",
+        "config": {"number": args.number, "repeat": args.repeat, "python": sys.version.split()[0]},
+        "results": results,
+    }
+    baseline = load_baseline(args.baseline)
+    regressions = None
+    if baseline is not None:
+        regressions = find_regressions(results, baseline["results"], {"best_ns": "lower"}, args.tolerance)
+    finish(report, args.output, regressions)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark sonuçlarının JSON çıktısı ve önceki bir çalıştırmayla (baseline) karşılaştırılması.
+
+Deploy öncesi: `--output` ile kaydedilen sonuç sonraki çalıştırmada `--baseline`
+olarak verilir; tolerans dışındaki gerilemeler listelenir ve çıkış kodu 1 olur.
+"""
+import json
+import sys
+from typing import Dict, List, Optional
+
+def find_regressions(
+    current: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    metrics: Dict[str, str],
+    tolerance: float
+) -> List[str]:
+    """Compare `{case: {metric: value}}` maps; `metrics` maps a metric to "lower" or "higher" (is better)"""
+    regressions = []
+    for case, values in current.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for metric, better in metrics.items():
+            if metric not in values or not base.get(metric):
+                continue
+            ratio = values[metric] / base[metric]
+            if (better == "lower" and ratio > 1 + tolerance) or (better == "higher" and ratio < 1 - tolerance):
+                regressions.append(f"{case} {metric}: {base[metric]} -> {values[metric]} ({ratio:.2f}x)")
+    return regressions
+
+def finish(report: dict, output: Optional[str], regressions: Optional[List[str]] = None):
+    """Print the JSON report (and save it); exit 1 when there are regressions"""
+    if regressions is not None:
+        report["regressions"] = regressions
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if regressions:
+        print(f"❌ {len(regressions)} gerileme:", *regressions, sep="\n  ", file=sys.stderr)
+        sys.exit(1)
+
+def load_baseline(path: Optional[str]) -> Optional[dict]:
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark veritabanı seed'i: yapılandırılabilir hacimde yazı, proje ve iletişim mesajı.
+
+Yazılar ve projeler uygulamanın toplu yazma yoluyla (apply_bulk: tag tabloları ve
+arama index'i dahil) eklenir, mesajlar Core executemany ile. İçerik sabit seed'li
+rastgele kelimelerden üretilir; her çalıştırmada aynı veri oluşur.
+
+Kullanım (backend dizininden; PostgreSQL için yalnızca boş / atılabilir bir veritabanı):
+    python -m benchmarks.seed --database-url sqlite:////tmp/bench.db --posts 10000 --messages 100000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+WORDS = [
+    "veri", "model", "sorgu", "async", "cache", "python", "fastapi", "index", "latency",
+    "yazı", "proje", "deploy", "react", "nextjs", "postgres", "docker", "test", "api",
+]
+CATEGORIES = ["Backend", "Frontend", "DevOps", "Veri", "Kariyer"]
+TAGS = ["python", "fastapi", "react", "nextjs", "sql", "docker", "performans", "güvenlik", "test", "cloud"]
+
+def text(rng: random.Random, size: int) -> str:
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(WORDS) + str(rng.randint(0, 999))
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+async def seed(
+    posts: int = 1000,
+    projects: int = 50,
+    messages: int = 10000,
+    content_bytes: int = 4000,
+    batch_size: int = 500,
+    seed_value: int = 42
+) -> dict:
+    """Insert the requested volumes into the configured DATABASE_URL; returns counts and timings"""
+    from sqlalchemy import insert
+    from bulk import apply_bulk
+    from database import AsyncSessionLocal, BlogPost, ContactMessage, Project
+
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+    timings = {}
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for offset in range(0, posts, batch_size):
+            await apply_bulk(db, BlogPost, [
+                {
+                    "title": f"Post {i} {text(rng, 30)}",
+                    "excerpt": text(rng, 160),
+                    "content": text(rng, content_bytes),
+                    "slug": f"post-{i}",
+                    "category": rng.choice(CATEGORIES),
+                    "tags": rng.sample(TAGS, rng.randint(1, 4)),
+                    "read_time": f"{rng.randint(2, 15)} dk",
+                    "created_at": now - timedelta(minutes=posts - i),
+                }
+                for i in range(offset, min(posts, offset + batch_size))
+            ], [])
+            await db.commit()
+    timings["posts_seconds"] = round(time.perf_counter() - started, 2)
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await apply_bulk(db, Project, [
+            {
+                "name": f"Proje {i}",
+                "description": text(rng, 300),
+                "technologies": rng.sample(TAGS, rng.randint(2, 5)),
+                "github": f"https://github.com/example/project-{i}",
+                "demo": None,
+                "display_order": i,
+            }
+            for i in range(projects)
+        ], [])
+        await db.commit()
+    timings["projects_seconds"] = round(time.perf_counter() - started, 2)
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for offset in range(0, messages, batch_size * 10):
+            await db.execute(insert(ContactMessage), [
+                {
+                    "name": f"Gönderen {i}",
+                    "email": f"sender{i}@example.com",
+                    "subject": text(rng, 40),
+                    "message": text(rng, 400),
+                    "is_read": rng.random() < 0.7,
+                    # Son 90 güne yayılmış
+                    "created_at": now - timedelta(seconds=rng.randint(0, 90 * 24 * 3600)),
+                }
+                for i in range(offset, min(messages, offset + batch_size * 10))
+            ])
+            await db.commit()
+    timings["messages_seconds"] = round(time.perf_counter() - started, 2)
+
+    return {"posts": posts, "projects": projects, "messages": messages, **timings}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--content-bytes", type=int, default=4000)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = args.database_url
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from database import create_tables
+
+    async def run():
+        from database import async_engine
+        try:
+            return await seed(args.posts, args.projects, args.messages, args.content_bytes)
+        finally:
+            # aiosqlite thread'i kapanmazsa süreç çıkışta asılı kalır
+            await async_engine.dispose()
+
+    create_tables()
+    print(json.dumps({"seed": asyncio.run(run())}, indent=2))
+
+if __name__ == "__main__":
+    main()
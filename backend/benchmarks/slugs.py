@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Toplu slug üretimi benchmark'ı
+
+`slugify_legacy` / `slugify`: her çağrıda tablo + regex hazırlayan eski fonksiyon ile
+önceden derlenmiş tablolu slugs.slugify (ns/op).
+`reserve_one_by_one` / `reserve_batch`: seed'lenmiş (çakışan başlıklı) veritabanında
+`--batch` başlık için yazı başına bir sorgu ile toplu ön ek sorgusu (SLUG_LOOKUP_CHUNK
+başlık başına bir sorgu) karşılaştırılır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.slugs --posts 5000 --batch 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import timeit
+import unicodedata
+
+def slugify_legacy(value: str) -> str:
+    # user-022 öncesi main.slugify
+    turkish_map = {
+        ord('ı'): 'i', ord('İ'): 'i', ord('ğ'): 'g', ord('Ğ'): 'g',
+        ord('ü'): 'u', ord('Ü'): 'u', ord('ş'): 's', ord('Ş'): 's',
+        ord('ö'): 'o', ord('Ö'): 'o', ord('ç'): 'c', ord('Ç'): 'c',
+    }
+    value = value.translate(turkish_map)
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    value = re.sub(r'[-\s]+', '-', value)
+    return value
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--distinct-titles", type=int, default=500, help="Seeded posts share this many titles")
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from sqlalchemy import insert
+    from benchmarks.report import finish
+    from database import AsyncSessionLocal, BlogPost, async_engine, create_tables
+    from slugs import SLUG_LOOKUP_CHUNK, reserve_slug, reserve_slugs, slugify
+
+    rng = random.Random(42)
+    words = ["Şimdi", "öğren", "FastAPI", "ile", "Çok", "hızlı", "API", "geliştirme", "Python", "Gün", "ışığı", "React"]
+    titles = [" ".join(rng.sample(words, 4)) + f" {i}" for i in range(args.distinct_titles)]
+
+    create_tables()
+
+    async def run():
+        results = {}
+        for name, func in (("slugify_legacy", slugify_legacy), ("slugify", slugify)):
+            seconds = min(timeit.repeat(lambda: [func(title) for title in titles], number=20, repeat=5))
+            results[name] = {"ns_per_title": round(seconds / (20 * len(titles)) * 1e9, 1)}
+
+        # Her başlıktan birkaç yazı: `baslik`, `baslik-2`, ... dolu
+        async with AsyncSessionLocal() as db:
+            reserved = await reserve_slugs(db, [titles[i % len(titles)] for i in range(args.posts)])
+            await db.execute(insert(BlogPost), [
+                {"title": titles[i % len(titles)], "excerpt": "e", "content": "c", "slug": slug,
+                 "category": "bench", "tags": [], "read_time": "1 dk"}
+                for i, slug in enumerate(reserved)
+            ])
+            await db.commit()
+
+        batch = [titles[i % len(titles)] for i in range(args.batch)]
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            one_by_one = [await reserve_slug(db, title) for title in batch]
+            results["reserve_one_by_one"] = {"ms": round((time.perf_counter() - started) * 1000, 2), "queries": len(batch)}
+
+            started = time.perf_counter()
+            batched = await reserve_slugs(db, batch)
+            queries = -(-len(set(batch)) // SLUG_LOOKUP_CHUNK)
+            results["reserve_batch"] = {"ms": round((time.perf_counter() - started) * 1000, 2), "queries": queries}
+        # Tek tek ayırmada batch içi çakışmalar görülmez; batch yolu hepsini tekil verir
+        results["reserve_batch"]["unique"] = len(set(batched)) == len(batched)
+        results["reserve_one_by_one"]["unique"] = len(set(one_by_one)) == len(one_by_one)
+        await async_engine.dispose()
+        return results
+
+    finish({"benchmark": "slugs", "config": {k: v for k, v in vars(args).items() if k != "output"}, "results": asyncio.run(run())}, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+ORM + pydantic okuma yolu vs önceden serialize edilmiş snapshot yük testi (uvicorn üzerinden)
+
+`orm`: eski desen - her istekte select(BlogPost), BlogPostResponse modelleri ve
+FastAPI'nin response_model doğrulaması (cache yok).
+`snapshot`: /api/posts, snapshot_store'un açılışta hazırladığı düz byte'lardan.
+`snapshot_br` / `snapshot_gzip`: aynı snapshot'ın önceden sıkıştırılmış varyantı;
+sıkıştırma istek anında değil build sırasında yapıldığı için maliyeti yalnızca
+daha az byte göndermektir.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.snapshots --posts 50 --requests 2000 --concurrency 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--content-bytes", type=int, default=4000, help="Approximate size of each post body")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from typing import List
+    from sqlalchemy import select
+    from benchmarks.async_db import drive, serve_in_thread
+    from database import Base, engine, SessionLocal, AsyncSessionLocal, BlogPost
+    import main as app_module
+
+    # Tekrarlı metin sıkıştırma oranını gerçek dışı gösterir; sabit seed'li rastgele kelimeler
+    rng = random.Random(42)
+    words = ["veri", "model", "sorgu", "async", "cache", "python", "fastapi", "index", "latency", "yazı", "proje", "deploy"]
+
+    def body():
+        text, size = [], 0
+        while size < args.content_bytes:
+            word = rng.choice(words) + str(rng.randint(0, 999))
+            text.append(word)
+            size += len(word) + 1
+        return " ".join(text)
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add_all([
+            BlogPost(
+                title=f"Post {i}", excerpt="excerpt", content=body(),
+                slug=f"post-{i}", category="bench", tags=["bench", "python"], read_time="3 dk"
+            ) for i in range(args.posts)
+        ])
+        db.commit()
+
+    app = app_module.app
+
+    # user-009 öncesi okuma yolu
+    @app.get("/bench/orm/posts", response_model=List[app_module.BlogPostResponse])
+    async def orm_posts():
+        async with AsyncSessionLocal() as db:
+            posts = (await db.scalars(
+                select(BlogPost).order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            )).all()
+        return [app_module.blog_post_to_response(post) for post in posts]
+
+    modes = {
+        "orm": ("/bench/orm/posts", "identity"),
+        "snapshot": ("/api/posts", "identity"),
+        "snapshot_gzip": ("/api/posts", "gzip"),
+        "snapshot_br": ("/api/posts", "br"),
+    }
+
+    async def run(base_url):
+        import httpx
+        results = {}
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for mode, (path, encoding) in modes.items():
+                response = await client.get(path, headers={"Accept-Encoding": encoding})
+                assert response.headers.get("content-encoding", "identity") == encoding, mode
+                results[mode] = {"response_bytes": response.num_bytes_downloaded}
+        for mode, (path, encoding) in modes.items():
+            headers = {"Accept-Encoding": encoding}
+            await drive(base_url, lambda i: path, min(100, args.requests), args.concurrency, headers)  # warm-up
+            results[mode].update(await drive(base_url, lambda i: path, args.requests, args.concurrency, headers))
+        return results
+
+    server, thread, base_url = serve_in_thread(app)
+    try:
+        results = asyncio.run(run(base_url))
+    finally:
+        server.should_exit = True
+        thread.join()
+    print(json.dumps({
+        "benchmark": "snapshots",
+        "config": vars(args),
+        "results": results,
+        "rps_speedup": round(results["snapshot"]["throughput_rps"] / results["orm"]["throughput_rps"], 2),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# backend/bulk.py
+"""
+Admin toplu yazma: bir istekte çok sayıda upsert ve delete.
+
+Tüm batch tek transaction'da, model başına birkaç executemany ifadesiyle
+(INSERT ... RETURNING, primary key'e göre UPDATE, DELETE ... IN) uygulanır;
+tag tabloları ve arama index'i de toplu güncellenir. Her öğe için sonuç döner.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from search import index_rows, remove_rows
+from tags import TAG_COLUMNS, delete_tag_rows_many, normalize_tags, replace_tag_rows
+
+BULK_MAX_ITEMS = 500
+
+async def apply_bulk(
+    db: AsyncSession,
+    model,
+    upserts: List[dict],
+    deletes: List[int],
+    prepare: Optional[Callable[[dict, Optional[object]], None]] = None,
+    atomic: bool = False
+) -> Tuple[List[dict], bool]:
+    """Apply upserts (no "id" = create) and deletes of `model`; returns (results, applied)
+
+    `prepare(values, existing_row)` öğe yazılmadan önce değerleri tamamlar (slug,
+    author_id, ...). Bulunamayan veya tekrarlanan id'ler hata olarak raporlanır;
+    `atomic` ise tek bir hata tüm batch'i iptal eder. Commit çağırana aittir.
+    """
+    tag_key = TAG_COLUMNS[model][0].key
+    ids = [item["id"] for item in upserts if item.get("id") is not None] + list(deletes)
+    existing = {}
+    if ids:
+        rows = (await db.execute(select(*model.__table__.c).where(model.id.in_(ids)))).all()
+        existing = {row.id: row for row in rows}
+
+    results: List[dict] = []
+    creates: List[Tuple[dict, dict]] = []
+    updates: List[dict] = []
+    delete_ids: List[int] = []
+    seen = set()
+    for index, item in enumerate(upserts):
+        values = dict(item)
+        id_ = values.get("id")
+        result = {"op": "upsert", "index": index, "id": id_}
+        results.append(result)
+        if id_ is not None and id_ in seen:
+            result["status"] = "duplicate"
+            continue
+        if id_ is not None and id_ not in existing:
+            result["status"] = "not_found"
+            continue
+        if tag_key in values:
+            values[tag_key] = normalize_tags(values[tag_key])
+        if prepare is not None:
+            prepare(values, existing.get(id_))
+        if id_ is None:
+            values.pop("id", None)
+            creates.append((result, values))
+        else:
+            seen.add(id_)
+            result["status"] = "updated"
+            updates.append(values)
+    for index, id_ in enumerate(deletes):
+        result = {"op": "delete", "index": index, "id": id_}
+        results.append(result)
+        if id_ in seen:
+            result["status"] = "duplicate"
+        elif id_ not in existing:
+            result["status"] = "not_found"
+        else:
+            seen.add(id_)
+            result["status"] = "deleted"
+            delete_ids.append(id_)
+
+    failed = any(result.get("status") in ("duplicate", "not_found") for result in results)
+    if atomic and failed:
+        for result in results:
+            result.setdefault("status", "skipped")
+            if result["status"] in ("updated", "deleted"):
+                result["status"] = "skipped"
+        return results, False
+
+    if delete_ids:
+        await delete_tag_rows_many(db, model, delete_ids)
+        await remove_rows(db, model, delete_ids)
+        await db.execute(delete(model).where(model.id.in_(delete_ids)))
+    if updates:
+        # ORM bulk UPDATE by primary key: tek executemany
+        await db.execute(update(model), updates)
+    if creates:
+        new_ids = (await db.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            [values for _, values in creates]
+        )).scalars().all()
+        for (result, values), new_id in zip(creates, new_ids):
+            result["id"] = new_id
+            result["status"] = "created"
+            values["id"] = new_id
+
+    written: Dict[int, dict] = {values["id"]: values for values in updates}
+    written.update({values["id"]: values for _, values in creates})
+    await replace_tag_rows(db, model, {id_: values.get(tag_key) for id_, values in written.items()})
+    await index_rows(db, model, [(id_, values) for id_, values in written.items()])
+    return results, bool(delete_ids or written)
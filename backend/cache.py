@@ -0,0 +1,252 @@
+# backend/cache.py
+"""
+Public GET endpoint'leri için process içi read-through response cache'i.
+
+Serialize edilmiş JSON gövdeleri (ve sıkıştırılmış varyantları) endpoint +
+parametre anahtarıyla saklanır ve admin yazma işlemlerinde tag bazında
+("blog-posts", "projects", "all") düşürülür.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from compression import encode_variants
+from metrics import record_serialize
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    tag: str
+    generation: Tuple
+    expires_at: float
+    headers: Dict[str, str] = field(default_factory=dict)
+    # Content-Encoding -> sıkıştırılmış gövde
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+def serialize_json(data) -> bytes:
+    """Serialize a payload the same way FastAPI's JSONResponse does"""
+    started = time.perf_counter()
+    body = json.dumps(
+        jsonable_encoder(data),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+    record_serialize(time.perf_counter() - started)
+    return body
+
+def as_utc(value: datetime) -> datetime:
+    """SQLite naive (UTC) datetime'ları ile PostgreSQL aware datetime'larını eşitle"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def row_last_modified(row) -> datetime:
+    return as_utc(row.updated_at or row.created_at)
+
+class ResponseCache:
+    """Bounded LRU + TTL cache of serialized responses with tag invalidation"""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 300,
+        sync_dir: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # Birden fazla worker varsa invalidation'lar bu dizindeki dosyaların
+        # mtime'ı üzerinden diğer process'lere de yansır
+        self.sync_dir = sync_dir
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._generations: Dict[str, int] = {}
+        self._invalidated_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        if sync_dir:
+            os.makedirs(sync_dir, exist_ok=True)
+
+    def _shared_stamp(self, tag: str) -> int:
+        if not self.sync_dir:
+            return 0
+        try:
+            return os.stat(os.path.join(self.sync_dir, tag)).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def generation(self, tag: str) -> Tuple:
+        """Current version of a tag; entries built under an older one are stale"""
+        return (
+            self._generations.get(tag, 0),
+            self._generations.get("all", 0),
+            self._shared_stamp(tag),
+            self._shared_stamp("all"),
+        )
+
+    def last_write_time(self, tag: str) -> float:
+        """Wall-clock time of the latest invalidation of a tag (0 if unknown)"""
+        return max(
+            self._invalidated_at.get(tag, 0),
+            self._invalidated_at.get("all", 0),
+            self._shared_stamp(tag) / 1e9,
+            self._shared_stamp("all") / 1e9,
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return a fresh entry or None (counts a hit or a miss)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at <= time.monotonic():
+                    self._drop(key)
+                    self.expirations += 1
+                    entry = None
+                elif entry.generation != self.generation(entry.tag):
+                    self._drop(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(
+        self,
+        key: str,
+        tag: str,
+        body: bytes,
+        generation: Tuple,
+        headers: Optional[Dict[str, str]] = None,
+        encoded: Optional[Dict[str, bytes]] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> CacheEntry:
+        """Store a body built under `generation`; skipped if the tag changed meanwhile"""
+        entry = CacheEntry(
+            body=body,
+            tag=tag,
+            generation=generation,
+            expires_at=time.monotonic() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds),
+            headers=headers or {},
+            encoded=encoded or {},
+        )
+        with self._lock:
+            if generation != self.generation(tag) or entry.size > self.max_bytes // 4:
+                return entry
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return entry
+
+    def store(
+        self,
+        key: str,
+        tag: str,
+        payload,
+        generation: Tuple,
+        headers: Optional[Dict[str, str]] = None,
+        last_modified: Optional[datetime] = None,
+        compress: bool = False,
+        ttl_seconds: Optional[float] = None
+    ) -> CacheEntry:
+        """Serialize `payload`, add validator headers (and compressed variants) and set it"""
+        body = serialize_json(payload)
+        headers = dict(headers or {})
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(as_utc(last_modified), usegmt=True)
+        headers["ETag"] = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        # Tarayıcıların Last-Modified'a göre heuristic cache yapmasını engelle
+        headers["Cache-Control"] = "no-cache"
+        headers["Vary"] = "Accept-Encoding"
+        encoded = encode_variants(body) if compress else None
+        return self.set(key, tag, body, generation, headers, encoded, ttl_seconds)
+
+    def add_variant(self, key: str, entry: CacheEntry, encoding: str, data: bytes):
+        """Attach a compressed copy to a stored entry (size accounting included)"""
+        with self._lock:
+            entry.encoded = {**entry.encoded, encoding: data}
+            # Girdi bu arada düşürüldüyse yalnızca elimizdeki nesne güncellenir
+            if self._entries.get(key) is entry:
+                self._size += len(data)
+                while self._entries and self._size > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+
+    def invalidate(self, tag: str):
+        """Drop every entry of a tag ("all" drops everything)"""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            self._invalidated_at[tag] = time.time()
+            for key in [k for k, e in self._entries.items() if tag == "all" or e.tag == tag]:
+                self._drop(key)
+            self.invalidations += 1
+        if self.sync_dir:
+            path = os.path.join(self.sync_dir, tag)
+            with open(path, "a"):
+                os.utime(path, ns=(time.time_ns(), time.time_ns()))
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the cache counters"""
+        stats = self.stats()
+        lines = []
+        for name in ("hits", "misses", "evictions", "expirations", "invalidations"):
+            lines.append(f"# TYPE portfolio_response_cache_{name}_total counter")
+            lines.append(f"portfolio_response_cache_{name}_total {stats[name]}")
+        for name in ("entries", "bytes"):
+            lines.append(f"# TYPE portfolio_response_cache_{name} gauge")
+            lines.append(f"portfolio_response_cache_{name} {stats[name]}")
+        return "\n".join(lines) + "\n"
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")),
+    max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300")),
+    sync_dir=os.getenv("RESPONSE_CACHE_SYNC_DIR") or None
+)
+
+def collection_last_modified(rows, tag: str) -> datetime:
+    """Newest row timestamp, bumped by the last write on the tag so deletes count too"""
+    last_write = datetime.fromtimestamp(response_cache.last_write_time(tag), timezone.utc)
+    return max([row_last_modified(row) for row in rows] + [last_write])
@@ -0,0 +1,248 @@
+# backend/compression.py
+"""
+Yanıt sıkıştırma: gzip / brotli / zstd, Accept-Encoding pazarlığı ve middleware.
+
+Cache'lenen yanıtların varyantları bir kez üretilip response_cache girdisinde
+saklanır; CompressionMiddleware ise cache'lenmeyen yanıtları (arama, admin,
+stream'ler) istek anında hızlı seviyelerle sıkıştırır. Harcanan CPU süresi
+`compression_stats` üzerinden /metrics'te raporlanır.
+"""
+import gzip
+import os
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "512"))
+
+# Aynı q değerinde sunucunun tercih sırası: saklanan varyantlarda oran (br),
+# istek anında sıkıştırmada hız (zstd) önceliklidir
+CACHED_PREFERENCE = ("br", "zstd", "gzip")
+DYNAMIC_PREFERENCE = ("zstd", "br", "gzip")
+
+# encoding -> (istek anı seviyesi, saklanan varyant seviyesi)
+LEVELS = {"br": (4, 9), "zstd": (3, 12), "gzip": (6, 9)}
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/", "application/javascript", "application/xml")
+
+class CompressionStats:
+    """Per-encoding counters of compression work (thread-safe, used from to_thread)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (encoding, source) -> [count, bytes_in, bytes_out, cpu_seconds]
+        self._work: Dict[Tuple[str, str], list] = {}
+        # encoding -> saklanan varyanttan gönderilen yanıt sayısı
+        self.served_cached: Dict[str, int] = {}
+
+    def record(self, encoding: str, source: str, bytes_in: int, bytes_out: int, cpu_seconds: float):
+        with self._lock:
+            work = self._work.setdefault((encoding, source), [0, 0, 0, 0.0])
+            work[0] += 1
+            work[1] += bytes_in
+            work[2] += bytes_out
+            work[3] += cpu_seconds
+
+    def served(self, encoding: str):
+        with self._lock:
+            self.served_cached[encoding] = self.served_cached.get(encoding, 0) + 1
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of compression work"""
+        with self._lock:
+            work = sorted(self._work.items())
+            served = sorted(self.served_cached.items())
+        lines = []
+        for index, name in enumerate(("operations", "input_bytes", "output_bytes", "cpu_seconds")):
+            lines.append(f"# TYPE portfolio_compression_{name}_total counter")
+            for (encoding, source), values in work:
+                value = f"{values[index]:.6f}" if name == "cpu_seconds" else values[index]
+                lines.append(f'portfolio_compression_{name}_total{{encoding="{encoding}",source="{source}"}} {value}')
+        lines.append("# TYPE portfolio_compression_cached_responses_total counter")
+        for encoding, count in served:
+            lines.append(f'portfolio_compression_cached_responses_total{{encoding="{encoding}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+compression_stats = CompressionStats()
+
+def _compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level, mode=brotli.MODE_TEXT)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    # mtime=0: aynı gövde her seferinde aynı byte'ları üretsin
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+def compress_body(body: bytes, encoding: str, source: str = "dynamic") -> bytes:
+    """One-shot compression; `source` "cache" uses the stronger stored-variant level"""
+    level = LEVELS[encoding][1 if source == "cache" else 0]
+    started = time.thread_time()
+    data = _compress(body, encoding, level)
+    compression_stats.record(encoding, source, len(body), len(data), time.thread_time() - started)
+    return data
+
+def encode_variants(body: bytes, encodings: Iterable[str] = ("br", "gzip")) -> Dict[str, bytes]:
+    """Stored-variant copies of `body`; small bodies and variants that don't shrink are skipped"""
+    if len(body) < COMPRESSION_MIN_BYTES:
+        return {}
+    variants = {encoding: compress_body(body, encoding, "cache") for encoding in encodings}
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map of coding -> q value (RFC 9110 12.5.3)"""
+    accepted = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+def choose_encoding(header: Optional[str], available: Iterable[str], preference=CACHED_PREFERENCE) -> Optional[str]:
+    """Best available coding the client accepts, None for identity"""
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for encoding in preference:
+        if encoding not in available:
+            continue
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+class StreamEncoder:
+    """Incremental compressor for streamed bodies; every chunk is flushed to the client"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        level = LEVELS[encoding][0]
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level, mode=brotli.MODE_TEXT)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip header
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+    def encode(self, data: bytes, final: bool = False) -> bytes:
+        started = time.thread_time()
+        if self.encoding == "br":
+            out = self._compressor.process(data) + (self._compressor.finish() if final else self._compressor.flush())
+        elif self.encoding == "zstd":
+            out = self._compressor.compress(data) + self._compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        else:
+            out = self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        self.cpu_seconds += time.thread_time() - started
+        self.bytes_in += len(data)
+        self.bytes_out += len(out)
+        if final:
+            compression_stats.record(self.encoding, "stream", self.bytes_in, self.bytes_out, self.cpu_seconds)
+        return out
+
+def add_vary(headers: MutableHeaders):
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses the app didn't encode itself
+
+    Content-Encoding'i zaten olan yanıtlar (cache'teki hazır varyantlar) olduğu
+    gibi geçer; tek parça gövdeler `minimum_size` altındaysa sıkıştırılmaz.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"), LEVELS, DYNAMIC_PREFERENCE)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        encoder: Optional[StreamEncoder] = None
+        passthrough = False
+
+        def compressible(headers: Headers, status: int) -> bool:
+            content_type = headers.get("content-type", "")
+            return (
+                status not in (204, 206, 304)
+                and "content-encoding" not in headers
+                and "no-transform" not in headers.get("cache-control", "")
+                and content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+
+        def mark_encoded(headers: MutableHeaders):
+            headers["Content-Encoding"] = encoding
+            add_vary(headers)
+            etag = headers.get("etag")
+            if etag and etag.endswith('"'):
+                headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Gövdenin ilk parçası gelene kadar header'lar bekletilir
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is not None:
+                await send({"type": "http.response.body", "body": encoder.encode(body, final=not more_body), "more_body": more_body})
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            if not compressible(headers, start_message["status"]) or (not more_body and len(body) < self.minimum_size):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+            if not more_body:
+                data = compress_body(body, encoding)
+                if len(data) >= len(body):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                mark_encoded(headers)
+                headers["Content-Length"] = str(len(data))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": data})
+                return
+            # Stream edilen yanıt: her parça sıkıştırılıp flush edilir
+            encoder = StreamEncoder(encoding)
+            mark_encoded(headers)
+            del headers["Content-Length"]
+            await send(start_message)
+            await send({"type": "http.response.body", "body": encoder.encode(body), "more_body": True})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,434 @@
+# backend/contact.py
+"""
+İletişim formu mesajlarının asenkron kaydı.
+
+`queue` modunda doğrulanmış mesajlar önce yerel bir spool dosyasına (fsync) yazılır,
+sonra sınırlı bir kuyruğa alınır; arka plandaki worker kuyruğu toplu INSERT'lerle
+veritabanına aktarır. Form selleri public okuyucularla DB bağlantısı için yarışmaz,
+kuyruk dolduğunda 429 döner. Kayıt edilen mesajlar spool'a "ack" satırı olarak
+işlenir; restart sonrası ack'lenmemiş mesajlar tekrar kuyruğa alınır (en az bir kez).
+
+Kaydetmeden önce her mesaj `checks` listesindeki kontrollerden (tekrar, spam)
+geçer; reddedilen mesajlar sessizce atlanır ve metriklerde sayılır.
+"""
+import asyncio
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from cache import response_cache
+from database import AsyncSessionLocal, ContactMessage
+from stats import ADMIN_STATS_TAG
+
+try:
+    import fcntl
+except ImportError:  # Windows: spool kilidi yok, tek worker varsayılır
+    fcntl = None
+
+# Mesajı reddetmek için sebep ("duplicate", "spam", ...) döner, kabul için None
+ContactCheck = Callable[[dict], Optional[str]]
+
+URL_PATTERN = re.compile(r"https?://|www\.", re.IGNORECASE)
+# Temp dizini reboot'ta / container yeniden oluşturulunca silinir; spool uygulamanın yanında tutulur
+DEFAULT_SPOOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spool", "contact")
+
+class DuplicateCheck:
+    """Rejects the same sender + subject + body seen within `window_seconds`
+
+    Kontrol anahtarı hemen ayırır (aynı anda gelen kopyalar da elenir); mesaj
+    kabul edilemezse (429, spool / INSERT hatası) `release` ile geri bırakılır.
+    """
+
+    def __init__(self, window_seconds: float = 3600, max_entries: int = 10_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+    @staticmethod
+    def _key(message: dict) -> str:
+        raw = "\x00".join((message["email"].lower(), message["subject"].strip(), message["message"].strip()))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def __call__(self, message: dict) -> Optional[str]:
+        now = time.monotonic()
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.window_seconds and len(self._seen) < self.max_entries:
+                break
+            del self._seen[key]
+        key = self._key(message)
+        if key in self._seen:
+            return "duplicate"
+        self._seen[key] = now
+        return None
+
+    def release(self, message: dict):
+        """Forget a message that was screened but not accepted, so a retry is not a duplicate"""
+        self._seen.pop(self._key(message), None)
+
+class SpamCheck:
+    """Link count and blocked-word heuristics"""
+
+    def __init__(self, max_links: int = 3, blocked_words: Tuple[str, ...] = ()):
+        self.max_links = max_links
+        self.blocked_words = tuple(word.lower() for word in blocked_words if word)
+
+    def __call__(self, message: dict) -> Optional[str]:
+        text = f"{message['subject']}\n{message['message']}"
+        if len(URL_PATTERN.findall(text)) > self.max_links:
+            return "spam"
+        lowered = text.lower()
+        if any(word in lowered for word in self.blocked_words):
+            return "spam"
+        return None
+
+class ContactSpool:
+    """Append-only NDJSON journal of accepted messages, one file per worker process
+
+    Satırlar `{"seq", "message"}` (fsync'li) veya `{"ack": [seq, ...]}` biçimindedir.
+    Her worker kendi dosyasını `.lock` üzerinde flock ile tutar; kilidi alınabilen
+    (sahibi ölmüş) dosyalar başlangıçta devralınıp tekrar oynatılır. Dosya adı
+    `open()` çağıran process'in pid'inden alınır: nesne preload ile master'da
+    oluşturulsa da fork edilen her worker ayrı dosyaya yazar.
+    """
+
+    COMPACT_BYTES = 1024 * 1024
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._file = None
+        self._lock_file = None
+        self._unacked: Dict[int, dict] = {}
+
+    @staticmethod
+    def _read(path: str) -> List[dict]:
+        entries: Dict[int, dict] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # yarım yazılmış son satır
+                if "ack" in record:
+                    for seq in record["ack"]:
+                        entries.pop(seq, None)
+                else:
+                    entries[record["seq"]] = record["message"]
+        return list(entries.values())
+
+    def _try_lock(self, path: str):
+        lock_file = open(path, "a")
+        if fcntl is None:
+            return lock_file
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def open(self) -> List[Tuple[int, dict]]:
+        """Lock this worker's spool and adopt unacknowledged messages of dead workers
+
+        Devralınan mesajlar 1'den numaralanıp önce bu worker'ın dosyasına yazılır,
+        eski dosyalar ancak ondan sonra silinir; arada çökme mesaj kaybettirmez.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"contact-{os.getpid()}.ndjson")
+        self._lock_file = self._try_lock(self.path[:-len(".ndjson")] + ".lock")
+        if self._lock_file is None:
+            raise RuntimeError(f"İletişim spool'u başka bir process tarafından kilitli: {self.path}")
+        recovered: List[dict] = []
+        adopted = []
+        for path in sorted(glob.glob(os.path.join(self.directory, "contact-*.ndjson"))):
+            if path == self.path:
+                recovered += self._read(path)
+                continue
+            lock_file = self._try_lock(path[:-len(".ndjson")] + ".lock")
+            if lock_file is None:
+                continue  # çalışan başka bir worker'a ait
+            if not os.path.exists(path):
+                # Kilidi bırakılırken başka bir worker devralıp sildi
+                lock_file.close()
+                continue
+            recovered += self._read(path)
+            adopted.append((path, lock_file))
+
+        entries = list(enumerate(recovered, start=1))
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for seq, message in entries:
+                f.write(json.dumps({"seq": seq, "message": message}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        for path, lock_file in adopted:
+            os.remove(path)
+            os.remove(path[:-len(".ndjson")] + ".lock")
+            lock_file.close()
+        self._unacked = dict(entries)
+        self._file = open(self.path, "a", encoding="utf-8")
+        return entries
+
+    def append(self, seq: int, message: dict):
+        """Durably journal one accepted message (blocking; call from a thread)"""
+        line = json.dumps({"seq": seq, "message": message}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unacked[seq] = message
+
+    def ack(self, seqs: List[int]):
+        """Mark messages as persisted; the journal is truncated once nothing is pending"""
+        with self._lock:
+            for seq in seqs:
+                self._unacked.pop(seq, None)
+            if not self._unacked:
+                self._file.seek(0)
+                self._file.truncate()
+            elif self._file.tell() > self.COMPACT_BYTES:
+                # Uzun süre boşalmayan kuyrukta dosya yalnızca bekleyenlerle yeniden yazılır
+                temp_path = self.path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    for seq, message in self._unacked.items():
+                        f.write(json.dumps({"seq": seq, "message": message}, ensure_ascii=False) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._file.close()
+                os.replace(temp_path, self.path)
+                self._file = open(self.path, "a", encoding="utf-8")
+            else:
+                # Ack kaybolursa mesaj tekrar kaydedilir (en az bir kez); fsync gerekmez
+                self._file.write(json.dumps({"ack": seqs}) + "\n")
+                self._file.flush()
+
+    def close(self):
+        """Release the spool; the files are removed when nothing is left unacknowledged"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if not self._unacked and self.path is not None:
+                for path in (self.path, self.path[:-len(".ndjson")] + ".lock"):
+                    if os.path.exists(path):
+                        os.remove(path)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+class ContactIngestQueue:
+    """Bounded queue of contact messages flushed to the database in batches"""
+
+    def __init__(
+        self,
+        mode: str = "queue",
+        max_pending: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        spool_dir: Optional[str] = None,
+        checks: Optional[List[ContactCheck]] = None,
+        backoff_max: float = 30.0
+    ):
+        if mode not in ("queue", "sync"):
+            raise ValueError(f"Unknown CONTACT_INGEST_MODE: {mode}")
+        self.mode = mode
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backoff_max = backoff_max
+        self.checks: List[ContactCheck] = list(checks or [])
+        self.spool = ContactSpool(spool_dir) if spool_dir else None
+        self._pending: Deque[Tuple[int, dict]] = deque()
+        self._seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.accepted = 0
+        self.rejected: Dict[str, int] = {}
+        self.backpressure = 0
+        self.persisted = 0
+        self.batches = 0
+        self.failures = 0
+        self.recovered = 0
+
+    def add_check(self, check: ContactCheck):
+        """Register a duplicate / spam check run before a message is queued"""
+        self.checks.append(check)
+
+    def screen(self, message: dict) -> Optional[str]:
+        for check in self.checks:
+            reason = check(message)
+            if reason:
+                self.rejected[reason] = self.rejected.get(reason, 0) + 1
+                return reason
+        return None
+
+    def release(self, message: dict):
+        """Undo what the checks recorded for a message that was not accepted after all"""
+        for check in self.checks:
+            release = getattr(check, "release", None)
+            if release is not None:
+                release(message)
+
+    async def submit(self, message: dict) -> bool:
+        """Accept one validated message; False when a check rejected it, 429 when the queue is full"""
+        if self.screen(message):
+            return False
+        try:
+            return await self._accept({**message, "received_at": datetime.now(timezone.utc).isoformat()})
+        except BaseException:
+            # Kabul edilmeyen mesajın tekrar denemesi "duplicate" sayılmasın
+            self.release(message)
+            raise
+
+    async def _accept(self, message: dict) -> bool:
+        if self.mode == "sync":
+            await self._insert([message])
+            self.accepted += 1
+            self.persisted += 1
+            return True
+        if len(self._pending) >= self.max_pending:
+            self.backpressure += 1
+            batches = math.ceil(len(self._pending) / self.batch_size)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Çok fazla mesaj var, lütfen daha sonra tekrar deneyin",
+                headers={"Retry-After": str(max(1, math.ceil(batches * self.flush_interval)))}
+            )
+        self._seq += 1
+        seq = self._seq
+        if self.spool is not None:
+            await asyncio.to_thread(self.spool.append, seq, message)
+        self._pending.append((seq, message))
+        self.accepted += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def _insert(self, messages: List[dict]):
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(ContactMessage), [
+                {
+                    "name": message["name"],
+                    "email": message["email"],
+                    "subject": message["subject"],
+                    "message": message["message"],
+                    "is_read": False,
+                    # Kuyrukta geçen süre mesajın tarihini kaydırmasın
+                    "created_at": datetime.fromisoformat(message["received_at"]),
+                }
+                for message in messages
+            ])
+            await db.commit()
+        response_cache.invalidate(ADMIN_STATS_TAG)
+
+    async def _flush_batch(self) -> bool:
+        """Insert up to batch_size pending messages in one transaction; False on failure"""
+        batch = [self._pending[index] for index in range(min(self.batch_size, len(self._pending)))]
+        try:
+            await self._insert([message for _, message in batch])
+        except (SQLAlchemyError, OSError) as e:
+            # DB erişilemezken mesajlar kuyrukta / spool'da bekler, worker backoff ile dener
+            self.failures += 1
+            print(f"❌ İletişim mesajları kaydedilemedi ({len(batch)}): {e}")
+            return False
+        for _ in batch:
+            self._pending.popleft()
+        self.batches += 1
+        self.persisted += len(batch)
+        if self.spool is not None:
+            await asyncio.to_thread(self.spool.ack, [seq for seq, _ in batch])
+        return True
+
+    async def start(self):
+        if self.mode != "queue":
+            return
+        if self.spool is not None:
+            entries = await asyncio.to_thread(self.spool.open)
+            self._pending.extend(entries)
+            self._seq = max(self._seq, len(entries))
+            self.recovered += len(entries)
+            if entries:
+                print(f"📬 Spool'dan {len(entries)} iletişim mesajı kuyruğa geri alındı")
+        self._wakeup = asyncio.Event()
+        if self._pending:
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the worker and try to persist what is still queued (the spool keeps the rest)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._pending and await self._flush_batch():
+            pass
+        if self.spool is not None and self._wakeup is not None:
+            await asyncio.to_thread(self.spool.close)
+        self._wakeup = None
+
+    async def _run(self):
+        attempt = 0
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Kısa bir pencere boyunca gelen mesajlar aynı INSERT'te birleşir
+            if len(self._pending) < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            while self._pending:
+                if await self._flush_batch():
+                    attempt = 0
+                    continue
+                attempt += 1
+                await asyncio.sleep(min(self.backoff_max, self.flush_interval * 2 ** attempt))
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the ingestion pipeline"""
+        lines = []
+        for name, value in (
+            ("accepted", self.accepted),
+            ("persisted", self.persisted),
+            ("batches", self.batches),
+            ("flush_failures", self.failures),
+            ("backpressure", self.backpressure),
+            ("recovered", self.recovered),
+        ):
+            lines.append(f"# TYPE portfolio_contact_{name}_total counter")
+            lines.append(f"portfolio_contact_{name}_total {value}")
+        lines.append("# TYPE portfolio_contact_rejected_total counter")
+        lines += [f'portfolio_contact_rejected_total{{reason="{reason}"}} {count}' for reason, count in sorted(self.rejected.items())]
+        lines.append("# TYPE portfolio_contact_pending gauge")
+        lines.append(f"portfolio_contact_pending {len(self._pending)}")
+        return "\n".join(lines) + "\n"
+
+contact_ingest = ContactIngestQueue(
+    mode=os.getenv("CONTACT_INGEST_MODE", "queue"),
+    max_pending=int(os.getenv("CONTACT_QUEUE_MAX", "1000")),
+    batch_size=int(os.getenv("CONTACT_FLUSH_BATCH", "100")),
+    flush_interval=float(os.getenv("CONTACT_FLUSH_INTERVAL_SECONDS", "0.5")),
+    spool_dir=os.getenv("CONTACT_SPOOL_DIR", DEFAULT_SPOOL_DIR),
+    checks=[
+        DuplicateCheck(window_seconds=float(os.getenv("CONTACT_DUPLICATE_WINDOW_SECONDS", "3600"))),
+        SpamCheck(
+            max_links=int(os.getenv("CONTACT_MAX_LINKS", "3")),
+            blocked_words=tuple(os.getenv("CONTACT_BLOCKED_WORDS", "").split(","))
+        ),
+    ]
+)
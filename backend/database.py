@@ -1,10 +1,15 @@
 # backend/database.py
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import create_engine, event, exc, text, DDL, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.sql import func
 from datetime import datetime
 import os
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,25 +18,205 @@ load_dotenv()
 # Database URL - PostgreSQL for production, SQLite for development
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Connection pool ayarları (env ile gunicorn worker sayısına göre ayarlanır)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+# PgBouncer (transaction pooling) önünde: pool PgBouncer'a bırakılır, prepared statement cache kapatılır
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+class PoolStats:
+    """Checkout/wait counters for one engine's pool"""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.preping_failures = 0
+        self.invalidations = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float):
+        self.wait_count += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+# Pool logging_name -> stats (pool dispose/recreate sonrası da aynı isimle bulunur)
+pool_stats = {"primary": PoolStats(), "primary_async": PoolStats()}
+
+class _TimedCheckoutMixin:
+    """Measure how long a checkout waits for a free connection"""
+
+    def _do_get(self):
+        stats = pool_stats.get(self.logging_name)
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if stats:
+                stats.timeouts += 1
+            raise
+        finally:
+            if stats:
+                stats.record_wait(time.perf_counter() - started)
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+def _instrument_engine(target, name: str):
+    stats = pool_stats[name]
+
+    @event.listens_for(target, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(target, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+
+    @event.listens_for(target, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        stats.checkins += 1
+
+    @event.listens_for(target, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.invalidations += 1
+
+    @event.listens_for(target, "handle_error")
+    def on_error(context):
+        if context.is_pre_ping:
+            stats.preping_failures += 1
+
+def _postgres_pool_kwargs(name: str, poolclass) -> dict:
+    if DB_PGBOUNCER:
+        return {"poolclass": NullPool, "pool_logging_name": name}
+    return {
+        "poolclass": poolclass,
+        "pool_logging_name": name,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+IS_POSTGRES = DATABASE_URL.startswith("postgresql")
+
+# In-memory SQLite SingletonThreadPool/StaticPool kullanır, ölçülecek bir kuyruk yoktur
+_SQLITE_FILE = make_url(DATABASE_URL).database not in (None, "", ":memory:")
+
 # Create engine with appropriate configuration
 if DATABASE_URL.startswith("postgresql"):
     # PostgreSQL configuration
+    _connect_args = {}
+    if DB_STATEMENT_TIMEOUT_MS:
+        _connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
     engine = create_engine(
         DATABASE_URL,
-        pool_pre_ping=True,
-        pool_recycle=300,
-        echo=False  # Set to True for SQL debugging
+        connect_args=_connect_args,
+        echo=False,  # Set to True for SQL debugging
+        **_postgres_pool_kwargs("primary", InstrumentedQueuePool)
     )
 else:
-    # SQLite configuration (fallback)
+    # SQLite configuration (fallback) - dosya tabanlı DB'de varsayılan QueuePool ölçülür
     engine = create_engine(
         DATABASE_URL, 
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        pool_logging_name="primary",
+        **({"poolclass": InstrumentedQueuePool} if _SQLITE_FILE else {})
     )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def to_async_url(url: str):
+    """Map a sync DATABASE_URL to its async driver (asyncpg / aiosqlite)"""
+    async_url = make_url(url)
+    connect_args = {}
+    if async_url.get_backend_name() == "postgresql":
+        # asyncpg libpq'nun sslmode parametresini tanımaz, ssl olarak iletilir
+        query = dict(async_url.query)
+        sslmode = query.pop("sslmode", None)
+        if sslmode and sslmode != "disable":
+            connect_args["ssl"] = sslmode
+        async_url = async_url.set(drivername="postgresql+asyncpg", query=query)
+    elif async_url.get_backend_name() == "sqlite":
+        async_url = async_url.set(drivername="sqlite+aiosqlite")
+    return async_url, connect_args
+
+def _create_async_engine(url: str, name: str):
+    async_url, connect_args = to_async_url(url)
+    if url.startswith("postgresql"):
+        if DB_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        if DB_PGBOUNCER:
+            # PgBouncer transaction modunda prepared statement'lar bağlantılar arasında taşınamaz
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+        return create_async_engine(
+            async_url,
+            connect_args=connect_args,
+            echo=False,
+            **_postgres_pool_kwargs(name, InstrumentedAsyncQueuePool)
+        )
+    sqlite_file = make_url(url).database not in (None, "", ":memory:")
+    return create_async_engine(
+        async_url,
+        pool_logging_name=name,
+        **({"poolclass": InstrumentedAsyncQueuePool} if sqlite_file else {})
+    )
+
+# Async engine - API endpoint'leri event loop'u bloklamamak için bunu kullanır
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)[0]
+async_engine = _create_async_engine(DATABASE_URL, "primary_async")
+
+# Okuma replikaları (virgülle ayrılmış URL'ler); yönlendirme için bkz. replicas.py
+DATABASE_READ_URLS = [url.strip() for url in os.getenv("DATABASE_READ_URLS", "").split(",") if url.strip()]
+replica_engines = {}
+for _index, _url in enumerate(DATABASE_READ_URLS, 1):
+    _name = f"replica_{_index}"
+    pool_stats[_name] = PoolStats()
+    replica_engines[_name] = _create_async_engine(_url, _name)
+    _instrument_engine(replica_engines[_name].sync_engine, _name)
+
+_instrument_engine(engine, "primary")
+_instrument_engine(async_engine.sync_engine, "primary_async")
+
+# Async session factory - commit sonrası nesneler response üretmek için okunabilir kalır
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def render_pool_metrics() -> str:
+    """Prometheus text exposition of pool sizing and checkout telemetry"""
+    lines = []
+    pools = {"primary": engine.pool, "primary_async": async_engine.sync_engine.pool}
+    pools.update({name: replica.sync_engine.pool for name, replica in replica_engines.items()})
+
+    def metric(name: str, kind: str, values):
+        lines.append(f"# TYPE portfolio_db_pool_{name} {kind}")
+        for pool_name, value in values:
+            lines.append(f'portfolio_db_pool_{name}{{pool="{pool_name}"}} {value}')
+
+    counters = ("connects", "checkouts", "checkins", "timeouts", "preping_failures", "invalidations")
+    for counter in counters:
+        metric(f"{counter}_total", "counter", [(n, getattr(s, counter)) for n, s in pool_stats.items()])
+    metric("wait_seconds_total", "counter", [(n, round(s.wait_seconds_total, 6)) for n, s in pool_stats.items()])
+    metric("wait_count_total", "counter", [(n, s.wait_count) for n, s in pool_stats.items()])
+    metric("wait_seconds_max", "gauge", [(n, round(s.wait_seconds_max, 6)) for n, s in pool_stats.items()])
+    # NullPool / in-memory SQLite pool'larında bu değerler yoktur
+    for gauge in ("size", "checkedout", "overflow"):
+        values = [(n, getattr(p, gauge)()) for n, p in pools.items() if isinstance(p, QueuePool)]
+        if values:
+            metric(gauge, "gauge", values)
+    return "\n".join(lines) + "\n"
+
 # Base class for models
 Base = declarative_base()
 
@@ -43,6 +228,18 @@ def get_db():
     finally:
         db.close()
 
+# Async database dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Tag listeleri: PostgreSQL'de GIN index'li JSONB, diğer veritabanlarında JSON (TEXT)
+TagList = JSON().with_variant(JSONB(), "postgresql")
+
+# SQLite'ta JSON içinde index'li arama olmadığı için tag'ler ayrıca normalize
+# tablolarda (blog_post_tags / project_technologies) tutulur; bkz. tags.py
+USE_TAG_TABLES = not IS_POSTGRES
+
 # Models
 class User(Base):
     __tablename__ = "users"
@@ -53,6 +250,8 @@ class User(Base):
     hashed_password = Column(String(128), nullable=False)
     is_admin = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
+    # Artırıldığında kullanıcının önceden verilmiş tüm token'ları geçersiz olur
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -68,7 +267,7 @@ class BlogPost(Base):
     content = Column(Text)
     slug = Column(String(250), unique=True, index=True, nullable=False)
     category = Column(String(100), nullable=False)
-    tags = Column(Text)  # JSON string olarak saklanacak
+    tags = Column(TagList)
     read_time = Column(String(20), nullable=False)
     is_published = Column(Boolean, default=True)
     author_id = Column(Integer, ForeignKey("users.id"))
@@ -78,13 +277,22 @@ class BlogPost(Base):
     # Relationships
     author = relationship("User", back_populates="blog_posts")
 
+    # Keyset pagination (created_at DESC, id DESC) ve kategori filtresi için
+    __table_args__ = (
+        Index("ix_blog_posts_created_at_id", "created_at", "id"),
+        Index("ix_blog_posts_category_created_at", "category", "created_at"),
+        Index("ix_blog_posts_tags_gin", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # Slug ön ek aramaları (slugs.py) için byte sıralı index; SQLite'ta unique index yeterli
+        Index("ix_blog_posts_slug_pattern", "slug", postgresql_ops={"slug": "text_pattern_ops"}).ddl_if(dialect="postgresql"),
+    )
+
 class Project(Base):
     __tablename__ = "projects"
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
-    technologies = Column(Text)  # JSON string olarak saklanacak
+    technologies = Column(TagList)
     github = Column(String(500), nullable=False)
     demo = Column(String(500))
     is_featured = Column(Boolean, default=True)
@@ -92,6 +300,34 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_projects_technologies_gin", "technologies", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+class SlugRedirect(Base):
+    """Old slug of a renamed blog post -> the post (resolved by /api/posts/slug/{slug})"""
+    __tablename__ = "slug_redirects"
+    
+    old_slug = Column(String(250), primary_key=True)
+    post_id = Column(Integer, ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_slug_redirects_old_slug_pattern", "old_slug", postgresql_ops={"old_slug": "text_pattern_ops"}).ddl_if(dialect="postgresql"),
+    )
+
+class BlogPostTag(Base):
+    __tablename__ = "blog_post_tags"
+    
+    post_id = Column(Integer, ForeignKey("blog_posts.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True, index=True)
+
+class ProjectTechnology(Base):
+    __tablename__ = "project_technologies"
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    technology = Column(String(100), primary_key=True, index=True)
+
 class ContactMessage(Base):
     __tablename__ = "contact_messages"
     
@@ -103,6 +339,64 @@ class ContactMessage(Base):
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Admin inbox: (created_at DESC, id DESC) keyset sayfalama, okunmamış filtresi ve sayacı
+    __table_args__ = (
+        Index("ix_contact_messages_created_at_id", "created_at", "id"),
+        Index("ix_contact_messages_is_read_created_at", "is_read", "created_at", "id"),
+    )
+
+# Full-text search şeması (sorgular için bkz. search.py)
+# PostgreSQL: Türkçe + İngilizce ağırlıklı, generated tsvector kolonlar + GIN index.
+# Generated kolon olduğu için admin yazmalarında ayrıca bakım gerektirmez.
+BLOG_POST_SEARCH_VECTOR = """
+    setweight(to_tsvector('turkish', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('turkish', coalesce(excerpt, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') ||
+    setweight(to_tsvector('turkish', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C') ||
+    setweight(to_tsvector('english', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C')
+"""
+PROJECT_SEARCH_VECTOR = """
+    setweight(to_tsvector('turkish', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(jsonb_to_tsvector('simple', coalesce(technologies, '[]'::jsonb), '["string"]'), 'B') ||
+    setweight(to_tsvector('turkish', coalesce(description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+"""
+for _table, _vector in ((BlogPost.__table__, BLOG_POST_SEARCH_VECTOR), (Project.__table__, PROJECT_SEARCH_VECTOR)):
+    event.listen(_table, "after_create", DDL(
+        f"ALTER TABLE {_table.name} ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_vector}) STORED"
+    ).execute_if(dialect="postgresql"))
+    event.listen(_table, "after_create", DDL(
+        f"CREATE INDEX ix_{_table.name}_search_vector ON {_table.name} USING gin (search_vector)"
+    ).execute_if(dialect="postgresql"))
+
+# SQLite: FTS5 sanal tablosu; admin yazmalarında search.py tarafından güncellenir
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    "kind UNINDEXED, item_id UNINDEXED, title, excerpt, body, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+).execute_if(dialect="sqlite"))
+
 # Create tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
+
+def dispose_engines_after_fork():
+    """Drop the connection pools inherited from the parent process (gunicorn post_fork)
+
+    close=False: parent'ın soketleri kapatılmaz; child kendi bağlantılarını açar.
+    """
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    for replica in replica_engines.values():
+        replica.sync_engine.dispose(close=False)
+
+async def schema_version():
+    """Current alembic revision of the database (None if it was never migrated)"""
+    async with async_engine.connect() as conn:
+        try:
+            return await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        except exc.DBAPIError:
+            return None
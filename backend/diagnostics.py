@@ -0,0 +1,170 @@
+# backend/diagnostics.py
+"""
+Opt-in SQL tanılama modu (DB_DIAGNOSTICS=true): yavaş sorgu logu, N+1 dedektörü
+ve istek başına sorgu bütçesi.
+
+- Eşik (DB_SLOW_QUERY_MS) üzerindeki sorgular EXPLAIN planlarıyla loglanır
+- Bir istekte aynı biçimdeki (aynı SQL metni, farklı parametre) sorgu
+  DB_N_PLUS_ONE_THRESHOLD kez çalışırsa N+1 olarak işaretlenir
+- DB_QUERY_BUDGET aşıldığında uyarı verilir; DB_QUERY_BUDGET_STRICT=true ise
+  QueryBudgetExceeded fırlatılır (testler bu sayede kırılır)
+
+Kapalıyken engine'lere hiçbir event bağlanmaz.
+"""
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more SQL statements than its budget allows"""
+
+class RequestQueries:
+    """Statements executed within one request (or one track_queries block)"""
+
+    def __init__(self, label: str, budget: Optional[int] = None, strict: bool = False):
+        self.label = label
+        self.budget = budget
+        self.strict = strict
+        self.count = 0
+        self.shapes: Dict[str, int] = {}
+        self.flagged: List[str] = []
+
+# Sorgular bu contextvar üzerinden isteğe bağlanır (build task'ları ve to_thread dahil)
+current_queries: contextvars.ContextVar[Optional[RequestQueries]] = contextvars.ContextVar("current_queries", default=None)
+
+class QueryDiagnostics:
+    """Slow query log with EXPLAIN, N+1 detection and per-request query budgets"""
+
+    EXPLAINABLE = ("select", "with")
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        slow_ms: float = 100,
+        n_plus_one_threshold: int = 5,
+        budget: Optional[int] = None,
+        strict: bool = False
+    ):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.budget = budget
+        self.strict = strict
+        self.slow_queries = 0
+        self.n_plus_one = 0
+        self.budget_exceeded = 0
+
+    def instrument(self, target, name: str):
+        """Attach the diagnostics events to an engine (`async_engine.sync_engine` for async)"""
+
+        @event.listens_for(target, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            context._diagnostics_started = time.perf_counter()
+
+        @event.listens_for(target, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - context._diagnostics_started) * 1000
+            queries = current_queries.get()
+            if elapsed_ms >= self.slow_ms:
+                self.slow_queries += 1
+                plan = "" if executemany else self._explain(conn, statement, parameters)
+                where = f" [{queries.label}]" if queries else ""
+                print(f"🐢 Yavaş sorgu ({name}, {elapsed_ms:.1f} ms){where}: {statement}{plan}")
+            if queries is not None:
+                self._track(queries, statement)
+
+    def _track(self, queries: RequestQueries, statement: str):
+        queries.count += 1
+        shape_count = queries.shapes.get(statement, 0) + 1
+        queries.shapes[statement] = shape_count
+        if shape_count == self.n_plus_one_threshold:
+            # Aynı biçim istek başına bir kez raporlanır
+            self.n_plus_one += 1
+            queries.flagged.append(statement)
+            print(f"⚠️ Olası N+1 [{queries.label}]: aynı sorgu {shape_count}+ kez çalıştı: {statement}")
+        if queries.budget is not None and queries.count == queries.budget + 1:
+            self.budget_exceeded += 1
+            message = f"{queries.label}: {queries.count} sorgu, bütçe {queries.budget}"
+            if queries.strict:
+                raise QueryBudgetExceeded(message)
+            print(f"⚠️ Sorgu bütçesi aşıldı - {message}")
+
+    def _explain(self, conn, statement: str, parameters) -> str:
+        """EXPLAIN the statement on the same connection; never breaks the request"""
+        if not statement.lstrip().lower().startswith(self.EXPLAINABLE):
+            return ""
+        postgres = conn.dialect.name == "postgresql"
+        cursor = conn.connection.cursor()
+        try:
+            # Başarısız EXPLAIN PostgreSQL transaction'ını bozmasın
+            if postgres:
+                cursor.execute("SAVEPOINT diagnostics_explain")
+            try:
+                cursor.execute(("EXPLAIN " if postgres else "EXPLAIN QUERY PLAN ") + statement, parameters)
+                rows = cursor.fetchall()
+            except Exception as e:
+                if postgres:
+                    cursor.execute("ROLLBACK TO SAVEPOINT diagnostics_explain")
+                return f"\n    (EXPLAIN başarısız: {e})"
+            if postgres:
+                cursor.execute("RELEASE SAVEPOINT diagnostics_explain")
+        finally:
+            cursor.close()
+        # PostgreSQL: tek kolonlu plan satırları, SQLite: (id, parent, notused, detail)
+        return "".join(f"\n    {row[0] if postgres else row[-1]}" for row in rows)
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of diagnostics findings"""
+        lines = []
+        for name, value in (
+            ("slow_queries", self.slow_queries),
+            ("n_plus_one", self.n_plus_one),
+            ("query_budget_exceeded", self.budget_exceeded),
+        ):
+            lines.append(f"# TYPE portfolio_db_{name}_total counter")
+            lines.append(f"portfolio_db_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+query_diagnostics = QueryDiagnostics(
+    enabled=os.getenv("DB_DIAGNOSTICS", "false").lower() in ("1", "true", "yes"),
+    slow_ms=float(os.getenv("DB_SLOW_QUERY_MS", "100")),
+    n_plus_one_threshold=int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5")),
+    budget=int(os.getenv("DB_QUERY_BUDGET")) if os.getenv("DB_QUERY_BUDGET") else None,
+    strict=os.getenv("DB_QUERY_BUDGET_STRICT", "false").lower() in ("1", "true", "yes")
+)
+
+@contextmanager
+def track_queries(label: str = "track_queries", budget: Optional[int] = None, strict: bool = True):
+    """Collect the statements run inside the block (for tests: `with track_queries(budget=2) as q:`)
+
+    Yalnızca tanılama event'leri bağlı engine'lerde çalışır.
+    """
+    queries = RequestQueries(label, budget, strict)
+    token = current_queries.set(queries)
+    try:
+        yield queries
+    finally:
+        current_queries.reset(token)
+
+class QueryDiagnosticsMiddleware:
+    """Scopes query tracking to each HTTP request"""
+
+    def __init__(self, app, diagnostics: QueryDiagnostics = query_diagnostics):
+        self.app = app
+        self.diagnostics = diagnostics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or current_queries.get() is not None:
+            # Dıştaki bir track_queries bloğu (in-process test) isteği zaten sayıyor
+            await self.app(scope, receive, send)
+            return
+        queries = RequestQueries(f'{scope["method"]} {scope["path"]}', self.diagnostics.budget, self.diagnostics.strict)
+        token = current_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_queries.reset(token)
@@ -0,0 +1,68 @@
+# backend/export.py
+"""
+Tüm içeriğin stream edilerek dışa aktarımı (yedek / statik prebuild).
+
+Satırlar server-side cursor'dan (`AsyncSession.stream` + `yield_per`) partition
+partition okunur ve okundukça NDJSON satırı ya da JSON dizi elemanı olarak
+yazılır; bellek kullanımı arşiv boyutundan bağımsız olarak partition boyutuyla
+sınırlıdır.
+"""
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import func, select
+
+from cache import as_utc
+from database import IS_POSTGRES, BlogPost, Project
+from replicas import read_replicas
+from snapshots import POST_COLUMNS, PROJECT_COLUMNS, post_payload, project_payload
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
+
+_EXPORTS = {
+    "posts": (BlogPost, POST_COLUMNS, post_payload),
+    "projects": (Project, PROJECT_COLUMNS, project_payload),
+}
+# Export türü -> cache tag'i (read-your-writes penceresi için)
+_EXPORT_TAGS = {"posts": "blog-posts", "projects": "projects"}
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    return as_utc(value).isoformat() if value is not None else None
+
+def export_record(kind: str, row) -> dict:
+    """Public payload plus the timestamps needed for incremental syncs"""
+    model, columns, payload = _EXPORTS[kind]
+    record = payload(row)
+    record["createdAt"] = _timestamp(row.created_at)
+    record["updatedAt"] = _timestamp(row.updated_at or row.created_at)
+    return record
+
+async def export_stream(kind: str, format: str, updated_since: Optional[datetime] = None) -> AsyncIterator[bytes]:
+    """Yield the serialized rows of `kind` ("posts" / "projects") batch by batch"""
+    model, columns, payload = _EXPORTS[kind]
+    query = select(*columns).order_by(model.id)
+    if updated_since is not None:
+        since = as_utc(updated_since)
+        # SQLite zaman damgalarını naive UTC olarak saklar
+        if not IS_POSTGRES:
+            since = since.replace(tzinfo=None)
+        query = query.where(func.coalesce(model.updated_at, model.created_at) >= since)
+
+    first = True
+    if format == "json":
+        yield b"["
+    async with read_replicas.session(_EXPORT_TAGS[kind]) as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            lines = [json.dumps(export_record(kind, row), ensure_ascii=False) for row in rows]
+            if format == "ndjson":
+                chunk = "\n".join(lines) + "\n"
+            else:
+                chunk = ("" if first else ",") + ",".join(lines)
+            first = False
+            yield chunk.encode("utf-8")
+    if format == "json":
+        yield b"]"
@@ -0,0 +1,98 @@
+# backend/gunicorn.conf.py
+"""
+Production sunucusu: gunicorn master + uvicorn worker'ları.
+
+gunicorn çalışma dizinindeki bu dosyayı otomatik okur. Uygulama master'da bir kez
+import edilir (preload); worker'lar import edilmiş kodu copy-on-write paylaşır.
+Şema ve varsayılan admin fork'tan önce master'da bir kez hazırlanır (worker'lar bu
+adımları atlar); her worker fork'tan sonra miras aldığı bağlantı havuzlarını, SQLite
+rate limit bağlantısını ve bcrypt thread pool'unu yeniler. Birden fazla worker varsa
+cache invalidation'ları ve rate limit sayaçları varsayılan olarak paylaşılır.
+
+Kullanım (backend dizininden):
+    gunicorn main:app
+    kill -HUP <master pid>     # worker'ları sırayla yeniler (preload: kod değişmez)
+    kill -USR2 <master pid>    # yeni kodla yeni master; hazır olunca eskisine QUIT
+"""
+import os
+import sys
+import tempfile
+
+from dotenv import load_dotenv
+
+from startup import DATABASE_PREPARED_ENV
+
+# Aşağıdaki varsayılanlar .env'deki değerleri ezmesin (database.py de aynı dosyayı yükler)
+load_dotenv()
+
+def _usable_cpus() -> int:
+    # Container'a atanan çekirdekler (cpu_count tüm makineyi sayar)
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+worker_class = "uvicorn.workers.UvicornWorker"
+# Async worker I/O'da bloklanmaz: çekirdek başına bir worker, +1 CPU işi (serileştirme,
+# sıkıştırma) yapan worker'ların boşluğunu doldurur. Her worker'ın kendi DB havuzu
+# (DB_POOL_SIZE + DB_MAX_OVERFLOW) vardır; üst sınır veritabanının max_connections'ını korur.
+workers = int(os.getenv("WEB_CONCURRENCY", str(min(_usable_cpus() + 1, int(os.getenv("GUNICORN_MAX_WORKERS", "8"))))))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Birden fazla worker: cache invalidation'ları (snapshot yenileme ve read-your-writes
+# penceresi dahil) ve rate limit sayaçları worker'lar arasında paylaşılmalı
+if workers > 1:
+    os.environ.setdefault("RESPONSE_CACHE_SYNC_DIR", os.path.join(tempfile.gettempdir(), "portfolio-cache-sync"))
+    os.environ.setdefault("RATE_LIMIT_BACKEND", "sqlite")
+    if os.environ["RATE_LIMIT_BACKEND"] == "memory":
+        print(f"⚠️ RATE_LIMIT_BACKEND=memory: {workers} worker'ın her biri limitleri ayrı sayar")
+
+# Bellek büyümesini sınırlar; jitter worker'ların aynı anda yeniden başlamasını önler
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", str(max_requests // 10)))
+
+# Kapanışta worker'lar devam eden istekleri ve lifespan kuyruklarını (contact, revalidation) boşaltır
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+# Load balancer'ın idle timeout'undan uzun olmalı
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+
+def when_ready(server):
+    """Prepare the schema and the default admin once, before any worker starts"""
+    if "main" not in sys.modules:
+        # preload kapalı: her worker kendi lifespan'inde hazırlar (USR2 ile gelen bayrak da silinir)
+        os.environ.pop(DATABASE_PREPARED_ENV, None)
+        return
+    import asyncio
+    from database import async_engine, engine
+    from main import ensure_admin_user, prepare_schema
+    from startup import startup_mode
+
+    async def bootstrap():
+        try:
+            await prepare_schema(startup_mode() == "fast")
+            await ensure_admin_user()
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(bootstrap())
+    engine.dispose()
+    # Fork edilen worker'lar bayrağı miras alır ve lifespan'de schema / admin adımlarını atlar
+    os.environ[DATABASE_PREPARED_ENV] = "1"
+    server.log.info("Şema ve admin hazır, worker'lar başlatılıyor")
+
+def post_fork(server, worker):
+    """Drop connections and threads inherited from the master; each worker opens its own"""
+    if "database" in sys.modules:
+        from database import dispose_engines_after_fork
+        dispose_engines_after_fork()
+    if "ratelimit" in sys.modules:
+        from ratelimit import rate_limiter
+        rate_limiter.after_fork()
+    if "passwords" in sys.modules:
+        from passwords import password_hasher
+        password_hasher.after_fork()
@@ -1,63 +1,72 @@
 # backend/main.py
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+# İlk import: cold start süresi buradan ölçülür (bkz. startup.py)
+from startup import database_prepared, migration_head, startup_mode, startup_timer
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, or_, and_, update, delete, false
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, timedelta
-import json
+from datetime import datetime, timedelta, timezone
 import os
-import httpx
-from dotenv import load_dotenv
-import re
-import unicodedata
+import base64
+import asyncio
+from email.utils import parsedate_to_datetime
 
-# Load environment variables
-load_dotenv()
-
-# Local imports
-from database import get_db, create_tables, User, BlogPost, Project, ContactMessage
+# Local imports (.env database.py import edilirken yüklenir)
+from database import (
+    get_async_db, create_tables, schema_version, engine, async_engine, replica_engines, AsyncSessionLocal,
+    render_pool_metrics,
+    User, BlogPost, Project, ContactMessage
+)
+from cache import response_cache, as_utc, row_last_modified, collection_last_modified
+from compression import (
+    COMPRESSION_MIN_BYTES, LEVELS, CompressionMiddleware, choose_encoding, compress_body, compression_stats
+)
+from revalidation import revalidation_queue
+from snapshots import (
+    SNAPSHOTS_ENABLED, snapshot_store, POST_COLUMNS, POST_SUMMARY_COLUMNS, PROJECT_COLUMNS, PROJECT_ORDER,
+    post_payload, project_payload, posts_key, post_key, post_slug_key, projects_key, project_key
+)
+from tags import (
+    convert_tags_to_list, normalize_tags, tag_filter, tag_counts_query, sync_tag_rows, delete_tag_rows
+)
+from search import search_content, index_item, remove_item
+from bulk import BULK_MAX_ITEMS, apply_bulk
+from export import EXPORT_MEDIA_TYPES, export_stream
 from auth import (
-    authenticate_user, create_access_token, get_current_user, get_current_admin_user,
-    get_password_hash, rate_limit_check
+    Principal, authenticate_user, create_user_token, get_current_admin_user,
+    get_metrics_reader, get_password_hash, principal_cache, revoke_user_tokens
+)
+from ratelimit import rate_limit, rate_limiter
+from passwords import password_hasher
+from contact import contact_ingest
+from metrics import (
+    InstrumentedRoute, MetricsMiddleware, TimedJSONResponse, instrument_sql, metrics_registry
+)
+from diagnostics import QueryDiagnosticsMiddleware, query_diagnostics
+from replicas import read_db, read_replicas
+from slugs import (
+    delete_redirects, record_redirects, reserve_slug, reserve_slugs, resolve_slug_query, with_slug_retry
+)
+from stats import (
+    ADMIN_STATS_TAG, ADMIN_STATS_TTL_SECONDS, STATS_DEFAULT_DAYS, STATS_MAX_DAYS,
+    admin_stats_key, compute_admin_stats
 )
-
-def slugify(value: str) -> str:
-    """
-    Türkçe karakterleri de destekleyen, metni URL dostu hale getiren fonksiyon.
-    """
-    turkish_map = {
-        ord('ı'): 'i', ord('İ'): 'i', ord('ğ'): 'g', ord('Ğ'): 'g',
-        ord('ü'): 'u', ord('Ü'): 'u', ord('ş'): 's', ord('Ş'): 's',
-        ord('ö'): 'o', ord('Ö'): 'o', ord('ç'): 'c', ord('Ç'): 'c',
-    }
-    value = value.translate(turkish_map)
-    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
-    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
-    value = re.sub(r'[-\s]+', '-', value)
-    return value
 
 # Cache temizleme fonksiyonu
-async def invalidate_frontend_cache(tag: str):
+def invalidate_frontend_cache(tag: str):
     """Frontend cache'ini temizle"""
-    try:
-        revalidate_secret = os.getenv("REVALIDATE_SECRET", "your-super-secret-revalidate-key-2024")
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{frontend_url}/api/revalidate",
-                json={"tag": tag, "secret": revalidate_secret},
-                timeout=5.0
-            )
-            if response.status_code == 200:
-                print(f"✅ Frontend cache temizlendi: {tag}")
-            else:
-                print(f"⚠️ Cache temizleme başarısız: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Cache temizleme hatası: {e}")
-        # Cache temizleme başarısız olsa da ana işlemi etkilemesin
+    # Backend response cache'i her zaman senkron düşürülür ki yazmadan sonraki okumalar güncel olsun
+    response_cache.invalidate(tag)
+    response_cache.invalidate(ADMIN_STATS_TAG)
+    # Varsayılan liste / tekil yanıtlar arka planda yeniden serialize edilir
+    snapshot_store.schedule(tag)
+    # Frontend revalidation'ı arka plandaki kuyruğa bırakılır; admin isteği HTTP çağrısını beklemez
+    revalidation_queue.enqueue(tag)
 
 
 # Pydantic modelleri (Request/Response)
@@ -86,12 +95,33 @@ class ProjectResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+class SearchResult(BaseModel):
+    type: str  # "post" veya "project"
+    id: int
+    title: str
+    slug: Optional[str] = None
+    snippet: str  # Eşleşmeler <mark>...</mark> ile işaretlenir
+    rank: float
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
+    next_offset: Optional[int] = None
+
 class ContactMessageCreate(BaseModel):
     name: str = Field(..., min_length=2, max_length=100, description="Name (2-100 characters)")
     email: EmailStr = Field(..., description="Valid email address")
     subject: str = Field(..., min_length=5, max_length=200, description="Subject (5-200 characters)")
     message: str = Field(..., min_length=10, max_length=2000, description="Message (10-2000 characters)")
 
+class ContactMessageBulkRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+    action: str = Field(..., pattern="^(read|unread|delete)$")
+
 class UserLogin(BaseModel):
     username: str
     password: str
@@ -120,44 +150,125 @@ class ProjectCreate(BaseModel):
     github: str
     demo: Optional[str] = None
 
+# Toplu admin yazma modelleri - id verilmeyen upsert yeni kayıt oluşturur
+class BlogPostBulkUpsert(BlogPostCreate):
+    id: Optional[int] = None
+
+class BlogPostBulkRequest(BaseModel):
+    upserts: List[BlogPostBulkUpsert] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    deletes: List[int] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    atomic: bool = Field(False, description="Herhangi bir öğe başarısız olursa hiçbirini uygulama")
+
+class ProjectBulkUpsert(ProjectCreate):
+    id: Optional[int] = None
+    display_order: Optional[int] = None
+
+class ProjectBulkRequest(BaseModel):
+    upserts: List[ProjectBulkUpsert] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    deletes: List[int] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    atomic: bool = Field(False, description="Herhangi bir öğe başarısız olursa hiçbirini uygulama")
+
+class BulkItemResult(BaseModel):
+    op: str  # "upsert" veya "delete"
+    index: int  # upserts / deletes listesindeki sıra
+    id: Optional[int] = None
+    status: str  # created, updated, deleted, not_found, duplicate, skipped
+
+class BulkWriteResponse(BaseModel):
+    applied: bool
+    created: int
+    updated: int
+    deleted: int
+    failed: int
+    results: List[BulkItemResult]
+
 # Database initialization using lifespan
 from contextlib import asynccontextmanager
 
+async def prepare_schema(fast: bool):
+    """create_all (full) or the alembic_version check (fast)"""
+    if fast:
+        # Migration'lar deploy adımında çalışır; burada DDL yok, yalnızca sürüm kontrolü
+        current, head = await schema_version(), migration_head()
+        if current != head:
+            # Açık bağlantı (aiosqlite thread'i) süreç çıkışını bekletmesin
+            await async_engine.dispose()
+            raise RuntimeError(f"Veritabanı şeması güncel değil ({current} != {head}): önce `alembic upgrade head` çalıştırın")
+    else:
+        create_tables()
+
+async def ensure_admin_user():
+    """Create the default admin if missing; the bcrypt hash is only computed then"""
+    async with AsyncSessionLocal() as db:
+        admin_id = await db.scalar(select(User.id).where(User.username == "admin"))
+        if admin_id is not None:
+            return
+        default_password = os.getenv("ADMIN_DEFAULT_PASSWORD", "SecureAdminPass2024!")
+        admin_user = User(
+            username="admin",
+            email="admin@portfolio.com",
+            hashed_password=await get_password_hash(default_password),
+            is_admin=True
+        )
+        db.add(admin_user)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Aynı anda açılan başka bir worker oluşturdu
+            await db.rollback()
+            return
+        print("✅ Default admin user created with secure password")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    create_tables()
+    fast = startup_mode() == "fast"
+    # gunicorn master'ı bu adımları fork'tan önce bir kez çalıştırdıysa worker'lar atlar
+    if not database_prepared():
+        with startup_timer.phase("schema"):
+            await prepare_schema(fast)
+        
+        with startup_timer.phase("admin"):
+            await ensure_admin_user()
     
-    # Create default admin user if not exists
-    db = SessionLocal()
-    try:
-        admin_user = db.query(User).filter(User.username == "admin").first()
-        if not admin_user:
-            default_password = os.getenv("ADMIN_DEFAULT_PASSWORD", "SecureAdminPass2024!")
-            admin_user = User(
-                username="admin",
-                email="admin@portfolio.com",
-                hashed_password=get_password_hash(default_password),
-                is_admin=True
-            )
-            db.add(admin_user)
-            db.commit()
-            print("✅ Default admin user created with secure password")
-    finally:
-        db.close()
+    with startup_timer.phase("workers"):
+        await revalidation_queue.start()
+        await contact_ingest.start()
+        await read_replicas.start()
+    if SNAPSHOTS_ENABLED:
+        # fast: ilk istekler snapshot'ları beklemez, cache miss yolundan okunur
+        with startup_timer.phase("snapshots"):
+            await snapshot_store.start(warm=not fast)
+    startup_timer.finish()
     
     yield
-    # Shutdown (cleanup if needed)
-
-from database import SessionLocal
+    # Shutdown - bekleyen frontend invalidation'ları gönderilmeden kapanma
+    await contact_ingest.stop()
+    await snapshot_store.stop()
+    await revalidation_queue.stop()
+    await read_replicas.stop()
+    await async_engine.dispose()
 
 # FastAPI uygulaması oluştur
 app = FastAPI(
     title="Portfolio API",
     description="Kişisel portfolyo sitesi için backend API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse
 )
+# Route'lar tanımlanmadan önce: route bazlı in-flight sayacı
+app.router.route_class = InstrumentedRoute
+
+instrument_sql(engine, "primary")
+instrument_sql(async_engine.sync_engine, "primary_async")
+for _name, _replica in replica_engines.items():
+    instrument_sql(_replica.sync_engine, _name)
+if query_diagnostics.enabled:
+    query_diagnostics.instrument(engine, "primary")
+    query_diagnostics.instrument(async_engine.sync_engine, "primary_async")
+    for _name, _replica in replica_engines.items():
+        query_diagnostics.instrument(_replica.sync_engine, _name)
 
 # CORS ayarları - Frontend'den isteklere izin vermek için
 # CORS (Cross-Origin Resource Sharing)
@@ -174,8 +285,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "Content-Encoding", "Server-Timing"],
 )
 
+# gzip / brotli / zstd - cache'teki hazır varyantlar middleware'den olduğu gibi geçer
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_BYTES)
+
 # Security Headers Middleware
 @app.middleware("http")
 async def add_security_headers(request, call_next):
@@ -192,17 +307,168 @@ async def add_security_headers(request, call_next):
     
     return response
 
+# Opt-in: yavaş sorgu / N+1 / sorgu bütçesi (DB_DIAGNOSTICS=true)
+if query_diagnostics.enabled:
+    app.add_middleware(QueryDiagnosticsMiddleware)
+
+# En dışta: süre histogramları, in-flight gauge ve Server-Timing (diğer middleware'ler dahil)
+app.add_middleware(MetricsMiddleware)
+
 # Helper functions
-def convert_tags_to_list(tags_string: Optional[str]) -> List[str]:
-    """Convert JSON string tags to list"""
+def blog_post_to_response(post: BlogPost, include_content: bool = True) -> BlogPostResponse:
+    """Convert a BlogPost row to its response model (content is skipped in summary mode)"""
+    return BlogPostResponse(
+        id=post.id,
+        title=post.title,
+        excerpt=post.excerpt,
+        content=post.content if include_content else None,
+        date=post.created_at.strftime("%Y-%m-%d"),
+        readTime=post.read_time,
+        category=post.category,
+        tags=convert_tags_to_list(post.tags),
+        slug=post.slug
+    )
+
+def project_to_response(project: Project) -> ProjectResponse:
+    """Convert a Project row to its response model"""
+    return ProjectResponse(
+        id=project.id,
+        name=project.name,
+        description=project.description,
+        technologies=convert_tags_to_list(project.technologies),
+        github=project.github,
+        demo=project.demo
+    )
+
+# Conditional GET helpers (ETag / Last-Modified)
+def is_not_modified(request: Request, headers: dict) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against response headers"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match weak comparison kullanır (RFC 9110 13.1.2)
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return headers.get("ETag") in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "Last-Modified" in headers:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return parsedate_to_datetime(headers["Last-Modified"]) <= as_utc(since)
+    return False
+
+# Aynı anahtar için eşzamanlı cache miss'lerde tek bir build çalışır (cache stampede)
+_inflight_builds = {}
+
+async def _build_cache_entry(key: str, tag: str, build, headers: dict, ttl_seconds: Optional[float] = None):
+    generation = response_cache.generation(tag)
+    payload = await build()
+    last_modified = headers.pop("last_modified", None)
+    return response_cache.store(key, tag, payload, generation, headers, last_modified, ttl_seconds=ttl_seconds)
+
+# Aynı girdinin aynı varyantı eşzamanlı isteklerde bir kez sıkıştırılır
+_inflight_variants = {}
+
+async def _cached_variant(key: str, entry, encoding: str) -> Optional[bytes]:
+    """Compressed body of a cache entry, compressed once and stored on first use"""
+    data = entry.encoded.get(encoding)
+    if data is not None:
+        compression_stats.served(encoding)
+        return data
+    inflight_key = (id(entry), encoding)
+    task = _inflight_variants.get(inflight_key)
+    if task is None:
+        # Yüksek seviyeli sıkıştırma event loop'u bloklamasın
+        task = asyncio.ensure_future(asyncio.to_thread(compress_body, entry.body, encoding, "cache"))
+        _inflight_variants[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight_variants.pop(inflight_key, None))
+    data = await asyncio.shield(task)
+    if len(data) >= len(entry.body):
+        return None
+    if encoding not in entry.encoded:
+        response_cache.add_variant(key, entry, encoding, data)
+    return data
+
+async def cached_json_response(
+    request: Request, key: str, tag: str, build, headers: Optional[dict] = None,
+    ttl_seconds: Optional[float] = None
+) -> Response:
+    """Serve `key` from response_cache, awaiting `build` (which owns its DB session) on a miss
+
+    `build` may put a `last_modified` datetime into `headers`; a strong ETag is
+    derived from the serialized body. Matching conditional requests get a 304.
+    Bodies above COMPRESSION_MIN_BYTES are sent in the best encoding the client
+    accepts; each variant is compressed once and kept on the cache entry.
+    `ttl_seconds` overrides the cache TTL for this key.
+    """
+    entry = response_cache.get(key)
+    if entry is None:
+        # Yazmadan önce başlamış bir build'e yazmadan sonra gelen istek bağlanmasın
+        inflight_key = (key, response_cache.generation(tag))
+        task = _inflight_builds.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                _build_cache_entry(key, tag, build, {} if headers is None else headers, ttl_seconds)
+            )
+            _inflight_builds[inflight_key] = task
+            task.add_done_callback(lambda _: _inflight_builds.pop(inflight_key, None))
+        entry = await asyncio.shield(task)
+    headers = entry.headers
+    encoding = None
+    if len(entry.body) >= COMPRESSION_MIN_BYTES:
+        encoding = choose_encoding(request.headers.get("accept-encoding"), LEVELS)
+    if encoding:
+        # Her temsilin kendi ETag'i olmalı (RFC 9110 8.8.3)
+        headers = dict(headers)
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = f'{headers["ETag"][:-1]}-{encoding}"'
+    # 304 kararı sıkıştırmadan önce verilir
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    body = entry.body
+    if encoding:
+        body = await _cached_variant(key, entry, encoding)
+        if body is None:
+            body, headers = entry.body, entry.headers
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Pagination helpers (keyset / cursor)
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Encode the (created_at, id) of the last row as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    """Decode a cursor back to (created_at, id), 400 on malformed input"""
     try:
-        return json.loads(tags_string) if tags_string else []
-    except:
-        return []
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Geçersiz cursor")
 
-def convert_tags_to_string(tags_list: List[str]) -> str:
-    """Convert list tags to JSON string"""
-    return json.dumps(tags_list)
+def apply_keyset_cursor(query, model, cursor: Optional[str]):
+    """Order by (created_at DESC, id DESC) and continue after the cursor row"""
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        # Anchor değeri DB'den okunur: SQLite server_default zaman damgalarını
+        # mikro saniyesiz sakladığı için bind edilen datetime ile birebir eşleşmez.
+        # Cursor satırı silinmişse cursor içindeki created_at kullanılır.
+        anchor = func.coalesce(
+            select(model.created_at).where(model.id == item_id).scalar_subquery(),
+            created_at
+        )
+        query = query.where(or_(
+            model.created_at < anchor,
+            and_(model.created_at == anchor, model.id < item_id)
+        ))
+    return query
 
 # Statik veriler kaldırıldı - Artık tamamen database'den çalışıyor
 
@@ -211,12 +477,10 @@ def convert_tags_to_string(tags_list: List[str]) -> str:
 # API Endpoints
 
 # Authentication endpoints
-@app.post("/api/auth/login", response_model=Token)
-async def login(user_credentials: UserLogin, request: Request, db: Session = Depends(get_db)):
+@app.post("/api/auth/login", response_model=Token, dependencies=[Depends(rate_limit("login"))])
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Admin login endpoint with rate limiting"""
-    rate_limit_check(request, max_requests=5, window_minutes=15)  # Strict rate limiting for login
-    
-    user = authenticate_user(db, user_credentials.username, user_credentials.password)
+    user = await authenticate_user(db, user_credentials.username, user_credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -230,220 +494,352 @@ async def login(user_credentials: UserLogin, request: Request, db: Session = Dep
         )
     
     access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
+    access_token = create_user_token(user, expires_delta=access_token_expires)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
+@app.post("/api/auth/logout-all")
+async def logout_all_sessions(
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Kullanıcının verilmiş tüm token'larını iptal et (token_version artırılır)"""
+    await revoke_user_tokens(db, current_user.id)
+    return {"message": "Tüm oturumlar kapatıldı"}
+
 # ==================== ADMIN PANEL ENDPOINTS ====================
 
 # Admin Blog Management
-@app.post("/api/admin/posts", response_model=BlogPostResponse)
+@app.post("/api/admin/posts", response_model=BlogPostResponse, dependencies=[Depends(rate_limit("admin-write", get_current_admin_user))])
 async def create_blog_post(
     post: BlogPostCreate,
-    request: Request,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Yeni blog yazısı oluştur (Admin only)"""
-    # Rate limiting for admin operations
-    rate_limit_check(request, max_requests=10, window_minutes=60)  # 10 işlem/saat
-    db_post = BlogPost(
-        title=post.title,
-        content=post.content,
-        excerpt=post.excerpt,
-        category=post.category,
-        tags=convert_tags_to_string(post.tags),
-        read_time=post.read_time,
-        slug=f"{slugify(post.title)}-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        author_id=current_user.id
-    )
-    db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
+    async def apply():
+        db_post = BlogPost(
+            title=post.title,
+            content=post.content,
+            excerpt=post.excerpt,
+            category=post.category,
+            tags=normalize_tags(post.tags),
+            read_time=post.read_time,
+            slug=await reserve_slug(db, post.title),
+            author_id=current_user.id
+        )
+        db.add(db_post)
+        await sync_tag_rows(db, db_post)
+        await index_item(db, db_post)
+        return db_post
+    
+    db_post = await with_slug_retry(db, apply)
+    await db.refresh(db_post)
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("blog-posts")
+    invalidate_frontend_cache("blog-posts")
     
     # Convert back to response format
-    return BlogPostResponse(
-        id=db_post.id,
-        title=db_post.title,
-        excerpt=db_post.excerpt,
-        content=db_post.content,
-        date=db_post.created_at.strftime("%Y-%m-%d"),
-        readTime=db_post.read_time,
-        category=db_post.category,
-        tags=convert_tags_to_list(db_post.tags),
-        slug=db_post.slug
-    )
+    return blog_post_to_response(db_post)
 
 @app.put("/api/admin/posts/{post_id}", response_model=BlogPostResponse)
 async def update_blog_post(
     post_id: int,
     post: BlogPostCreate,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Blog yazısını güncelle (Admin only)"""
-    db_post = db.query(BlogPost).filter(BlogPost.id == post_id).first()
-    if not db_post:
-        raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
-    
-    # Başlık değiştiyse slug'ı da güncelle
-    if post.title != db_post.title:
-        db_post.slug = f"{slugify(post.title)}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    async def apply():
+        db_post = await db.get(BlogPost, post_id)
+        if not db_post:
+            raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+        
+        # Başlık değiştiyse slug'ı da güncelle; eski slug yeni adrese yönlenir
+        if post.title != db_post.title:
+            new_slug = await reserve_slug(db, post.title, db_post.id)
+            await record_redirects(db, [(db_post.id, db_post.slug, new_slug)])
+            db_post.slug = new_slug
 
-    # Update fields
-    for field, value in post.dict().items():
-        if field == "tags":
-            setattr(db_post, field, convert_tags_to_string(value))
-        else:
-            setattr(db_post, field, value)
+        # Update fields
+        for field, value in post.dict().items():
+            if field == "tags":
+                setattr(db_post, field, normalize_tags(value))
+            else:
+                setattr(db_post, field, value)
+        await sync_tag_rows(db, db_post)
+        await index_item(db, db_post)
+        return db_post
     
-    db.commit()
-    db.refresh(db_post)
+    db_post = await with_slug_retry(db, apply)
+    await db.refresh(db_post)
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("blog-posts")
+    invalidate_frontend_cache("blog-posts")
     
-    return BlogPostResponse(
-        id=db_post.id,
-        title=db_post.title,
-        excerpt=db_post.excerpt,
-        content=db_post.content,
-        date=db_post.created_at.strftime("%Y-%m-%d"),
-        readTime=db_post.read_time,
-        category=db_post.category,
-        tags=convert_tags_to_list(db_post.tags),
-        slug=db_post.slug
-    )
+    return blog_post_to_response(db_post)
 
 @app.delete("/api/admin/posts/{post_id}")
 async def delete_blog_post(
     post_id: int,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Blog yazısını sil (Admin only)"""
-    db_post = db.query(BlogPost).filter(BlogPost.id == post_id).first()
+    db_post = await db.get(BlogPost, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
     
-    db.delete(db_post)
-    db.commit()
+    await delete_tag_rows(db, db_post)
+    await remove_item(db, db_post)
+    await delete_redirects(db, [db_post.id])
+    await db.delete(db_post)
+    await db.commit()
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("blog-posts")
+    invalidate_frontend_cache("blog-posts")
     
     return {"message": "Blog yazısı başarıyla silindi"}
 
+async def finish_bulk_write(db: AsyncSession, results: List[dict], applied: bool, atomic: bool, tag: str):
+    """Commit a bulk batch, invalidate caches once and build the per-item report"""
+    if applied:
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="Toplu işlem veritabanı kısıtına takıldı, hiçbir değişiklik uygulanmadı")
+        invalidate_frontend_cache(tag)
+    else:
+        await db.rollback()
+    statuses = [result["status"] for result in results]
+    response = BulkWriteResponse(
+        applied=applied,
+        created=statuses.count("created"),
+        updated=statuses.count("updated"),
+        deleted=statuses.count("deleted"),
+        failed=statuses.count("not_found") + statuses.count("duplicate"),
+        results=[BulkItemResult(**result) for result in results]
+    )
+    if atomic and response.failed:
+        # atomic batch iptal edildi
+        return JSONResponse(status_code=409, content=response.dict())
+    return response
+
+@app.post("/api/admin/posts/bulk", response_model=BulkWriteResponse, dependencies=[Depends(rate_limit("admin-write", get_current_admin_user))])
+async def bulk_write_blog_posts(
+    batch: BlogPostBulkRequest,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Blog yazılarını toplu oluştur / güncelle / sil - Tek transaction, tek cache temizleme (Admin only)"""
+    async def apply():
+        upserts = [item.dict() for item in batch.upserts]
+        # Tüm batch'in slug'ları tek sorguyla ayrılır; yalnızca yeni ve başlığı değişen yazılarda kullanılır
+        slugs = await reserve_slugs(db, [values["title"] for values in upserts], [values.get("id") for values in upserts])
+        for values, slug in zip(upserts, slugs):
+            values["_slug"] = slug
+        renames = []
+        
+        def prepare(values: dict, existing):
+            slug = values.pop("_slug")
+            if existing is None:
+                values["slug"] = slug
+                values["author_id"] = current_user.id
+            elif values["title"] != existing.title:
+                values["slug"] = slug
+                renames.append((existing.id, existing.slug, slug))
+        
+        await delete_redirects(db, batch.deletes)
+        results, applied = await apply_bulk(db, BlogPost, upserts, batch.deletes, prepare, batch.atomic)
+        if applied:
+            await record_redirects(db, renames)
+        return results, applied
+    
+    results, applied = await with_slug_retry(db, apply, commit=False)
+    return await finish_bulk_write(db, results, applied, batch.atomic, "blog-posts")
+
 # Admin Project Management
 @app.post("/api/admin/projects", response_model=ProjectResponse)
 async def create_project(
     project: ProjectCreate,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Yeni proje oluştur (Admin only)"""
     db_project = Project(
         name=project.name,
         description=project.description,
-        technologies=convert_tags_to_string(project.technologies),
+        technologies=normalize_tags(project.technologies),
         github=project.github,
         demo=project.demo
     )
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await sync_tag_rows(db, db_project)
+    await index_item(db, db_project)
+    await db.commit()
+    await db.refresh(db_project)
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("projects")
+    invalidate_frontend_cache("projects")
     
-    return ProjectResponse(
-        id=db_project.id,
-        name=db_project.name,
-        description=db_project.description,
-        technologies=convert_tags_to_list(db_project.technologies),
-        github=db_project.github,
-        demo=db_project.demo
-    )
+    return project_to_response(db_project)
 
 @app.put("/api/admin/projects/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: int,
     project: ProjectCreate,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Projeyi güncelle (Admin only)"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
+    db_project = await db.get(Project, project_id)
     if not db_project:
         raise HTTPException(status_code=404, detail="Proje bulunamadı")
     
     # Update fields
     for field, value in project.dict().items():
         if field == "technologies":
-            setattr(db_project, field, convert_tags_to_string(value))
+            setattr(db_project, field, normalize_tags(value))
         else:
             setattr(db_project, field, value)
+    await sync_tag_rows(db, db_project)
+    await index_item(db, db_project)
     
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await db.refresh(db_project)
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("projects")
+    invalidate_frontend_cache("projects")
     
-    return ProjectResponse(
-        id=db_project.id,
-        name=db_project.name,
-        description=db_project.description,
-        technologies=convert_tags_to_list(db_project.technologies),
-        github=db_project.github,
-        demo=db_project.demo
-    )
+    return project_to_response(db_project)
 
 @app.delete("/api/admin/projects/{project_id}")
 async def delete_project(
     project_id: int,
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Projeyi sil (Admin only)"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
+    db_project = await db.get(Project, project_id)
     if not db_project:
         raise HTTPException(status_code=404, detail="Proje bulunamadı")
     
-    db.delete(db_project)
-    db.commit()
+    await delete_tag_rows(db, db_project)
+    await remove_item(db, db_project)
+    await db.delete(db_project)
+    await db.commit()
     
     # Frontend cache'ini temizle
-    await invalidate_frontend_cache("projects")
+    invalidate_frontend_cache("projects")
     
     return {"message": "Proje başarıyla silindi"}
 
+@app.post("/api/admin/projects/bulk", response_model=BulkWriteResponse, dependencies=[Depends(rate_limit("admin-write", get_current_admin_user))])
+async def bulk_write_projects(
+    batch: ProjectBulkRequest,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Projeleri toplu oluştur / güncelle / sil / sırala - Tek transaction, tek cache temizleme (Admin only)"""
+    def prepare(values: dict, existing):
+        # display_order verilmezse mevcut sıra (yeni kayıtta varsayılan) korunur
+        if values.get("display_order") is None:
+            values.pop("display_order", None)
+    
+    results, applied = await apply_bulk(
+        db, Project, [item.dict() for item in batch.upserts], batch.deletes, prepare, batch.atomic
+    )
+    return await finish_bulk_write(db, results, applied, batch.atomic, "projects")
+
 # Admin Contact Messages
 @app.get("/api/admin/messages")
 async def get_contact_messages(
-    current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    response: Response,
+    is_read: Optional[bool] = Query(None, description="false: yalnızca okunmamış mesajlar"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Tüm iletişim mesajlarını getir (Admin only)"""
-    messages = db.query(ContactMessage).all()
+    """İletişim mesajlarını en yeniden eskiye sayfalı getir (Admin only)
+
+    Bir sonraki sayfanın cursor'ı `X-Next-Cursor` header'ında gönderilir.
+    """
+    query = select(
+        ContactMessage.id, ContactMessage.name, ContactMessage.email, ContactMessage.subject,
+        ContactMessage.message, ContactMessage.is_read, ContactMessage.created_at
+    )
+    if is_read is not None:
+        query = query.where(ContactMessage.is_read == is_read)
+    query = apply_keyset_cursor(query, ContactMessage, cursor)
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
     return [
         {
-            "id": msg.id,
-            "name": msg.name,
-            "email": msg.email,
-            "subject": msg.subject,
-            "message": msg.message,
-            "created_at": msg.created_at
-        } for msg in messages
+            "id": row.id,
+            "name": row.name,
+            "email": row.email,
+            "subject": row.subject,
+            "message": row.message,
+            "is_read": bool(row.is_read),
+            "created_at": row.created_at
+        } for row in rows
     ]
 
+@app.get("/api/admin/messages/count")
+async def get_contact_message_count(
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Toplam ve okunmamış mesaj sayısı (Admin only) - tek aggregate sorgu"""
+    total, unread = (await db.execute(
+        select(func.count(), func.count().filter(ContactMessage.is_read == false()))
+        .select_from(ContactMessage)
+    )).one()
+    return {"total": total, "unread": unread}
+
+@app.post("/api/admin/messages/bulk")
+async def bulk_update_contact_messages(
+    batch: ContactMessageBulkRequest,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Mesajları toplu okundu / okunmadı işaretle veya sil (Admin only)"""
+    ids = list(dict.fromkeys(batch.ids))
+    if batch.action == "delete":
+        statement = delete(ContactMessage).where(ContactMessage.id.in_(ids))
+    else:
+        statement = (
+            update(ContactMessage)
+            .where(ContactMessage.id.in_(ids))
+            .values(is_read=batch.action == "read")
+        )
+    result = await db.execute(statement.execution_options(synchronize_session=False))
+    await db.commit()
+    response_cache.invalidate(ADMIN_STATS_TAG)
+    return {"action": batch.action, "requested": len(ids), "affected": result.rowcount}
+
+@app.get("/api/admin/stats")
+async def get_admin_stats(
+    request: Request,
+    days: int = Query(STATS_DEFAULT_DAYS, ge=1, le=STATS_MAX_DAYS, description="messages.by_day için gün sayısı"),
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """Dashboard sayaçları - tek aggregate sorgu, kısa süreli cache'li (Admin only)"""
+    async def build():
+        # Admin okumaları replikadaki gecikmeyi görmesin
+        async with AsyncSessionLocal() as db:
+            return await compute_admin_stats(db, days)
+    
+    return await cached_json_response(
+        request, admin_stats_key(days), ADMIN_STATS_TAG, build, ttl_seconds=ADMIN_STATS_TTL_SECONDS
+    )
+
 @app.get("/api/auth/me")
-async def get_current_user_info(current_user: User = Depends(get_current_admin_user)):
+async def get_current_user_info(current_user: Principal = Depends(get_current_admin_user)):
     """Get current admin user info"""
     return {
         "id": current_user.id,
@@ -461,120 +857,193 @@ async def root():
     }
 
 # Blog endpoints
+# Public GET'ler response_cache üzerinden okunur; DB session'ı yalnızca cache miss'te açılır
+# (DATABASE_READ_URLS ayarlıysa bir read replica'dan, bkz. replicas.py).
+# Satırlar Core select ile okunup doğrudan dict'e çevrilir (ORM nesnesi / pydantic yok);
+# varsayılan anahtarlar snapshot_store tarafından önceden doldurulur.
 @app.get("/api/posts", response_model=List[BlogPostResponse])
-async def get_blog_posts(db: Session = Depends(get_db)):
-    """Tüm blog yazılarını getir - Sadece database'den"""
-    db_posts = db.query(BlogPost).all()
+async def get_blog_posts(
+    request: Request,
+    fields: str = Query("full", pattern="^(full|summary)$", description="summary: content alanı SELECT'e dahil edilmez"),
+    category: Optional[str] = None,
+    tag: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Blog yazılarını getir - Opsiyonel cursor pagination, summary modu ve filtreler
+
+    `limit` veya `cursor` verilmezse tüm yazılar döner. Sayfalı modda bir sonraki
+    sayfanın cursor'ı `X-Next-Cursor` header'ında gönderilir.
+    """
+    include_content = fields == "full"
+    headers = {}
     
-    # Convert database posts to response format
-    return [
-        BlogPostResponse(
-            id=post.id,
-            title=post.title,
-            excerpt=post.excerpt,
-            content=post.content,
-            date=post.created_at.strftime("%Y-%m-%d"),
-            readTime=post.read_time,
-            category=post.category,
-            tags=convert_tags_to_list(post.tags),
-            slug=post.slug
-        ) for post in db_posts
-    ]
+    async def build():
+        async with read_replicas.session("blog-posts") as db:
+            query = select(*(POST_COLUMNS if include_content else POST_SUMMARY_COLUMNS))
+            if category:
+                query = query.where(BlogPost.category == category)
+            if tag:
+                query = query.where(tag_filter(BlogPost, tag))
+            query = apply_keyset_cursor(query, BlogPost, cursor)
+            
+            if limit is None and cursor is None:
+                rows = (await db.execute(query)).all()
+            else:
+                page_size = limit or DEFAULT_PAGE_SIZE
+                rows = (await db.execute(query.limit(page_size + 1))).all()
+                if len(rows) > page_size:
+                    rows = rows[:page_size]
+                    last_row = rows[-1]
+                    headers["X-Next-Cursor"] = encode_cursor(last_row.created_at, last_row.id)
+            
+            headers["last_modified"] = collection_last_modified(rows, "blog-posts")
+            return [post_payload(row, include_content) for row in rows]
+    
+    key = posts_key(fields, category, tag, limit, cursor)
+    return await cached_json_response(request, key, "blog-posts", build, headers)
 
 @app.get("/api/posts/{post_id}", response_model=BlogPostResponse)
-async def get_blog_post(post_id: int, db: Session = Depends(get_db)):
+async def get_blog_post(post_id: int, request: Request):
     """Belirli bir blog yazısını getir - Database'den"""
-    db_post = db.query(BlogPost).filter(BlogPost.id == post_id).first()
-    if not db_post:
-        raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+    headers = {}
     
-    return BlogPostResponse(
-        id=db_post.id,
-        title=db_post.title,
-        excerpt=db_post.excerpt,
-        content=db_post.content,
-        date=db_post.created_at.strftime("%Y-%m-%d"),
-        readTime=db_post.read_time,
-        category=db_post.category,
-        tags=convert_tags_to_list(db_post.tags),
-        slug=db_post.slug
-    )
+    async def build():
+        async with read_replicas.session("blog-posts") as db:
+            row = (await db.execute(select(*POST_COLUMNS).where(BlogPost.id == post_id))).first()
+            if not row:
+                raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+            headers["last_modified"] = row_last_modified(row)
+            return post_payload(row)
+    
+    return await cached_json_response(request, post_key(post_id), "blog-posts", build, headers)
 
 @app.get("/api/posts/slug/{slug}", response_model=BlogPostResponse)
-async def get_blog_post_by_slug(slug: str, db: Session = Depends(get_db)):
+async def get_blog_post_by_slug(slug: str, request: Request):
     """Slug ile blog yazısını getir - Database'den"""
-    db_post = db.query(BlogPost).filter(BlogPost.slug == slug).first()
-    if not db_post:
-        raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+    headers = {}
     
-    return BlogPostResponse(
-        id=db_post.id,
-        title=db_post.title,
-        excerpt=db_post.excerpt,
-        content=db_post.content,
-        date=db_post.created_at.strftime("%Y-%m-%d"),
-        readTime=db_post.read_time,
-        category=db_post.category,
-        tags=convert_tags_to_list(db_post.tags),
-        slug=db_post.slug
-    )
+    async def build():
+        async with read_replicas.session("blog-posts") as db:
+            # Yeniden adlandırılan yazılar eski slug'larıyla da bulunur (yanıttaki slug günceldir)
+            row = (await db.execute(resolve_slug_query(POST_COLUMNS, slug))).first()
+            if not row:
+                raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+            headers["last_modified"] = row_last_modified(row)
+            return post_payload(row)
+    
+    return await cached_json_response(request, post_slug_key(slug), "blog-posts", build, headers)
 
 # Projects endpoints
 @app.get("/api/projects", response_model=List[ProjectResponse])
-async def get_projects(db: Session = Depends(get_db)):
-    """Tüm projeleri getir - Sadece database'den"""
-    db_projects = db.query(Project).all()
+async def get_projects(request: Request, technology: Optional[str] = None):
+    """Tüm projeleri getir - Opsiyonel teknoloji filtresi SQL'de uygulanır"""
+    headers = {}
     
-    # Convert database projects to response format
-    return [
-        ProjectResponse(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            technologies=convert_tags_to_list(project.technologies),
-            github=project.github,
-            demo=project.demo
-        ) for project in db_projects
-    ]
+    async def build():
+        async with read_replicas.session("projects") as db:
+            query = select(*PROJECT_COLUMNS).order_by(*PROJECT_ORDER)
+            if technology:
+                query = query.where(tag_filter(Project, technology))
+            rows = (await db.execute(query)).all()
+            headers["last_modified"] = collection_last_modified(rows, "projects")
+            return [project_payload(row) for row in rows]
+    
+    return await cached_json_response(request, projects_key(technology), "projects", build, headers)
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, request: Request):
     """Belirli bir projeyi getir - Database'den"""
-    db_project = db.query(Project).filter(Project.id == project_id).first()
-    if not db_project:
-        raise HTTPException(status_code=404, detail="Proje bulunamadı")
+    headers = {}
     
-    return ProjectResponse(
-        id=db_project.id,
-        name=db_project.name,
-        description=db_project.description,
-        technologies=convert_tags_to_list(db_project.technologies),
-        github=db_project.github,
-        demo=db_project.demo
-    )
+    async def build():
+        async with read_replicas.session("projects") as db:
+            row = (await db.execute(select(*PROJECT_COLUMNS).where(Project.id == project_id))).first()
+            if not row:
+                raise HTTPException(status_code=404, detail="Proje bulunamadı")
+            headers["last_modified"] = row_last_modified(row)
+            return project_payload(row)
+    
+    return await cached_json_response(request, project_key(project_id), "projects", build, headers)
 
-# Contact endpoint
-@app.post("/api/contact")
-async def send_contact_message(
-    message: ContactMessageCreate, 
-    request: Request,
-    db: Session = Depends(get_db)
+# Tag endpoints - sayımlar SQL'de (GROUP BY) yapılır
+@app.get("/api/tags", response_model=List[TagCount])
+async def get_blog_tags(request: Request):
+    """Blog yazılarındaki tag'leri kullanım sayısıyla getir"""
+    async def build():
+        async with read_replicas.session("blog-posts") as db:
+            rows = (await db.execute(tag_counts_query(BlogPost))).all()
+            return [TagCount(tag=row.tag, count=row.count) for row in rows]
+    
+    return await cached_json_response(request, "tags", "blog-posts", build)
+
+@app.get("/api/technologies", response_model=List[TagCount])
+async def get_project_technologies(request: Request):
+    """Projelerde kullanılan teknolojileri proje sayısıyla getir"""
+    async def build():
+        async with read_replicas.session("projects") as db:
+            rows = (await db.execute(tag_counts_query(Project))).all()
+            return [TagCount(tag=row.tag, count=row.count) for row in rows]
+    
+    return await cached_json_response(request, "technologies", "projects", build)
+
+# Search endpoint
+@app.get("/api/search", response_model=SearchResponse, dependencies=[Depends(rate_limit("search"))])
+async def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    type: str = Query("all", pattern="^(all|posts|projects)$"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=1000),
+    db: AsyncSession = Depends(read_db("blog-posts", "projects"))
 ):
-    """İletişim formu mesajı gönder"""
-    # Rate limiting for contact form
-    rate_limit_check(request, max_requests=3, window_minutes=60)  # 3 mesaj/saat
-    # Save to database
-    db_message = ContactMessage(
-        name=message.name,
-        email=message.email,
-        subject=message.subject,
-        message=message.message
+    """Blog yazıları ve projelerde full-text arama - Sıralı, sayfalı ve vurgulu sonuçlar"""
+    results, has_more = await search_content(db, q, type, limit, offset)
+    return SearchResponse(
+        query=q,
+        results=[SearchResult(**result) for result in results],
+        next_offset=offset + limit if has_more else None
     )
-    db.add(db_message)
-    db.commit()
+
+# Export endpoints - yedek ve statik prebuild için tüm içerik stream edilir (cache'lenmez)
+def export_response(kind: str, format: str, updated_since: Optional[datetime]) -> StreamingResponse:
+    return StreamingResponse(
+        export_stream(kind, format, updated_since),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Cache-Control": "no-store",
+            "Content-Disposition": f'attachment; filename="{kind}.{format}"'
+        }
+    )
+
+@app.get("/api/export/posts", dependencies=[Depends(rate_limit("export"))])
+async def export_blog_posts(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    updated_since: Optional[datetime] = Query(None, description="Yalnızca bu zamandan sonra oluşturulan / güncellenen kayıtlar")
+):
+    """Tüm blog yazılarını (içerikleriyle) NDJSON veya JSON dizisi olarak stream et"""
+    return export_response("posts", format, updated_since)
+
+@app.get("/api/export/projects", dependencies=[Depends(rate_limit("export"))])
+async def export_projects(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    updated_since: Optional[datetime] = Query(None, description="Yalnızca bu zamandan sonra oluşturulan / güncellenen kayıtlar")
+):
+    """Tüm projeleri NDJSON veya JSON dizisi olarak stream et"""
+    return export_response("projects", format, updated_since)
+
+# Contact endpoint
+@app.post("/api/contact", dependencies=[Depends(rate_limit("contact"))])
+async def send_contact_message(message: ContactMessageCreate):
+    """İletişim formu mesajı gönder
+
+    Mesaj kuyruğa alınıp arka planda toplu kaydedilir (CONTACT_INGEST_MODE=sync:
+    istek içinde). Tekrar / spam olarak elenen mesajlara da aynı yanıt döner; bu
+    yüzden yanıt kaydı değil yalnızca alındığını bildirir.
+    """
+    await contact_ingest.submit(message.dict())
     
     return {
-        "message": "Mesajınız başarıyla alındı ve kaydedildi!",
+        "message": "Mesajınız alındı!",
         "data": {
             "name": message.name,
             "email": message.email,
@@ -582,11 +1051,31 @@ async def send_contact_message(
         }
     }
 
+# Metrics (Prometheus text format) - alt sistemler sırayla tek çıktıda
+metrics_registry.register(
+    response_cache.render_metrics, snapshot_store.render_metrics, compression_stats.render_metrics,
+    rate_limiter.render_metrics, principal_cache.render_metrics, password_hasher.render_metrics,
+    render_pool_metrics, revalidation_queue.render_metrics, contact_ingest.render_metrics,
+    startup_timer.render_metrics
+)
+if query_diagnostics.enabled:
+    metrics_registry.register(query_diagnostics.render_metrics)
+if read_replicas.enabled:
+    metrics_registry.register(read_replicas.render_metrics)
+
+# Havuz boyutları, replika adları, route listesi ve sayaçlar public değildir
+@app.get("/metrics", dependencies=[Depends(get_metrics_reader)])
+async def metrics():
+    """Scrape edilebilir performans sayaçları (METRICS_TOKEN veya admin token'ı)"""
+    return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
 # Health check
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+startup_timer.mark_imported()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,222 @@
+# backend/metrics.py
+"""
+İstek bazlı performans ölçümü ve /metrics için Prometheus metin çıktısı.
+
+- MetricsMiddleware: route bazlı süre histogramı, in-flight gauge ve
+  `Server-Timing` header'ı (db / serialize / total)
+- instrument_sql: SQLAlchemy cursor event'leriyle sorgu sayısı ve süresi; değerler
+  o an işlenen isteğin RequestTiming'ine (contextvar) eklenir
+- metrics_registry: alt sistemlerin render_metrics() fonksiyonlarını tek
+  çıktıda birleştirir
+"""
+import contextvars
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING", "true").lower() in ("1", "true", "yes")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+class RequestTiming:
+    """Time spent by one request, filled in by SQL events and serializers"""
+
+    __slots__ = ("started", "db_queries", "db_seconds", "serialize_seconds")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    def server_timing(self) -> str:
+        total = (time.perf_counter() - self.started) * 1000
+        return (
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries", '
+            f"serialize;dur={self.serialize_seconds * 1000:.1f}, total;dur={total:.1f}"
+        )
+
+# İstek içinde başlatılan task / thread'ler de aynı RequestTiming nesnesini görür
+current_timing: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar("current_timing", default=None)
+
+def record_serialize(seconds: float):
+    """Add JSON encoding time to the current request (no-op outside requests)"""
+    timing = current_timing.get()
+    if timing is not None:
+        timing.serialize_seconds += seconds
+
+class Histogram:
+    """Prometheus histogram keyed by a label tuple"""
+
+    def __init__(self, name: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> [bucket sayaçları..., sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+                break
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            label_text = ",".join(f'{name}="{value}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {series[-1]}")
+        return lines
+
+class RequestMetrics:
+    """Per-route latency / SQL histograms and in-flight gauges"""
+
+    def __init__(self):
+        self.duration = Histogram("portfolio_http_request_duration_seconds", ("method", "route", "status"), LATENCY_BUCKETS)
+        self.db_queries = Histogram("portfolio_http_request_db_queries", ("method", "route"), QUERY_COUNT_BUCKETS)
+        self.db_seconds = Histogram("portfolio_http_request_db_seconds", ("method", "route"), LATENCY_BUCKETS)
+        self.serialize_seconds = Histogram("portfolio_http_request_serialize_seconds", ("method", "route"), LATENCY_BUCKETS)
+        self.in_flight = 0
+        self.route_in_flight: Dict[str, int] = {}
+        self._sql_lock = threading.Lock()
+        # engine adı -> [sorgu sayısı, toplam süre]
+        self.sql: Dict[str, list] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, timing: RequestTiming):
+        self.duration.observe((method, route, str(status)), seconds)
+        self.db_queries.observe((method, route), timing.db_queries)
+        self.db_seconds.observe((method, route), timing.db_seconds)
+        self.serialize_seconds.observe((method, route), timing.serialize_seconds)
+
+    def record_sql(self, engine_name: str, seconds: float):
+        # Sync engine sorguları thread pool'dan da gelebilir
+        with self._sql_lock:
+            totals = self.sql.setdefault(engine_name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of request and SQL timings"""
+        lines = self.duration.render() + self.db_queries.render() + self.db_seconds.render() + self.serialize_seconds.render()
+        lines.append("# TYPE portfolio_http_requests_in_flight gauge")
+        lines.append(f"portfolio_http_requests_in_flight {self.in_flight}")
+        lines.append("# TYPE portfolio_http_route_requests_in_flight gauge")
+        lines += [f'portfolio_http_route_requests_in_flight{{route="{route}"}} {count}' for route, count in sorted(self.route_in_flight.items())]
+        with self._sql_lock:
+            sql = sorted(self.sql.items())
+        lines.append("# TYPE portfolio_db_queries_total counter")
+        lines += [f'portfolio_db_queries_total{{engine="{name}"}} {count}' for name, (count, _) in sql]
+        lines.append("# TYPE portfolio_db_query_seconds_total counter")
+        lines += [f'portfolio_db_query_seconds_total{{engine="{name}"}} {seconds:.6f}' for name, (_, seconds) in sql]
+        return "\n".join(lines) + "\n"
+
+request_metrics = RequestMetrics()
+
+def instrument_sql(target, name: str):
+    """Count and time every statement of an engine (pass `async_engine.sync_engine` for async)"""
+
+    @event.listens_for(target, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        request_metrics.record_sql(name, elapsed)
+        timing = current_timing.get()
+        if timing is not None:
+            timing.db_queries += 1
+            timing.db_seconds += elapsed
+
+class TimedJSONResponse(JSONResponse):
+    """Default response class; JSON encoding time goes to the serialize timing"""
+
+    def render(self, content) -> bytes:
+        started = time.perf_counter()
+        body = super().render(content)
+        record_serialize(time.perf_counter() - started)
+        return body
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute that tracks in-flight requests per route template"""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        route = self.path
+        in_flight = request_metrics.route_in_flight
+        in_flight.setdefault(route, 0)
+
+        async def instrumented_handler(request):
+            in_flight[route] += 1
+            try:
+                return await handler(request)
+            finally:
+                in_flight[route] -= 1
+
+        return instrumented_handler
+
+class MetricsMiddleware:
+    """Outermost ASGI middleware: request histograms, in-flight gauge and Server-Timing"""
+
+    def __init__(self, app, server_timing: bool = SERVER_TIMING_ENABLED):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timing = RequestTiming()
+        token = current_timing.set(timing)
+        status_code = 500
+        request_metrics.in_flight += 1
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", timing.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timing.reset(token)
+            request_metrics.in_flight -= 1
+            # Eşleşmeyen path'ler (404 taramaları) tek etikette toplanır
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            request_metrics.observe(scope["method"], route, status_code, time.perf_counter() - timing.started, timing)
+
+class MetricsRegistry:
+    """Ordered collection of render_metrics() callables exposed at /metrics"""
+
+    def __init__(self):
+        self._collectors: List[Callable[[], str]] = []
+
+    def register(self, *collectors: Callable[[], str]):
+        self._collectors.extend(collectors)
+
+    def render(self) -> str:
+        return "".join(collector() for collector in self._collectors)
+
+metrics_registry = MetricsRegistry()
+metrics_registry.register(request_metrics.render_metrics)
@@ -0,0 +1,39 @@
+# backend/migrations/env.py
+from logging.config import fileConfig
+
+from alembic import context
+
+from database import Base, engine
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline():
+    """Generate SQL without a live connection (`alembic upgrade head --sql`)"""
+    context.configure(
+        url=str(engine.url.render_as_string(hide_password=False)),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    # SQLite ALTER TABLE kısıtları için batch mode kullanılır
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
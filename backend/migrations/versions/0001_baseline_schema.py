@@ -0,0 +1,84 @@
+"""baseline schema (create_tables() ile oluşturulan ilk şema)
+
+Mevcut veritabanları için: `alembic stamp 0001` ve ardından `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("hashed_password", sa.String(128), nullable=False),
+        sa.Column("is_admin", sa.Boolean()),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "blog_posts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("excerpt", sa.Text(), nullable=False),
+        sa.Column("content", sa.Text()),
+        sa.Column("slug", sa.String(250), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("tags", sa.Text()),
+        sa.Column("read_time", sa.String(20), nullable=False),
+        sa.Column("is_published", sa.Boolean()),
+        sa.Column("author_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_blog_posts_id", "blog_posts", ["id"])
+    op.create_index("ix_blog_posts_slug", "blog_posts", ["slug"], unique=True)
+
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("technologies", sa.Text()),
+        sa.Column("github", sa.String(500), nullable=False),
+        sa.Column("demo", sa.String(500)),
+        sa.Column("is_featured", sa.Boolean()),
+        sa.Column("display_order", sa.Integer()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_projects_id", "projects", ["id"])
+
+    op.create_table(
+        "contact_messages",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("subject", sa.String(200), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("is_read", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_contact_messages_id", "contact_messages", ["id"])
+
+
+def downgrade():
+    op.drop_table("contact_messages")
+    op.drop_table("projects")
+    op.drop_table("blog_posts")
+    op.drop_table("users")
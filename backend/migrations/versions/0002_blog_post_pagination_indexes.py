@@ -0,0 +1,22 @@
+"""blog_posts keyset pagination ve kategori index'leri
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_blog_posts_created_at_id", "blog_posts", ["created_at", "id"])
+    op.create_index("ix_blog_posts_category_created_at", "blog_posts", ["category", "created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_blog_posts_category_created_at", table_name="blog_posts")
+    op.drop_index("ix_blog_posts_created_at_id", table_name="blog_posts")
@@ -0,0 +1,60 @@
+"""native tag kolonları: PostgreSQL'de JSONB + GIN, SQLite'ta normalize tag tabloları
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (tablo, JSON kolon, tag tablosu, FK kolonu, değer kolonu)
+TAG_TABLES = [
+    ("blog_posts", "tags", "blog_post_tags", "post_id", "tag"),
+    ("projects", "technologies", "project_technologies", "project_id", "technology"),
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    for table, column, tag_table, fk_column, value_column in TAG_TABLES:
+        op.create_table(
+            tag_table,
+            sa.Column(fk_column, sa.Integer(), sa.ForeignKey(f"{table}.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column(value_column, sa.String(100), primary_key=True),
+        )
+        op.create_index(f"ix_{tag_table}_{value_column}", tag_table, [value_column])
+
+        if bind.dialect.name == "postgresql":
+            # Uygulama her zaman geçerli JSON yazdı; boş/NULL değerler boş listeye çevrilir
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                postgresql_using=(
+                    f"CASE WHEN {column} IS NULL OR {column} = '' "
+                    f"THEN '[]'::jsonb ELSE {column}::jsonb END"
+                ),
+            )
+            op.create_index(f"ix_{table}_{column}_gin", table, [column], postgresql_using="gin")
+        else:
+            # JSON tipi SQLite'ta TEXT olarak kalır; mevcut JSON string'ler tablolara dağıtılır
+            op.execute(
+                f"INSERT OR IGNORE INTO {tag_table} ({fk_column}, {value_column}) "
+                f"SELECT {table}.id, TRIM(je.value) FROM {table}, json_each({table}.{column}) AS je "
+                f"WHERE json_valid({table}.{column}) AND TRIM(je.value) != ''"
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    for table, column, tag_table, fk_column, value_column in TAG_TABLES:
+        if bind.dialect.name == "postgresql":
+            op.drop_index(f"ix_{table}_{column}_gin", table_name=table)
+            op.alter_column(table, column, type_=sa.Text(), postgresql_using=f"{column}::text")
+        op.drop_table(tag_table)
@@ -0,0 +1,81 @@
+"""full-text search: PostgreSQL generated tsvector kolonları, SQLite FTS5 index'i
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTORS = {
+    "blog_posts": """
+        setweight(to_tsvector('turkish', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('turkish', coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('turkish', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C') ||
+        setweight(to_tsvector('english', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C')
+    """,
+    "projects": """
+        setweight(to_tsvector('turkish', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(jsonb_to_tsvector('simple', coalesce(technologies, '[]'::jsonb), '["string"]'), 'B') ||
+        setweight(to_tsvector('turkish', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    """,
+}
+
+
+def _strip_html(value):
+    return re.sub(r"<[^>]+>", " ", value or "")
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table, vector in SEARCH_VECTORS.items():
+            op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED")
+            op.create_index(f"ix_{table}_search_vector", table, ["search_vector"], postgresql_using="gin")
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "kind UNINDEXED, item_id UNINDEXED, title, excerpt, body, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    insert = sa.text(
+        "INSERT INTO search_index (kind, item_id, title, excerpt, body) "
+        "VALUES (:kind, :item_id, :title, :excerpt, :body)"
+    )
+    for row in bind.execute(sa.text("SELECT id, title, excerpt, content FROM blog_posts")):
+        bind.execute(insert, {
+            "kind": "post", "item_id": row.id, "title": row.title,
+            "excerpt": row.excerpt or "", "body": _strip_html(row.content),
+        })
+    for row in bind.execute(sa.text("SELECT id, name, technologies, description FROM projects")):
+        try:
+            technologies = json.loads(row.technologies) if row.technologies else []
+        except ValueError:
+            technologies = []
+        bind.execute(insert, {
+            "kind": "project", "item_id": row.id, "title": row.name,
+            "excerpt": " ".join(technologies), "body": row.description or "",
+        })
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table in SEARCH_VECTORS:
+            op.drop_index(f"ix_{table}_search_vector", table_name=table)
+            op.drop_column(table, "search_vector")
+        return
+    op.execute("DROP TABLE IF EXISTS search_index")
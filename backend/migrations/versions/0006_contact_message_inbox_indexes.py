@@ -0,0 +1,30 @@
+"""contact_messages inbox sayfalama ve okunmamış index'leri
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # is_read filtresi NULL satırları kaçırmasın
+    contact_messages = sa.table("contact_messages", sa.column("is_read", sa.Boolean))
+    op.execute(
+        contact_messages.update()
+        .where(contact_messages.c.is_read.is_(None))
+        .values(is_read=sa.false())
+    )
+    op.create_index("ix_contact_messages_created_at_id", "contact_messages", ["created_at", "id"])
+    op.create_index("ix_contact_messages_is_read_created_at", "contact_messages", ["is_read", "created_at", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_contact_messages_is_read_created_at", table_name="contact_messages")
+    op.drop_index("ix_contact_messages_created_at_id", table_name="contact_messages")
@@ -0,0 +1,43 @@
+"""slug_redirects tablosu ve slug ön ek index'leri
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    op.create_table(
+        "slug_redirects",
+        sa.Column("old_slug", sa.String(250), primary_key=True),
+        sa.Column("post_id", sa.Integer, sa.ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_slug_redirects_post_id", "slug_redirects", ["post_id"])
+    # PostgreSQL: ön ek (range) aramaları varsayılan collation'lı index'i kullanamaz
+    if bind.dialect.name == "postgresql":
+        op.create_index(
+            "ix_blog_posts_slug_pattern", "blog_posts", ["slug"],
+            postgresql_ops={"slug": "text_pattern_ops"}
+        )
+        op.create_index(
+            "ix_slug_redirects_old_slug_pattern", "slug_redirects", ["old_slug"],
+            postgresql_ops={"old_slug": "text_pattern_ops"}
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_index("ix_slug_redirects_old_slug_pattern", table_name="slug_redirects")
+        op.drop_index("ix_blog_posts_slug_pattern", table_name="blog_posts")
+    op.drop_index("ix_slug_redirects_post_id", table_name="slug_redirects")
+    op.drop_table("slug_redirects")
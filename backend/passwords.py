@@ -0,0 +1,132 @@
+# backend/passwords.py
+"""
+bcrypt hash / verify işlemleri için sınırlı worker pool.
+
+bcrypt tek bir doğrulamada onlarca-yüzlerce ms CPU harcar; event loop'ta
+çalıştırılırsa o worker'daki tüm istekler bekler. İşlemler ayrı bir thread
+pool'da yürütülür (bcrypt C kodu GIL'i bırakır), bekleyen iş sayısı sınırlıdır
+ve kuyruk / süre metrikleri /metrics'te raporlanır.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+class PasswordHasher:
+    """bcrypt on a bounded thread pool with queue metrics and rehash detection"""
+
+    def __init__(self, rounds: int = 12, max_workers: int = 2, max_pending: int = 32):
+        self.rounds = rounds
+        self.max_pending = max_pending
+        self._context = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.max_workers = max_workers
+        self.pending = 0  # kuyrukta bekleyen + çalışan
+        self.running = 0
+        self.completed = 0
+        self.failed = 0  # hata veren veya iptal edilen işler
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    @property
+    def context(self):
+        # passlib ilk hash / doğrulamada yüklenir (cold start); iki thread aynı anda kurarsa da zararsız
+        if self._context is None:
+            from passlib.context import CryptContext
+            self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=self.rounds)
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+
+    def after_fork(self):
+        """Fresh thread pool in a forked worker; the parent's threads do not exist here"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True when the hash was made with another cost factor (or scheme)"""
+        try:
+            _, ident, cost, _ = hashed_password.split("$", 3)
+            return ident not in ("2a", "2b", "2y") or int(cost) != self.rounds
+        except ValueError:
+            return True
+
+    async def _submit(self, fn, *args):
+        if self.pending >= self.max_pending:
+            # Login seli bcrypt kuyruğunu sınırsız büyütmesin
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sunucu meşgul, lütfen tekrar deneyin",
+                headers={"Retry-After": "1"}
+            )
+        self.pending += 1
+        queued_at = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+                self.wait_seconds += started - queued_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.run_seconds += time.perf_counter() - started
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(valid, new_hash); new_hash is set when a valid hash should be upgraded"""
+        def verify_and_rehash():
+            if not self.context.verify(password, hashed_password):
+                return False, None
+            if self.needs_rehash(hashed_password):
+                return True, self.context.hash(password)
+            return True, None
+        return await self._submit(verify_and_rehash)
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the hashing pool"""
+        lines = []
+        for name, kind, value in (
+            ("pending", "gauge", self.pending),
+            ("running", "gauge", self.running),
+            ("workers", "gauge", self.max_workers),
+            ("completed_total", "counter", self.completed),
+            ("failed_total", "counter", self.failed),
+            ("rejected_total", "counter", self.rejected),
+            ("queue_wait_seconds_total", "counter", f"{self.wait_seconds:.6f}"),
+            ("run_seconds_total", "counter", f"{self.run_seconds:.6f}"),
+        ):
+            lines.append(f"# TYPE portfolio_password_hasher_{name} {kind}")
+            lines.append(f"portfolio_password_hasher_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+password_hasher = PasswordHasher(
+    rounds=BCRYPT_ROUNDS,
+    max_workers=int(os.getenv("BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    max_pending=int(os.getenv("BCRYPT_MAX_PENDING", "32"))
+)
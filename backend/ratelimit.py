@@ -0,0 +1,222 @@
+# backend/ratelimit.py
+"""
+Route bazlı rate limiting (sliding window counter).
+
+Her (policy, client IP) için yalnızca iki sayaç tutulur: içinde bulunulan sabit
+pencere ve bir önceki pencere. Önceki pencere, geçen süre oranında ağırlıklanarak
+kayan pencere tahmini O(1) hesaplanır; süresi geçen kayıtlar erişildiğinde veya
+sıradan düşerken temizlenir.
+
+Backend'ler:
+- memory: process içi; tek worker için yeterli
+- sqlite: aynı makinedeki tüm worker'ların paylaştığı dosya (gunicorn ile limitler
+  worker sayısıyla çarpılmaz)
+"""
+import asyncio
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    limit: int
+    window_seconds: int
+
+def _policy(name: str, limit: int, window_seconds: int) -> RateLimitPolicy:
+    # RATE_LIMIT_<AD>="<limit>/<saniye>" varsayılanı ezer (ör. RATE_LIMIT_ADMIN_WRITE=20/3600)
+    value = os.getenv(f"RATE_LIMIT_{name.upper().replace('-', '_')}")
+    if value:
+        limit_text, _, window_text = value.partition("/")
+        limit, window_seconds = int(limit_text), int(window_text or window_seconds)
+    return RateLimitPolicy(limit=limit, window_seconds=window_seconds)
+
+# Route policy'leri tek yerde; endpoint'ler Depends(rate_limit("<ad>")) ile kullanır
+RATE_LIMIT_POLICIES: Dict[str, RateLimitPolicy] = {
+    "login": _policy("login", 5, 15 * 60),
+    "admin-write": _policy("admin-write", 10, 60 * 60),
+    "contact": _policy("contact", 3, 60 * 60),
+    "search": _policy("search", 60, 60),
+    "export": _policy("export", 30, 60 * 60),
+}
+
+def sliding_window_hit(
+    state: Tuple[int, int, int], now: float, policy: RateLimitPolicy
+) -> Tuple[Tuple[int, int, int], bool, float]:
+    """Apply one request to (window, current, previous); returns (state, allowed, retry_after)"""
+    window, current, previous = state
+    index = int(now // policy.window_seconds)
+    if index != window:
+        previous = current if index == window + 1 else 0
+        current, window = 0, index
+    elapsed = (now % policy.window_seconds) / policy.window_seconds
+    if previous * (1 - elapsed) + current + 1 <= policy.limit:
+        return (window, current + 1, previous), True, 0.0
+    if current + 1 > policy.limit or previous == 0:
+        retry_after = policy.window_seconds * (1 - elapsed)
+    else:
+        # Önceki pencerenin ağırlığı bir istek yer açacak kadar düştüğünde
+        needed = 1 - (policy.limit - 1 - current) / previous
+        retry_after = policy.window_seconds * (needed - elapsed)
+    return (window, current, previous), False, retry_after
+
+class MemoryRateLimitBackend:
+    """Per-process counters; oldest keys are expired lazily from the front of an LRU"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (state, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], float]]" = OrderedDict()
+
+    async def hit(self, key: str, policy: RateLimitPolicy, now: float) -> Tuple[bool, float]:
+        state, _ = self._entries.pop(key, ((0, 0, 0), 0.0))
+        state, allowed, retry_after = sliding_window_hit(state, now, policy)
+        # İki pencere sonra kaydın sayaçlara hiçbir etkisi kalmaz
+        self._entries[key] = (state, (state[0] + 2) * policy.window_seconds)
+        while self._entries:
+            oldest_key, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_keys:
+                break
+            del self._entries[oldest_key]
+        return allowed, retry_after
+
+    def __len__(self):
+        return len(self._entries)
+
+    def after_fork(self):
+        # Sayaçlar zaten süreç başına; parent'tan kopyalananlar atılır
+        self._entries.clear()
+
+class SQLiteRateLimitBackend:
+    """Counters in a SQLite file shared by every worker on the host"""
+
+    SWEEP_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connect()
+        self._hits = 0
+
+    def _connect(self):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, window INTEGER NOT NULL, current INTEGER NOT NULL, "
+            "previous INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_rate_limits_expires_at ON rate_limits (expires_at)")
+
+    def after_fork(self):
+        # SQLite bağlantısı fork ile paylaşılmamalı; parent'ınki kapatılmadan bırakılır
+        self._connect()
+
+    def _hit(self, key: str, policy: RateLimitPolicy, now: float) -> Tuple[bool, float]:
+        with self._lock:
+            # BEGIN IMMEDIATE: oku-değiştir-yaz diğer process'lerle yarışmasın
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT window, current, previous FROM rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                state, allowed, retry_after = sliding_window_hit(row or (0, 0, 0), now, policy)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, window, current, previous, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, *state, (state[0] + 2) * policy.window_seconds)
+                )
+                self._hits += 1
+                if self._hits % self.SWEEP_EVERY == 0:
+                    self._connection.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return allowed, retry_after
+
+    async def hit(self, key: str, policy: RateLimitPolicy, now: float) -> Tuple[bool, float]:
+        return await asyncio.to_thread(self._hit, key, policy, now)
+
+class RateLimiter:
+    """Checks requests against named policies on a pluggable backend"""
+
+    def __init__(self, backend, policies: Dict[str, RateLimitPolicy], enabled: bool = True):
+        self.backend = backend
+        self.policies = policies
+        self.enabled = enabled
+        self.allowed: Dict[str, int] = {name: 0 for name in policies}
+        self.limited: Dict[str, int] = {name: 0 for name in policies}
+
+    def after_fork(self):
+        """Reset per-process backend state in a freshly forked worker"""
+        self.backend.after_fork()
+
+    async def check(self, request: Request, name: str, subject: Optional[str] = None):
+        """Count one request for policy `name`; 429 with Retry-After when over
+
+        Sayaç `subject` (ör. "user:1") verilmişse ona, yoksa client IP'sine göre tutulur.
+        """
+        if not self.enabled:
+            return
+        policy = self.policies[name]
+        if subject is None:
+            subject = request.client.host if request.client else "unknown"
+        allowed, retry_after = await self.backend.hit(f"{name}:{subject}", policy, time.time())
+        if allowed:
+            self.allowed[name] += 1
+            return
+        self.limited[name] += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of allowed / limited requests per policy"""
+        lines = ["# TYPE portfolio_rate_limit_allowed_total counter"]
+        lines += [f'portfolio_rate_limit_allowed_total{{policy="{name}"}} {count}' for name, count in self.allowed.items()]
+        lines.append("# TYPE portfolio_rate_limit_limited_total counter")
+        lines += [f'portfolio_rate_limit_limited_total{{policy="{name}"}} {count}' for name, count in self.limited.items()]
+        return "\n".join(lines) + "\n"
+
+def create_backend(kind: str):
+    if kind == "sqlite":
+        path = os.getenv("RATE_LIMIT_SQLITE_PATH") or os.path.join(tempfile.gettempdir(), "portfolio-ratelimit.db")
+        return SQLiteRateLimitBackend(path)
+    if kind == "memory":
+        return MemoryRateLimitBackend()
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {kind}")
+
+rate_limiter = RateLimiter(
+    create_backend(os.getenv("RATE_LIMIT_BACKEND", "memory")),
+    RATE_LIMIT_POLICIES,
+    enabled=os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+)
+
+def rate_limit(name: str, principal: Optional[Callable] = None):
+    """FastAPI dependency enforcing the named policy
+
+    `principal` (ör. get_current_admin_user) verilirse limit kimlik doğrulamadan
+    sonra uygulanır ve kullanıcı başına sayılır: geçersiz token'lı istekler bütçeyi
+    tüketmez, aynı NAT arkasındaki istemciler admini kilitleyemez.
+    """
+    if name not in RATE_LIMIT_POLICIES:
+        raise ValueError(f"Unknown rate limit policy: {name}")
+
+    if principal is None:
+        async def dependency(request: Request):
+            await rate_limiter.check(request, name)
+    else:
+        # FastAPI dependency cache'i sayesinde handler'daki aynı principal tekrar çözülmez
+        async def dependency(request: Request, user=Depends(principal)):
+            await rate_limiter.check(request, name, subject=f"user:{user.id}")
+
+    return dependency
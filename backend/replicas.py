@@ -0,0 +1,187 @@
+# backend/replicas.py
+"""
+Public okumaların read replica'lara yönlendirilmesi.
+
+DATABASE_READ_URLS ayarlıysa public GET'lerin (cache miss / snapshot / export /
+arama) session'ları sağlıklı replikalar arasında round-robin dağıtılır; admin ve
+iletişim yazmaları her zaman primary'de kalır. Arka plandaki kontrol her
+replikada replikasyon gecikmesini ölçer; erişilemeyen veya REPLICA_MAX_LAG_SECONDS'tan
+fazla geride kalan replika, kontrol tekrar başarılı olana kadar kullanılmaz.
+
+Read-your-writes: bir tag'e son yazmadan (response_cache invalidation'ı) sonraki
+REPLICA_READ_YOUR_WRITES_SECONDS boyunca o tag'in okumaları primary'den yapılır.
+Böylece admin yazdığını hemen görür ve invalidation'dan sonra cache'e replikadaki
+eski veri yazılmaz. Yazma zamanının tüm worker'larda görünmesi için replikalar
+RESPONSE_CACHE_SYNC_DIR olmadan başlatılmaz.
+"""
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from cache import ResponseCache, response_cache
+from database import AsyncSessionLocal, replica_engines
+
+# Boşta bekleyen bir replikada son replay zamanı eskir; alınan WAL'in tamamı
+# uygulandıysa gecikme 0 sayılır
+POSTGRES_LAG_QUERY = text(
+    "SELECT COALESCE(CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)"
+)
+PROBE_QUERY = text("SELECT 0")
+
+class Replica:
+    """One read replica: engine, session factory and health state"""
+
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        self.healthy = True
+        self.lag_seconds = 0.0
+        self.reads = 0
+        self.check_failures = 0
+
+class ReadReplicaRouter:
+    """Round-robin routing of public reads to healthy replicas with a read-your-writes window"""
+
+    def __init__(
+        self,
+        engines: Dict[str, object],
+        cache: ResponseCache,
+        read_your_writes_seconds: float = 10.0,
+        max_lag_seconds: float = 5.0,
+        check_interval: float = 5.0,
+        check_timeout: float = 2.0
+    ):
+        self.replicas: List[Replica] = [Replica(name, engine) for name, engine in engines.items()]
+        self.cache = cache
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+        self.primary_reads = {"read_your_writes": 0, "no_healthy_replica": 0}
+        for replica in self.replicas:
+            self._watch_errors(replica)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def _watch_errors(self, replica: Replica):
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def on_error(context):
+            # Bağlantı kurulamadı / koptu: bir sonraki başarılı kontrole kadar atlanır
+            if context.is_disconnect or context.connection is None:
+                self._mark(replica, False, type(context.original_exception).__name__)
+
+    def _mark(self, replica: Replica, healthy: bool, reason: str = ""):
+        if replica.healthy and not healthy:
+            print(f"⚠️ Read replica devre dışı ({replica.name}): {reason}")
+        elif healthy and not replica.healthy:
+            print(f"✅ Read replica tekrar kullanımda ({replica.name})")
+        replica.healthy = healthy
+
+    def recently_written(self, tags) -> bool:
+        """True while any of `tags` was written within the read-your-writes window"""
+        now = time.time()
+        return any(now - self.cache.last_write_time(tag) < self.read_your_writes_seconds for tag in tags)
+
+    def session(self, *tags: str) -> AsyncSession:
+        """Session for a read of `tags` ("blog-posts", "projects", ...); primary if no replica fits"""
+        if not self.replicas:
+            return AsyncSessionLocal()
+        if self.recently_written(tags):
+            self.primary_reads["read_your_writes"] += 1
+            return AsyncSessionLocal()
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(self._next + offset) % len(self.replicas)]
+            if replica.healthy:
+                self._next = (self._next + offset + 1) % len(self.replicas)
+                replica.reads += 1
+                return replica.sessionmaker()
+        self.primary_reads["no_healthy_replica"] += 1
+        return AsyncSessionLocal()
+
+    async def _probe(self, replica: Replica) -> float:
+        async with replica.engine.connect() as conn:
+            if conn.dialect.name == "postgresql":
+                return float(await conn.scalar(POSTGRES_LAG_QUERY))
+            await conn.execute(PROBE_QUERY)
+            return 0.0
+
+    async def check(self, replica: Replica):
+        """Probe one replica and update its health (reachable and lag under the limit)"""
+        try:
+            replica.lag_seconds = await asyncio.wait_for(self._probe(replica), self.check_timeout)
+        except Exception as e:
+            replica.check_failures += 1
+            self._mark(replica, False, f"{type(e).__name__}: {e}")
+            return
+        if replica.lag_seconds > self.max_lag_seconds:
+            self._mark(replica, False, f"gecikme {replica.lag_seconds:.1f} s")
+        else:
+            self._mark(replica, True)
+
+    async def start(self):
+        if not self.replicas:
+            return
+        if self.cache.sync_dir is None:
+            # Aksi halde yazmayı görmeyen bir worker okumayı replikaya gönderir
+            raise RuntimeError("DATABASE_READ_URLS için RESPONSE_CACHE_SYNC_DIR gerekli (read-your-writes tüm worker'larda geçerli olmalı)")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self):
+        while True:
+            await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+            await asyncio.sleep(self.check_interval)
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of replica health and read routing"""
+        lines = []
+        for name, kind, value in (
+            ("healthy", "gauge", lambda replica: int(replica.healthy)),
+            ("lag_seconds", "gauge", lambda replica: f"{replica.lag_seconds:.3f}"),
+            ("reads_total", "counter", lambda replica: replica.reads),
+            ("check_failures_total", "counter", lambda replica: replica.check_failures),
+        ):
+            lines.append(f"# TYPE portfolio_replica_{name} {kind}")
+            lines += [f'portfolio_replica_{name}{{replica="{replica.name}"}} {value(replica)}' for replica in self.replicas]
+        lines.append("# TYPE portfolio_replica_primary_reads_total counter")
+        for reason, count in self.primary_reads.items():
+            lines.append(f'portfolio_replica_primary_reads_total{{reason="{reason}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+read_replicas = ReadReplicaRouter(
+    replica_engines,
+    response_cache,
+    read_your_writes_seconds=float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "10")),
+    max_lag_seconds=float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5")),
+    check_interval=float(os.getenv("REPLICA_CHECK_INTERVAL", "5")),
+    check_timeout=float(os.getenv("REPLICA_CHECK_TIMEOUT", "2"))
+)
+
+def read_db(*tags: str):
+    """FastAPI dependency yielding a read session for `tags` (see ReadReplicaRouter.session)"""
+    async def dependency():
+        async with read_replicas.session(*tags) as db:
+            yield db
+
+    return dependency
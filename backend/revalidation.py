@@ -0,0 +1,150 @@
+# backend/revalidation.py
+"""
+Frontend (Next.js) cache invalidation kuyruğu.
+
+Admin yazma işlemleri yalnızca tag'i kuyruğa ekler; arka plandaki worker tek bir
+pooled httpx client ile debounce penceresi içinde biriken tag'leri birleştirip
+`/api/revalidate`'e gönderir, başarısız çağrıları backoff ile tekrar dener.
+"""
+import asyncio
+import os
+from typing import Optional, Set
+
+class RevalidationQueue:
+    """Debounced, coalescing background sender for frontend revalidations"""
+
+    def __init__(
+        self,
+        frontend_url: str,
+        secret: str,
+        debounce_seconds: float = 0.5,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 5.0
+    ):
+        self.frontend_url = frontend_url
+        self.secret = secret
+        self.debounce_seconds = debounce_seconds
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self._pending: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # httpx (~0.2 s import) ilk gönderimde yüklenir; cold start'a eklenmez
+        self._client = None
+        self.enqueued = 0
+        self.requests = 0
+        self.failures = 0
+        self.dropped = 0
+
+    @staticmethod
+    def merge(tags: Set[str]) -> str:
+        """Farklı tag'ler (veya "all") tek bir "all" çağrısına indirgenir"""
+        if "all" in tags or len(tags) > 1:
+            return "all"
+        return next(iter(tags))
+
+    def enqueue(self, tag: str):
+        """Schedule a revalidation without waiting for the HTTP call"""
+        self._pending.add(tag)
+        self.enqueued += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self):
+        self._wakeup = asyncio.Event()
+        if self._pending:
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the worker and flush whatever is still pending (one attempt)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pending and self._wakeup is not None:
+            tags, self._pending = self._pending, set()
+            await self._send(self.merge(tags))
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._wakeup = None
+
+    async def _send(self, tag: str) -> bool:
+        """POST one revalidation; False means it should be retried"""
+        import httpx
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        self.requests += 1
+        try:
+            response = await self._client.post(
+                f"{self.frontend_url}/api/revalidate",
+                json={"tag": tag, "secret": self.secret}
+            )
+        except httpx.HTTPError as e:
+            self.failures += 1
+            print(f"❌ Cache temizleme hatası: {e}")
+            return False
+        if response.status_code == 200:
+            print(f"✅ Frontend cache temizlendi: {tag}")
+            return True
+        self.failures += 1
+        print(f"⚠️ Cache temizleme başarısız: {response.status_code}")
+        # 4xx (yanlış secret / tag) tekrar denemekle düzelmez
+        return response.status_code < 500
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Debounce: pencere boyunca gelen tag'ler aynı çağrıda birleşir
+            await asyncio.sleep(self.debounce_seconds)
+            attempt = 0
+            while self._pending:
+                tags, self._pending = self._pending, set()
+                try:
+                    delivered = await self._send(self.merge(tags))
+                except asyncio.CancelledError:
+                    self._pending |= tags
+                    raise
+                if delivered:
+                    attempt = 0
+                    continue
+                self._pending |= tags
+                attempt += 1
+                if attempt > self.max_retries:
+                    # Next.js'in zaman bazlı revalidate'i (60s/300s) yine devreye girer
+                    print(f"❌ Cache temizleme {self.max_retries} denemeden sonra bırakıldı: {sorted(self._pending)}")
+                    self.dropped += len(self._pending)
+                    self._pending.clear()
+                    break
+                await asyncio.sleep(min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the queue counters"""
+        lines = []
+        for name, value in (
+            ("enqueued", self.enqueued),
+            ("requests", self.requests),
+            ("failures", self.failures),
+            ("dropped", self.dropped),
+        ):
+            lines.append(f"# TYPE portfolio_revalidation_{name}_total counter")
+            lines.append(f"portfolio_revalidation_{name}_total {value}")
+        lines.append("# TYPE portfolio_revalidation_pending gauge")
+        lines.append(f"portfolio_revalidation_pending {len(self._pending)}")
+        return "\n".join(lines) + "\n"
+
+revalidation_queue = RevalidationQueue(
+    frontend_url=os.getenv("FRONTEND_URL", "http://localhost:3000"),
+    secret=os.getenv("REVALIDATE_SECRET", "your-super-secret-revalidate-key-2024"),
+    debounce_seconds=float(os.getenv("REVALIDATE_DEBOUNCE_SECONDS", "0.5")),
+    max_retries=int(os.getenv("REVALIDATE_MAX_RETRIES", "5"))
+)
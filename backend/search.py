@@ -0,0 +1,147 @@
+# backend/search.py
+"""
+Blog yazıları ve projeler üzerinde full-text arama.
+
+PostgreSQL'de generated `search_vector` kolonları (Türkçe + İngilizce) ve
+ts_rank_cd / ts_headline kullanılır. SQLite'ta FTS5 `search_index` tablosu
+bm25 / snippet ile sorgulanır ve admin yazmalarında index_item / remove_item
+ile güncel tutulur.
+"""
+import re
+from typing import List, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import IS_POSTGRES, BlogPost, Project
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def strip_html(value: str) -> str:
+    return _TAG_RE.sub(" ", value or "")
+
+def fts5_query(query: str) -> str:
+    """Kullanıcı girdisini FTS5 sözdiziminden arındır: her kelime tırnaklı, son kelime prefix"""
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return ""
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+_PG_HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxFragments=2, MaxWords=20, MinWords=8"
+
+_PG_POST_HITS = """
+    SELECT 'post' AS type, id, title, slug, ts_rank_cd(search_vector, q.query) AS rank
+    FROM blog_posts, q WHERE search_vector @@ q.query
+"""
+_PG_PROJECT_HITS = """
+    SELECT 'project' AS type, id, name AS title, NULL AS slug, ts_rank_cd(search_vector, q.query) AS rank
+    FROM projects, q WHERE search_vector @@ q.query
+"""
+# Snippet'ler (ts_headline pahalıdır) yalnızca sayfadaki satırlar için üretilir
+_PG_SEARCH = """
+    WITH q AS (
+        SELECT websearch_to_tsquery('turkish', :q) || websearch_to_tsquery('english', :q) AS query
+    ),
+    hits AS ({hits}),
+    page AS (SELECT * FROM hits ORDER BY rank DESC, type, id DESC LIMIT :limit OFFSET :offset)
+    SELECT page.type, page.id, page.title, page.slug, page.rank,
+        CASE WHEN page.type = 'post'
+            THEN ts_headline('turkish',
+                concat_ws(' ', b.excerpt, regexp_replace(coalesce(b.content, ''), '<[^>]+>', ' ', 'g')),
+                q.query, :options)
+            ELSE ts_headline('turkish', coalesce(p.description, ''), q.query, :options)
+        END AS snippet
+    FROM page CROSS JOIN q
+    LEFT JOIN blog_posts b ON page.type = 'post' AND b.id = page.id
+    LEFT JOIN projects p ON page.type = 'project' AND p.id = page.id
+    ORDER BY page.rank DESC, page.type, page.id DESC
+"""
+
+# bm25 ağırlıkları: kind, item_id (UNINDEXED), title, excerpt, body
+_SQLITE_SEARCH = """
+    SELECT search_index.kind AS type, search_index.item_id AS id, search_index.title,
+        blog_posts.slug AS slug,
+        -bm25(search_index, 0, 0, 10.0, 4.0, 1.0) AS rank,
+        snippet(search_index, -1, :start, :stop, '…', 16) AS snippet
+    FROM search_index
+    LEFT JOIN blog_posts ON search_index.kind = 'post' AND blog_posts.id = search_index.item_id
+    WHERE search_index MATCH :q {kind_filter}
+    ORDER BY rank DESC, search_index.kind, search_index.item_id DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+async def search_content(db: AsyncSession, query: str, kind: str, limit: int, offset: int) -> Tuple[List[dict], bool]:
+    """Ranked, highlighted hits for `query`; kind is "all", "posts" or "projects"
+
+    Bir sonraki sayfanın olup olmadığını anlamak için limit + 1 satır okunur.
+    """
+    params = {"limit": limit + 1, "offset": offset}
+    if IS_POSTGRES:
+        hits = []
+        if kind in ("all", "posts"):
+            hits.append(_PG_POST_HITS)
+        if kind in ("all", "projects"):
+            hits.append(_PG_PROJECT_HITS)
+        statement = _PG_SEARCH.format(hits=" UNION ALL ".join(hits))
+        params.update(q=query, options=_PG_HEADLINE_OPTIONS)
+    else:
+        match = fts5_query(query)
+        if not match:
+            return [], False
+        kind_filter = {"posts": "AND search_index.kind = 'post'", "projects": "AND search_index.kind = 'project'"}
+        statement = _SQLITE_SEARCH.format(kind_filter=kind_filter.get(kind, ""))
+        params.update(q=match, start=HIGHLIGHT_START, stop=HIGHLIGHT_STOP)
+
+    rows = (await db.execute(text(statement), params)).mappings().all()
+    return [dict(row) for row in rows[:limit]], len(rows) > limit
+
+SEARCH_KINDS = {BlogPost: "post", Project: "project"}
+INDEXED_FIELDS = {BlogPost: ("title", "excerpt", "content"), Project: ("name", "technologies", "description")}
+
+def _index_fields(model, values: dict) -> Tuple[str, str, str]:
+    if model is BlogPost:
+        return values["title"], values["excerpt"] or "", strip_html(values["content"])
+    technologies = " ".join(values["technologies"] or [])
+    return values["name"], technologies, values["description"] or ""
+
+async def index_rows(db: AsyncSession, model, rows: List[Tuple[int, dict]]):
+    """Upsert many (id, column values) pairs into the SQLite FTS index"""
+    if IS_POSTGRES or not rows:
+        return
+    kind = SEARCH_KINDS[model]
+    await remove_rows(db, model, [id_ for id_, _ in rows])
+    params = []
+    for id_, values in rows:
+        title, excerpt, body = _index_fields(model, values)
+        params.append({"kind": kind, "id": id_, "title": title, "excerpt": excerpt, "body": body})
+    await db.execute(
+        text("INSERT INTO search_index (kind, item_id, title, excerpt, body) VALUES (:kind, :id, :title, :excerpt, :body)"),
+        params
+    )
+
+async def remove_rows(db: AsyncSession, model, ids: List[int]):
+    """Drop many items from the SQLite FTS index"""
+    if IS_POSTGRES or not ids:
+        return
+    await db.execute(
+        text("DELETE FROM search_index WHERE kind = :kind AND item_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"kind": SEARCH_KINDS[model], "ids": ids}
+    )
+
+async def index_item(db: AsyncSession, item):
+    """Upsert `item` into the SQLite FTS index (PostgreSQL kolonu kendisi günceller)"""
+    if IS_POSTGRES:
+        return
+    await db.flush()  # Yeni kayıtların id'si için
+    model = type(item)
+    await index_rows(db, model, [(item.id, {field: getattr(item, field) for field in INDEXED_FIELDS[model]})])
+
+async def remove_item(db: AsyncSession, item):
+    """Drop `item` from the SQLite FTS index"""
+    await remove_rows(db, type(item), [item.id])
@@ -0,0 +1,140 @@
+# backend/slugs.py
+"""
+Blog yazısı slug'ları: temiz, tekil ve yeniden adlandırmada kırılmayan URL'ler.
+
+- slugify: Türkçe karakter tablosu ve regex'ler modül yüklenirken bir kez hazırlanır
+- reserve_slugs: `baslik`, `baslik-2`, ... ; bir batch'in tüm başlıkları için dolu
+  slug'lar tek index'li ön ek sorgusuyla (blog_posts + slug_redirects) okunur
+- Yeniden adlandırılan yazının eski slug'ı slug_redirects'e yazılır;
+  resolve_slug_query yazıyı güncel veya eski slug'ıyla tek sorguda bulur
+
+Eşzamanlı iki istek aynı slug'ı seçerse unique index ikincisini reddeder;
+with_slug_retry değişikliği yeni bir slug ile tekrar uygular.
+"""
+import re
+import unicodedata
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, insert, or_, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import IS_POSTGRES, BlogPost, SlugRedirect
+
+# String(250) kolonunda "-<sayı>" son eki için yer bırakılır
+SLUG_MAX_LENGTH = 240
+SLUG_FALLBACK = "yazi"
+SLUG_RESERVE_ATTEMPTS = 5
+# Her başlık bir OR dalı ekler; SQLite ifade derinliği 1000 ile sınırlı
+SLUG_LOOKUP_CHUNK = 200
+
+_TURKISH_MAP = str.maketrans({
+    "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g", "ü": "u", "Ü": "u",
+    "ş": "s", "Ş": "s", "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
+})
+_INVALID_CHARS = re.compile(r"[^\w\s-]")
+_SEPARATORS = re.compile(r"[-\s]+")
+
+def slugify(value: str) -> str:
+    """
+    Türkçe karakterleri de destekleyen, metni URL dostu hale getiren fonksiyon.
+    """
+    value = value.translate(_TURKISH_MAP)
+    # Çoğu başlık çeviriden sonra ASCII'dir; NFKD yalnızca gerektiğinde
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    value = _INVALID_CHARS.sub("", value).strip().lower()
+    return _SEPARATORS.sub("-", value).strip("-")
+
+def slug_base(title: str) -> str:
+    """slugify + length limit; titles without any usable character get a fallback"""
+    return slugify(title)[:SLUG_MAX_LENGTH].rstrip("-") or SLUG_FALLBACK
+
+def _prefix_filter(column, prefix: str):
+    """Indexed `column LIKE 'prefix%'` as a range scan"""
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    if IS_POSTGRES:
+        # text_pattern_ops index'i yalnızca ~>=~ / ~<~ operatörleriyle kullanılır (LIKE parametreyle kullanmaz)
+        return and_(column.op("~>=~")(prefix), column.op("~<~")(upper))
+    return and_(column >= prefix, column < upper)
+
+async def reserve_slugs(
+    db: AsyncSession,
+    titles: Sequence[str],
+    post_ids: Optional[Sequence[Optional[int]]] = None
+) -> List[str]:
+    """Free slugs for `titles` (one query per SLUG_LOOKUP_CHUNK titles); `post_ids[i]` may keep slugs it already owns"""
+    bases = [slug_base(title) for title in titles]
+    post_ids = post_ids or [None] * len(bases)
+    unique_bases = sorted(set(bases))
+
+    owners: Dict[str, int] = {}
+    for offset in range(0, len(unique_bases), SLUG_LOOKUP_CHUNK):
+        chunk = unique_bases[offset:offset + SLUG_LOOKUP_CHUNK]
+        # (slug, sahibi olan yazı) - güncel slug'lar ve yönlendirmedeki eski slug'lar
+        query = union_all(
+            select(BlogPost.slug, BlogPost.id).where(or_(
+                BlogPost.slug.in_(chunk),
+                *(_prefix_filter(BlogPost.slug, base + "-") for base in chunk)
+            )),
+            select(SlugRedirect.old_slug, SlugRedirect.post_id).where(or_(
+                SlugRedirect.old_slug.in_(chunk),
+                *(_prefix_filter(SlugRedirect.old_slug, base + "-") for base in chunk)
+            )),
+        )
+        owners.update((await db.execute(query)).all())
+
+    slugs = []
+    reserved = set()
+    for base, post_id in zip(bases, post_ids):
+        slug, counter = base, 2
+        while slug in reserved or owners.get(slug, post_id) != post_id:
+            slug = f"{base}-{counter}"
+            counter += 1
+        reserved.add(slug)
+        slugs.append(slug)
+    return slugs
+
+async def reserve_slug(db: AsyncSession, title: str, post_id: Optional[int] = None) -> str:
+    return (await reserve_slugs(db, [title], [post_id]))[0]
+
+async def record_redirects(db: AsyncSession, renames: Iterable[Tuple[int, str, str]]):
+    """Store `(post_id, old_slug, new_slug)` renames; a post renamed back drops that redirect"""
+    renames = [(post_id, old, new) for post_id, old, new in renames if old != new]
+    if not renames:
+        return
+    await db.execute(delete(SlugRedirect).where(SlugRedirect.old_slug.in_([new for _, _, new in renames])))
+    await db.execute(insert(SlugRedirect), [{"old_slug": old, "post_id": post_id} for post_id, old, _ in renames])
+
+async def delete_redirects(db: AsyncSession, post_ids: Iterable[int]):
+    """Remove the redirects of deleted posts (SQLite does not enforce ON DELETE CASCADE)"""
+    post_ids = list(post_ids)
+    if post_ids:
+        await db.execute(delete(SlugRedirect).where(SlugRedirect.post_id.in_(post_ids)))
+
+def resolve_slug_query(columns, slug: str):
+    """Post by current slug, else by a redirected old slug - both branches are index lookups"""
+    return union_all(
+        select(*columns).where(BlogPost.slug == slug),
+        select(*columns).join(SlugRedirect, SlugRedirect.post_id == BlogPost.id).where(SlugRedirect.old_slug == slug),
+    ).limit(1)
+
+T = TypeVar("T")
+
+async def with_slug_retry(db: AsyncSession, apply: Callable[[], Awaitable[T]], commit: bool = True) -> T:
+    """Run `apply()` (which reserves slugs) and commit; on a unique slug race roll back and retry
+
+    `commit=False`: commit çağırana kalır (toplu yazma commit hatasını kendisi raporlar).
+    """
+    for _ in range(SLUG_RESERVE_ATTEMPTS):
+        try:
+            # Çakışma flush sırasında (apply içinde) veya commit'te ortaya çıkar
+            result = await apply()
+            if commit:
+                await db.commit()
+            return result
+        except IntegrityError:
+            # Aynı slug'ı eşzamanlı bir istek aldı
+            await db.rollback()
+    raise HTTPException(status_code=409, detail="Slug ayrılamadı, lütfen tekrar deneyin")
@@ -0,0 +1,207 @@
+# backend/snapshots.py
+"""
+Public okuma endpoint'leri için önceden serialize edilmiş yanıt snapshot'ları.
+
+Yazı / proje yanıtları ORM nesnesi ve pydantic modeli oluşturmadan doğrudan
+Core satırlarından dict olarak üretilir. Açılışta, her admin yazmasından sonra ve
+cache TTL'i dolmadan periyodik olarak varsayılan liste ve tekil anahtarlar
+(düz + gzip/brotli) response_cache'e yazılır; istekler hazır byte'ları döndürür.
+"""
+import asyncio
+import os
+import time
+from typing import Optional, Set
+
+from sqlalchemy import select
+
+from cache import ResponseCache, collection_last_modified, response_cache, row_last_modified
+from database import BlogPost, Project
+from replicas import read_replicas
+from tags import convert_tags_to_list
+
+POST_SUMMARY_COLUMNS = (
+    BlogPost.id, BlogPost.title, BlogPost.excerpt, BlogPost.read_time, BlogPost.category,
+    BlogPost.tags, BlogPost.slug, BlogPost.created_at, BlogPost.updated_at,
+)
+POST_COLUMNS = POST_SUMMARY_COLUMNS + (BlogPost.content,)
+PROJECT_COLUMNS = (
+    Project.id, Project.name, Project.description, Project.technologies, Project.github,
+    Project.demo, Project.created_at, Project.updated_at,
+)
+# Admin toplu yazmada display_order ile sıralanabilir
+PROJECT_ORDER = (Project.display_order, Project.id)
+
+def post_payload(row, include_content: bool = True) -> dict:
+    """BlogPostResponse-shaped dict of a Core row (alan sırası modelle aynı)"""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "excerpt": row.excerpt,
+        "content": row.content if include_content else None,
+        "date": row.created_at.strftime("%Y-%m-%d"),
+        "readTime": row.read_time,
+        "category": row.category,
+        "tags": convert_tags_to_list(row.tags),
+        "slug": row.slug,
+    }
+
+def project_payload(row) -> dict:
+    """ProjectResponse-shaped dict of a Core row"""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "description": row.description,
+        "technologies": convert_tags_to_list(row.technologies),
+        "github": row.github,
+        "demo": row.demo,
+    }
+
+# Cache anahtarları - endpoint'ler ve snapshot'lar aynı anahtarları kullanmalı
+def posts_key(fields: str = "full", category: Optional[str] = None, tag: Optional[str] = None,
+              limit: Optional[int] = None, cursor: Optional[str] = None) -> str:
+    return f"posts:{fields}:{category}:{tag}:{limit}:{cursor}"
+
+def post_key(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def post_slug_key(slug: str) -> str:
+    return f"post-slug:{slug}"
+
+def projects_key(technology: Optional[str] = None) -> str:
+    return f"projects:{technology}"
+
+def project_key(project_id: int) -> str:
+    return f"project:{project_id}"
+
+class SnapshotStore:
+    """Keeps the default public responses pre-serialized in the response cache"""
+
+    def __init__(self, cache: ResponseCache, max_items: int = 100, refresh_seconds: float = 240):
+        self.cache = cache
+        # Tekil snapshot'lar en yeni `max_items` kayıt için üretilir; gerisi istek anında build edilir
+        self.max_items = max_items
+        # Diğer worker'ların yazmaları ve TTL için periyodik yenileme
+        self.refresh_seconds = refresh_seconds
+        self._pending: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.builds = 0
+        self.failures = 0
+        self.last_build_entries = 0
+        self.last_build_seconds = 0.0
+
+    def schedule(self, tag: str):
+        """Rebuild the snapshots of a tag in the background"""
+        self._pending.add(tag)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def refresh(self, tags: Set[str]):
+        """Rebuild the snapshots of `tags` ("all" = blog-posts + projects) now"""
+        if "all" in tags:
+            tags = {"blog-posts", "projects"}
+        started = time.perf_counter()
+        entries = 0
+        for tag in sorted(tags):
+            try:
+                if tag == "blog-posts":
+                    entries += await self._build_posts()
+                elif tag == "projects":
+                    entries += await self._build_projects()
+            except Exception as e:
+                self.failures += 1
+                print(f"❌ Snapshot oluşturulamadı ({tag}): {e}")
+        self.builds += 1
+        self.last_build_entries = entries
+        self.last_build_seconds = time.perf_counter() - started
+
+    async def _build_posts(self) -> int:
+        generation = self.cache.generation("blog-posts")
+        async with read_replicas.session("blog-posts") as db:
+            rows = (await db.execute(
+                select(*POST_COLUMNS).order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            )).all()
+        last_modified = collection_last_modified(rows, "blog-posts")
+        # Serialize + sıkıştırma CPU işidir; event loop'u bloklamasın
+        return await asyncio.to_thread(self._store_posts, rows, generation, last_modified)
+
+    def _store_posts(self, rows, generation, last_modified) -> int:
+        self.cache.store(posts_key("full"), "blog-posts", [post_payload(row) for row in rows],
+                         generation, last_modified=last_modified, compress=True)
+        self.cache.store(posts_key("summary"), "blog-posts", [post_payload(row, False) for row in rows],
+                         generation, last_modified=last_modified, compress=True)
+        for row in rows[:self.max_items]:
+            entry = self.cache.store(post_key(row.id), "blog-posts", post_payload(row), generation,
+                                     last_modified=row_last_modified(row), compress=True)
+            self.cache.set(post_slug_key(row.slug), "blog-posts", entry.body, generation,
+                           entry.headers, entry.encoded)
+        return 2 + 2 * len(rows[:self.max_items])
+
+    async def _build_projects(self) -> int:
+        generation = self.cache.generation("projects")
+        async with read_replicas.session("projects") as db:
+            rows = (await db.execute(select(*PROJECT_COLUMNS).order_by(*PROJECT_ORDER))).all()
+        last_modified = collection_last_modified(rows, "projects")
+        return await asyncio.to_thread(self._store_projects, rows, generation, last_modified)
+
+    def _store_projects(self, rows, generation, last_modified) -> int:
+        self.cache.store(projects_key(), "projects", [project_payload(row) for row in rows],
+                         generation, last_modified=last_modified, compress=True)
+        for row in rows[:self.max_items]:
+            self.cache.store(project_key(row.id), "projects", project_payload(row), generation,
+                             last_modified=row_last_modified(row), compress=True)
+        return 1 + len(rows[:self.max_items])
+
+    async def start(self, warm: bool = True):
+        """`warm=False`: the first build runs in the background instead of delaying startup"""
+        self._wakeup = asyncio.Event()
+        self._pending.clear()
+        if warm:
+            await self.refresh({"all"})
+        else:
+            self._pending.add("all")
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._wakeup = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.refresh_seconds)
+            except asyncio.TimeoutError:
+                self._pending.add("all")
+            self._wakeup.clear()
+            tags, self._pending = self._pending, set()
+            if tags:
+                await self.refresh(tags)
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the snapshot builder"""
+        return "\n".join([
+            "# TYPE portfolio_snapshot_builds_total counter",
+            f"portfolio_snapshot_builds_total {self.builds}",
+            "# TYPE portfolio_snapshot_failures_total counter",
+            f"portfolio_snapshot_failures_total {self.failures}",
+            "# TYPE portfolio_snapshot_last_build_entries gauge",
+            f"portfolio_snapshot_last_build_entries {self.last_build_entries}",
+            "# TYPE portfolio_snapshot_last_build_seconds gauge",
+            f"portfolio_snapshot_last_build_seconds {self.last_build_seconds:.6f}",
+        ]) + "\n"
+
+SNAPSHOTS_ENABLED = os.getenv("RESPONSE_SNAPSHOTS", "true").lower() in ("1", "true", "yes")
+
+snapshot_store = SnapshotStore(
+    response_cache,
+    max_items=int(os.getenv("SNAPSHOT_MAX_ITEMS", "100")),
+    # Varsayılan: RESPONSE_CACHE_TTL_SECONDS'ın %80'i, snapshot'lar hiç expire olmasın
+    refresh_seconds=float(os.getenv("SNAPSHOT_REFRESH_SECONDS", str(response_cache.ttl_seconds * 0.8)))
+)
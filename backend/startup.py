@@ -0,0 +1,91 @@
+# backend/startup.py
+"""
+Cold start ölçümü ve hızlı açılış modu.
+
+main.py'nin ilk import'u bu modüldür; startup_timer import ve lifespan adımlarının
+sürelerini tutar. Açılış bitince tek satır loglanır, süreler /metrics'te gauge
+olarak verilir ve STARTUP_REPORT_PATH ayarlıysa JSON olarak yazılır (CI).
+
+STARTUP_MODE=fast (scale-to-zero): create_all yerine alembic_version kontrolü
+(migration'lar deploy adımında çalışır) ve snapshot'ların arka planda ısıtılması.
+Yalnızca standart kütüphaneyi import eder.
+"""
+import glob
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations", "versions")
+_REVISION_LINE = re.compile(r"""^(revision|down_revision)\s*=\s*["']?(\w+)""", re.MULTILINE)
+
+class StartupTimer:
+    """Durations of the import and lifespan phases of one process start"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.ready = False
+
+    def mark_imported(self):
+        """Call at the end of main.py: everything imported so far is the import phase"""
+        self.phases["import"] = time.perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def report(self) -> dict:
+        return {
+            "mode": startup_mode(),
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases.items()},
+            "total_ms": round(sum(self.phases.values()) * 1000, 2),
+        }
+
+    def finish(self):
+        """Log the startup timings once the app is ready (and write them for CI)"""
+        self.ready = True
+        report = self.report()
+        details = ", ".join(f"{name} {ms:.0f}" for name, ms in report["phases_ms"].items())
+        print(f"🚀 Açılış {report['total_ms']:.0f} ms ({report['mode']}; {details} ms)")
+        path = os.getenv("STARTUP_REPORT_PATH")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f)
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the startup phases"""
+        lines = ["# TYPE portfolio_startup_phase_seconds gauge"]
+        lines += [f'portfolio_startup_phase_seconds{{phase="{name}"}} {seconds:.6f}' for name, seconds in self.phases.items()]
+        return "\n".join(lines) + "\n"
+
+startup_timer = StartupTimer()
+
+# gunicorn master'ı (bkz. gunicorn.conf.py) şemayı ve admin'i fork'tan önce hazırladığında ayarlanır
+DATABASE_PREPARED_ENV = "PORTFOLIO_DATABASE_PREPARED"
+
+def database_prepared() -> bool:
+    """True in workers whose parent already ran the schema and admin startup steps"""
+    return os.getenv(DATABASE_PREPARED_ENV) == "1"
+
+def startup_mode() -> str:
+    # .env import sırasında yüklendiği için çağrı anında okunur
+    return "fast" if os.getenv("STARTUP_MODE", "full").lower() == "fast" else "full"
+
+def migration_head(directory: str = MIGRATIONS_DIR) -> Optional[str]:
+    """Head revision of the alembic scripts, read without importing alembic"""
+    revisions, parents = set(), set()
+    for path in glob.glob(os.path.join(directory, "*.py")):
+        with open(path, encoding="utf-8") as f:
+            values = dict(_REVISION_LINE.findall(f.read()))
+        if "revision" in values:
+            revisions.add(values["revision"])
+            parents.add(values.get("down_revision"))
+    heads = revisions - parents
+    return heads.pop() if len(heads) == 1 else None
@@ -0,0 +1,71 @@
+# backend/stats.py
+"""
+Admin dashboard sayaçları.
+
+Tüm sayılar tek bir UNION ALL sorgusuyla (tek round-trip) hesaplanır; sonuç
+response_cache'te ADMIN_STATS_TAG ile kısa süre tutulur ve yazılar, projeler
+veya iletişim mesajları değiştiğinde invalidate edilir.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import String, cast, false, func, literal, literal_column, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import IS_POSTGRES, BlogPost, ContactMessage, Project
+
+ADMIN_STATS_TAG = "admin-stats"
+ADMIN_STATS_TTL_SECONDS = float(os.getenv("ADMIN_STATS_TTL_SECONDS", "30"))
+STATS_DEFAULT_DAYS = 14
+STATS_MAX_DAYS = 90
+
+def admin_stats_key(days: int) -> str:
+    return f"admin:stats:{days}"
+
+async def compute_admin_stats(db: AsyncSession, days: int = STATS_DEFAULT_DAYS) -> dict:
+    """Posts per category, project count, total / unread messages and messages per day"""
+    today = datetime.now(timezone.utc).date()
+    since = datetime.combine(today - timedelta(days=days - 1), datetime.min.time(), tzinfo=timezone.utc)
+    # SQLite zaman damgalarını naive UTC olarak saklar
+    if not IS_POSTGRES:
+        since = since.replace(tzinfo=None)
+    # Gün anahtarları UTC; PostgreSQL'de date() oturumun saat dilimine göre keserdi
+    created_at = func.timezone(literal_column("'UTC'"), ContactMessage.created_at) if IS_POSTGRES else ContactMessage.created_at
+    day = cast(func.date(created_at), String)
+
+    # (kind, key, count) satırları
+    query = union_all(
+        select(literal("posts", String).label("kind"), cast(BlogPost.category, String).label("key"), func.count().label("count"))
+        .group_by(BlogPost.category),
+        select(literal("projects", String), cast(null(), String), func.count()).select_from(Project),
+        select(literal("messages", String), literal("total", String), func.count()).select_from(ContactMessage),
+        select(literal("messages", String), literal("unread", String), func.count())
+        .select_from(ContactMessage).where(ContactMessage.is_read == false()),
+        select(literal("messages_by_day", String), day, func.count())
+        .where(ContactMessage.created_at >= since).group_by(day),
+    )
+    by_category = {}
+    counts = {}
+    by_day = {}
+    for kind, key, count in (await db.execute(query)).all():
+        if kind == "posts":
+            by_category[key] = count
+        elif kind == "messages_by_day":
+            by_day[key] = count
+        else:
+            counts[(kind, key)] = count
+
+    return {
+        "posts": {"total": sum(by_category.values()), "by_category": by_category},
+        "projects": {"total": counts.get(("projects", None), 0)},
+        "messages": {
+            "total": counts.get(("messages", "total"), 0),
+            "unread": counts.get(("messages", "unread"), 0),
+            # Mesaj gelmeyen günler de 0 ile listelenir
+            "by_day": [
+                {"date": current.isoformat(), "count": by_day.get(current.isoformat(), 0)}
+                for current in (today - timedelta(days=offset) for offset in range(days - 1, -1, -1))
+            ],
+        },
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+    }
@@ -0,0 +1,83 @@
+# backend/tags.py
+"""
+Tag / teknoloji listeleri için SQL tarafında filtreleme ve sayma yardımcıları.
+
+PostgreSQL'de JSONB kolon üzerinde GIN index'li `@>` kullanılır; SQLite'ta aynı
+sorgular normalize tablolara (blog_post_tags / project_technologies) gider.
+"""
+import json
+from typing import Dict, Iterable, List
+
+from sqlalchemy import delete, func, insert, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import USE_TAG_TABLES, BlogPost, BlogPostTag, Project, ProjectTechnology
+
+# model -> (JSON kolon, normalize tablo, tablo FK kolonu, tablo değer kolonu)
+TAG_COLUMNS = {
+    BlogPost: (BlogPost.tags, BlogPostTag, BlogPostTag.post_id, BlogPostTag.tag),
+    Project: (Project.technologies, ProjectTechnology, ProjectTechnology.project_id, ProjectTechnology.technology),
+}
+
+def convert_tags_to_list(tags) -> List[str]:
+    """Return the tag list of a JSON column (legacy rows may still hold a JSON string)"""
+    if isinstance(tags, list):
+        return tags
+    try:
+        return json.loads(tags) if tags else []
+    except:
+        return []
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """Strip blanks and duplicates while keeping the given order"""
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+
+def tag_filter(model, tag: str):
+    """WHERE clause matching rows whose tag list contains `tag`"""
+    column, table, item_id, value = TAG_COLUMNS[model]
+    if USE_TAG_TABLES:
+        return model.id.in_(select(item_id).where(value == tag))
+    return type_coerce(column, JSONB).contains([tag])
+
+def tag_counts_query(model):
+    """SELECT tag, count ordered by popularity"""
+    column, table, item_id, value = TAG_COLUMNS[model]
+    if USE_TAG_TABLES:
+        tag, count = value.label("tag"), func.count().label("count")
+        return select(tag, count).group_by(value).order_by(count.desc(), value)
+    elements = select(func.jsonb_array_elements_text(column).label("tag")).subquery()
+    count = func.count().label("count")
+    return select(elements.c.tag, count).group_by(elements.c.tag).order_by(count.desc(), elements.c.tag)
+
+async def replace_tag_rows(db: AsyncSession, model, tags_by_id: Dict[int, List[str]]):
+    """Rewrite the normalized tag rows of many items with two statements"""
+    if not USE_TAG_TABLES or not tags_by_id:
+        return
+    column, table, item_id, value = TAG_COLUMNS[model]
+    await db.execute(delete(table).where(item_id.in_(list(tags_by_id))))
+    rows = [
+        {item_id.key: id_, value.key: tag}
+        for id_, tags in tags_by_id.items() for tag in normalize_tags(tags or [])
+    ]
+    if rows:
+        await db.execute(insert(table), rows)
+
+async def delete_tag_rows_many(db: AsyncSession, model, ids: List[int]):
+    """Remove the normalized tag rows of many items"""
+    if not USE_TAG_TABLES or not ids:
+        return
+    column, table, item_id, value = TAG_COLUMNS[model]
+    await db.execute(delete(table).where(item_id.in_(ids)))
+
+async def sync_tag_rows(db: AsyncSession, item):
+    """Rewrite the normalized tag rows of `item` (no-op on PostgreSQL)"""
+    if not USE_TAG_TABLES:
+        return
+    column = TAG_COLUMNS[type(item)][0]
+    await db.flush()  # Yeni kayıtların id'si için
+    await replace_tag_rows(db, type(item), {item.id: getattr(item, column.key)})
+
+async def delete_tag_rows(db: AsyncSession, item):
+    """Remove the normalized tag rows of `item` (SQLite foreign key cascade kapalıdır)"""
+    await delete_tag_rows_many(db, type(item), [item.id])
@@ -0,0 +1,19 @@
+# backend/tests/conftest.py
+"""
+Testler backend dizininden çalıştırılır: python -m pytest tests
+
+Uygulama modülleri import edilmeden önce geçici bir SQLite veritabanı ayarlanır.
+"""
+import os
+import sys
+import tempfile
+
+_work_dir = tempfile.mkdtemp(prefix="portfolio-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_work_dir, 'test.db')}"
+os.environ.setdefault("CONTACT_SPOOL_DIR", os.path.join(_work_dir, "contact-spool"))
+# Sorgu bütçeleri için tanılama açık; cache'i arkadan dolduran snapshot'lar ve limitler kapalı
+os.environ["DB_DIAGNOSTICS"] = "true"
+os.environ["RESPONSE_SNAPSHOTS"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["METRICS_TOKEN"] = "test-metrics-token"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,110 @@
+# backend/tests/test_contact.py
+"""İletişim kuyruğu: kabul edilemeyen mesajın tekrar denemesi kaybolmamalı"""
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from contact import ContactIngestQueue, ContactSpool, DuplicateCheck
+from database import AsyncSessionLocal, ContactMessage, async_engine, create_tables
+
+def message(subject: str) -> dict:
+    return {"name": "Ada", "email": "ada@example.com", "subject": subject, "message": "Merhaba"}
+
+async def saved_subjects():
+    async with AsyncSessionLocal() as db:
+        return set(await db.scalars(select(ContactMessage.subject)))
+
+def run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(wrapper())
+
+@pytest.fixture(autouse=True)
+def tables():
+    create_tables()
+
+def test_retry_after_backpressure_is_persisted(tmp_path):
+    queue = ContactIngestQueue(max_pending=1, spool_dir=str(tmp_path), checks=[DuplicateCheck()])
+
+    async def scenario():
+        await queue.start()
+        queue._task.cancel()  # kuyruk elle boşaltılır
+        assert await queue.submit(message("ilk"))
+        with pytest.raises(HTTPException) as error:
+            await queue.submit(message("ikinci"))
+        assert error.value.status_code == 429
+        assert await queue._flush_batch()
+        # 429 alan istemcinin tekrar denemesi "duplicate" sayılmaz
+        assert await queue.submit(message("ikinci"))
+        assert not await queue.submit(message("ikinci"))
+        await queue.stop()
+        return await saved_subjects()
+
+    assert {"ilk", "ikinci"} <= run(scenario())
+    assert queue.rejected == {"duplicate": 1}
+
+def test_retry_after_failed_insert_is_persisted(monkeypatch):
+    queue = ContactIngestQueue(mode="sync", checks=[DuplicateCheck()])
+    original = queue._insert
+
+    async def failing_insert(messages):
+        raise OSError("veritabanı erişilemiyor")
+
+    async def scenario():
+        monkeypatch.setattr(queue, "_insert", failing_insert)
+        with pytest.raises(OSError):
+            await queue.submit(message("sync"))
+        monkeypatch.setattr(queue, "_insert", original)
+        assert await queue.submit(message("sync"))
+        return await saved_subjects()
+
+    assert "sync" in run(scenario())
+    assert queue.rejected == {}
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork gerekli")
+def test_forked_workers_keep_separate_spools(tmp_path):
+    # Preload: spool master'da oluşturulur, worker'lar fork ile devralır
+    spool = ContactSpool(str(tmp_path))
+    children = []
+    for worker in range(2):
+        ready_read, ready_write = os.pipe()
+        release_read, release_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(ready_read)
+                os.close(release_write)
+                spool.open()
+                for seq in range(1, 4):
+                    spool.append(seq, message(f"worker-{worker}-{seq}"))
+                os.write(ready_write, spool.path.encode())
+                os.read(release_read, 1)  # iki worker aynı anda çalışırken
+                code = 0
+            finally:
+                os._exit(code)  # çökmüş worker: close() yok, spool diskte kalır
+        os.close(ready_write)
+        os.close(release_read)
+        children.append((pid, ready_read, release_write))
+
+    paths = [os.read(ready_read, 4096).decode() for _, ready_read, _ in children]
+    # İkinci çocuk birincinin pipe uçlarını da miras aldı: önce hepsi kapatılır
+    for _, ready_read, release_write in children:
+        os.close(release_write)
+        os.close(ready_read)
+    assert [os.waitpid(pid, 0)[1] for pid, _, _ in children] == [0, 0]
+    assert len(set(paths)) == 2
+
+    # Ölen worker'ların ack'lenmemiş mesajlarının hepsi devralınır
+    recovered = ContactSpool(str(tmp_path))
+    entries = recovered.open()
+    recovered.close()
+    assert sorted(entry["subject"] for _, entry in entries) == sorted(
+        f"worker-{worker}-{seq}" for worker in range(2) for seq in range(1, 4)
+    )
@@ -0,0 +1,19 @@
+# backend/tests/test_metrics.py
+"""/metrics yalnızca METRICS_TOKEN veya admin token'ı ile okunur"""
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+def test_metrics_require_credentials():
+    assert client.get("/metrics").status_code in (401, 403)
+    assert client.get("/metrics", headers=bearer("yanlis-token")).status_code == 401
+
+def test_metrics_accept_scraper_token():
+    response = client.get("/metrics", headers=bearer("test-metrics-token"))
+    assert response.status_code == 200
+    assert "portfolio_http_request_duration_seconds" in response.text
@@ -0,0 +1,66 @@
+# backend/tests/test_query_budget.py
+"""Liste / detay / admin endpoint'lerinin cache miss'te çalıştırdığı SQL sayısı (N+1 gerilemeleri)"""
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from auth import create_user_token
+from cache import response_cache
+from database import SessionLocal, User, async_engine
+from diagnostics import track_queries
+
+# (path, admin, budget)
+BUDGETS = [
+    ("/api/posts", False, 1),
+    ("/api/posts?fields=summary&limit=5", False, 1),
+    ("/api/posts/1", False, 1),
+    ("/api/posts/slug/yazi-1", False, 1),
+    ("/api/projects", False, 1),
+    ("/api/projects/1", False, 1),
+    ("/api/tags", False, 1),
+    # Token doğrulaması principal cache'te değilse kullanıcı sorgusu eklenir
+    ("/api/admin/messages?limit=50", True, 2),
+    ("/api/admin/messages?is_read=false&limit=50", True, 2),
+    ("/api/admin/messages/count", True, 2),
+]
+
+def test_endpoints_stay_within_query_budget():
+    import main
+
+    async def scenario():
+        results = {}
+        try:
+            async with main.app.router.lifespan_context(main.app):
+                with SessionLocal() as db:
+                    admin = db.scalar(select(User).where(User.username == "admin"))
+                headers = {"Authorization": f"Bearer {create_user_token(admin)}"}
+                transport = httpx.ASGITransport(app=main.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    # N+1 dedektörünün eşiğini (5) aşacak kadar kayıt
+                    for i in range(1, 8):
+                        response = await client.post("/api/admin/posts", headers=headers, json={
+                            "title": f"Yazı {i}", "excerpt": "e", "content": "c", "category": "c",
+                            "tags": ["python", f"t{i}"], "read_time": "1 dk",
+                        })
+                        assert response.status_code == 200, response.text
+                        response = await client.post("/api/admin/projects", headers=headers, json={
+                            "name": f"Proje {i}", "description": "d", "technologies": ["FastAPI"], "github": "g",
+                        })
+                        assert response.status_code == 200, response.text
+                    for path, admin_only, budget in BUDGETS:
+                        # Cache'ten dönen yanıt sorgu çalıştırmaz; her ölçüm cache miss'tir
+                        response_cache.invalidate("all")
+                        with track_queries(path, budget=budget) as queries:
+                            response = await client.get(path, headers=headers if admin_only else None)
+                        assert response.status_code == 200, (path, response.text)
+                        results[path] = (queries.count, queries.flagged)
+        finally:
+            # aiosqlite thread'i başarısız testte süreci bekletmesin
+            await async_engine.dispose()
+        return results
+
+    for path, (count, flagged) in asyncio.run(scenario()).items():
+        assert count >= 1, path  # tanılama event'leri bağlı değilse ölçüm anlamsız
+        assert not flagged, (path, flagged)
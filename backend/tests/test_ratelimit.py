@@ -0,0 +1,23 @@
+# backend/tests/test_ratelimit.py
+"""admin-write limiti kimlik doğrulamadan sonra ve kullanıcı başına sayılır"""
+from fastapi.testclient import TestClient
+
+from main import app
+from ratelimit import MemoryRateLimitBackend, RATE_LIMIT_POLICIES, rate_limiter
+
+client = TestClient(app)
+
+def test_unauthenticated_admin_writes_do_not_use_the_budget(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+    monkeypatch.setattr(rate_limiter, "backend", MemoryRateLimitBackend())
+    monkeypatch.setitem(rate_limiter.allowed, "admin-write", 0)
+    monkeypatch.setitem(rate_limiter.limited, "admin-write", 0)
+    headers = {"Authorization": "Bearer gecersiz-token"}
+
+    for _ in range(RATE_LIMIT_POLICIES["admin-write"].limit + 5):
+        for path in ("/api/admin/posts", "/api/admin/posts/bulk", "/api/admin/projects/bulk"):
+            assert client.post(path, json={}, headers=headers).status_code == 401
+
+    assert rate_limiter.allowed["admin-write"] == 0
+    assert rate_limiter.limited["admin-write"] == 0
+    assert len(rate_limiter.backend) == 0
@@ -36,38 +36,20 @@ export default function AdminDashboard() {
 
   const fetchStats = async () => {
     try {
-      console.log('Fetching stats with token:', token);
-      
-      // Fetch posts, projects, and messages counts
-      const [postsRes, projectsRes, messagesRes] = await Promise.all([
-        fetch(`${API_BASE_URL}/api/posts`),
-        fetch(`${API_BASE_URL}/api/projects`),
-        fetch(`${API_BASE_URL}/api/admin/messages`, {
-          headers: { 
-            'Authorization': `Bearer ${token}`,
-            'Content-Type': 'application/json'
-          }
-        })
-      ]);
-
-      console.log('Response status:', {
-        posts: postsRes.status,
-        projects: projectsRes.status,
-        messages: messagesRes.status
+      // Tüm sayaçlar tek aggregate endpoint'ten gelir
+      const response = await fetch(`${API_BASE_URL}/api/admin/stats`, {
+        headers: { 
+          'Authorization': `Bearer ${token}`,
+          'Content-Type': 'application/json'
+        }
       });
-
-      const [posts, projects, messages] = await Promise.all([
-        postsRes.ok ? postsRes.json() : [],
-        projectsRes.ok ? projectsRes.json() : [],
-        messagesRes.ok ? messagesRes.json() : []
-      ]);
-
-      console.log('Fetched data:', { posts, projects, messages });
+      if (!response.ok) throw new Error(`Stats request failed: ${response.status}`);
+      const data = await response.json();
 
       setStats({
-        totalPosts: Array.isArray(posts) ? posts.length : 0,
-        totalProjects: Array.isArray(projects) ? projects.length : 0,
-        totalMessages: Array.isArray(messages) ? messages.length : 0
+        totalPosts: data.posts.total,
+        totalProjects: data.projects.total,
+        totalMessages: data.messages.total
       });
     } catch (error) {
       console.error('Stats fetch error:', error);
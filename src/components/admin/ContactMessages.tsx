@@ -23,6 +23,7 @@ interface ContactMessage {
   email: string;
   subject: string;
   message: string;
+  is_read: boolean;
   created_at: string;
 }
 
@@ -36,20 +37,38 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedMessage, setSelectedMessage] = useState<ContactMessage | null>(null);
   const [filter, setFilter] = useState<'all' | 'today' | 'week' | 'month'>('all');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [counts, setCounts] = useState({ total: 0, unread: 0 });
 
   useEffect(() => {
     fetchMessages();
   }, []);
 
-  const fetchMessages = async () => {
+  const fetchCounts = async () => {
+    const response = await fetch(`${API_BASE_URL}/api/admin/messages/count`, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    });
+    if (response.ok) {
+      setCounts(await response.json());
+    }
+  };
+
+  // Inbox sayfalı gelir; sonraki sayfa X-Next-Cursor ile istenir
+  const fetchMessages = async (cursor: string | null = null) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/admin/messages`, {
+      const params = new URLSearchParams({ limit: '50' });
+      if (cursor) params.set('cursor', cursor);
+      const response = await fetch(`${API_BASE_URL}/api/admin/messages?${params}`, {
         headers: {
           'Authorization': `Bearer ${token}`
         }
       });
       const data = await response.json();
-      setMessages(data);
+      setMessages(cursor ? [...messages, ...data] : data);
+      setNextCursor(response.headers.get('X-Next-Cursor'));
+      if (!cursor) fetchCounts();
     } catch (error) {
       console.error('Error fetching messages:', error);
     } finally {
@@ -57,11 +76,35 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
     }
   };
 
+  const bulkUpdate = async (ids: number[], action: 'read' | 'unread' | 'delete') => {
+    const response = await fetch(`${API_BASE_URL}/api/admin/messages/bulk`, {
+      method: 'POST',
+      headers: {
+        'Authorization': `Bearer ${token}`,
+        'Content-Type': 'application/json'
+      },
+      body: JSON.stringify({ ids, action })
+    });
+    if (!response.ok) throw new Error('Bulk update failed');
+    fetchCounts();
+  };
+
+  const openMessage = async (message: ContactMessage) => {
+    setSelectedMessage(message);
+    if (message.is_read) return;
+    try {
+      await bulkUpdate([message.id], 'read');
+      setMessages(messages.map(m => m.id === message.id ? { ...m, is_read: true } : m));
+    } catch (error) {
+      console.error('Error marking message as read:', error);
+    }
+  };
+
   const deleteMessage = async (id: number) => {
     if (!confirm('Bu mesajı silmek istediğinizden emin misiniz?')) return;
 
     try {
-      // Note: Delete endpoint doesn't exist yet, but we'll simulate it
+      await bulkUpdate([id], 'delete');
       setMessages(messages.filter(message => message.id !== id));
       alert('Mesaj silindi!');
     } catch (error) {
@@ -148,7 +191,7 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
           <p className="text-gray-400">Gelen mesajları görüntüleyin ve yönetin</p>
         </div>
         <motion.button
-          onClick={fetchMessages}
+          onClick={() => fetchMessages()}
           whileHover={{ scale: 1.05 }}
           whileTap={{ scale: 0.95 }}
           className="flex items-center space-x-2 px-4 py-2 bg-red-600 text-white rounded-lg hover:bg-red-700 transition-all"
@@ -188,7 +231,8 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-gray-400 text-sm">Toplam Mesaj</p>
-              <p className="text-2xl font-bold text-white">{messages.length}</p>
+              <p className="text-2xl font-bold text-white">{counts.total}</p>
+              <p className="text-gray-400 text-xs">{counts.unread} okunmamış</p>
             </div>
             <div className="p-2 bg-red-500/20 rounded-lg">
               <MessageCircle className="w-5 h-5 text-red-400" />
@@ -276,6 +320,9 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
                       <div className="flex items-center space-x-2">
                         <User className="w-4 h-4 text-gray-400" />
                         <span className="text-white font-medium">{message.name}</span>
+                        {!message.is_read && (
+                          <span className="w-2 h-2 rounded-full bg-red-400" title="Okunmamış" />
+                        )}
                       </div>
                       <div className="flex items-center space-x-2">
                         <Mail className="w-4 h-4 text-gray-400" />
@@ -296,7 +343,7 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
                     {/* Actions */}
                     <div className="flex items-center space-x-4">
                       <motion.button
-                        onClick={() => setSelectedMessage(message)}
+                        onClick={() => openMessage(message)}
                         whileHover={{ scale: 1.05 }}
                         className="flex items-center space-x-2 px-3 py-1 bg-red-600/20 text-red-300 rounded border border-red-500/30 hover:bg-red-600/30 transition-all"
                       >
@@ -316,6 +363,16 @@ export default function ContactMessages({ token }: ContactMessagesProps) {
                 </div>
               </motion.div>
             ))}
+            {nextCursor && (
+              <div className="text-center">
+                <button
+                  onClick={() => fetchMessages(nextCursor)}
+                  className="px-4 py-2 bg-gray-800/50 border border-gray-700 text-gray-300 rounded-lg hover:border-red-400/50 transition-all"
+                >
+                  Daha fazla yükle
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>